@@ -0,0 +1,131 @@
+"""Compare ways of returning 1,000 exams from a list endpoint.
+
+- default: the endpoint returns the models with response_model=List[ExamResponse] and no
+  response class, which is how the list endpoints are written. Recent FastAPI versions
+  serialize this straight to JSON bytes with Pydantic.
+- JSONResponse: the same endpoint with response_class=JSONResponse, which goes through
+  jsonable_encoder and json.dumps instead.
+- orjson: the models are dumped and encoded with orjson into a Response, skipping
+  response_model (only measured when orjson is installed).
+
+Every variant is called through the ASGI app, so routing and response handling are
+included and only the serialization differs. This is why the list endpoints keep the
+default path: on FastAPI 0.143 it beats both alternatives.
+
+Usage (from backend/fastapi):
+    python benchmarks/bench_list_responses.py [--exams 1000] [--repeat 200]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import date, time as clock
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse, Response  # noqa: E402
+
+from models.DTOs.exam_dto import ExamResponse  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def build_exams(count: int) -> List[ExamResponse]:
+    return [
+        ExamResponse.model_validate({
+            "id": index, "subjectId": index % 400, "subjectName": f"Subject {index % 400}",
+            "subjectShortName": f"S{index % 400}", "teacherId": 1000 + index % 150,
+            "teacherName": f"Teacher {index % 150}", "teacherEmail": f"teacher{index % 150}@usv.ro",
+            "teacherPhone": None, "roomIds": [index % 60, (index + 1) % 60],
+            "roomNames": [f"C{index % 60}", f"C{(index + 1) % 60}"],
+            "date": date(2030, 1, 1 + index % 28), "startTime": clock(8 + index % 10), "endTime": clock(10 + index % 10),
+            "duration": 2, "status": "approved", "message": None, "notes": None,
+            "groupId": index % 200, "groupName": f"31{index % 200:02d}", "specializationShortName": "C",
+            "studyYear": 1 + index % 4
+        })
+        for index in range(count)
+    ]
+
+
+def build_app(exams: List[ExamResponse]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[ExamResponse])
+    async def default():
+        return exams
+
+    @app.get("/json-response", response_model=List[ExamResponse], response_class=JSONResponse)
+    async def json_response():
+        return exams
+
+    @app.get("/orjson", response_model=List[ExamResponse])
+    async def orjson_response():
+        return Response(orjson.dumps([exam.model_dump() for exam in exams]), media_type="application/json")
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> bytes:
+    """Run one GET request through the ASGI app and return the response body."""
+    body = []
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": ("bench", 1), "server": ("bench", 80)
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def measure(app: FastAPI, path: str, repeat: int) -> List[float]:
+    for _ in range(5):
+        await call(app, path)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call(app, path)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def main(count: int, repeat: int) -> None:
+    app = build_app(build_exams(count))
+    variants = [("response_model (default)", "/default"), ("response_model + JSONResponse", "/json-response")]
+    if orjson is not None:
+        variants.append(("model_dump + orjson", "/orjson"))
+
+    expected = json.loads(await call(app, "/default"))
+    for _, path in variants[1:]:
+        if json.loads(await call(app, path)) != expected:
+            raise SystemExit(f"{path} produced different JSON")
+
+    print(f"{count} ExamResponse models, median of {repeat} requests")
+    baseline = None
+    for name, path in variants:
+        median = statistics.median(await measure(app, path, repeat))
+        baseline = baseline or median
+        print(f"  {name:<30}: {median:8.2f} ms ({median / baseline:.2f}x the default)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exams", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=200)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.exams, arguments.repeat))
@@ -37,6 +37,7 @@ from services.config_service import ConfigService
 from services.excel_service import ExcelService
 from services.exam_service import ExamService
 from services.email_service import EmailService
+from services.room_occupancy_index import RoomOccupancyIndex
 
 # Service interface imports
 from services.abstract.user_service_interface import IUserService
@@ -53,7 +54,7 @@ from services.abstract.excel_service_interface import IExcelService
 from services.abstract.exam_service_interface import IExamService
 from services.abstract.email_service_interface import IEmailService
 
-from config.database_provider import get_db_session
+from config.database_provider import get_request_session
 
 
 class Container(containers.DeclarativeContainer):
@@ -64,57 +65,62 @@ class Container(containers.DeclarativeContainer):
         packages=["controllers"]
     )
     
-    # Database - use Resource to properly handle async generator
-    db = providers.Resource(
-        get_db_session
+    # Database - the session of the current request, opened by DatabaseSessionMiddleware
+    db = providers.Factory(
+        get_request_session
     )
     
-    # Repositories
-    user_repository = providers.Singleton(
+    # Repositories - built per request so each one uses that request's session
+    user_repository = providers.Factory(
         UserRepository,
         db=db
     )
     
-    group_repository = providers.Singleton(
+    group_repository = providers.Factory(
         GroupRepository,
         db=db
     )
     
-    subject_repository = providers.Singleton(
+    subject_repository = providers.Factory(
         SubjectRepository,
         db=db
     )
     
-    room_repository = providers.Singleton(
+    room_repository = providers.Factory(
         RoomRepository,
         db=db
     )
     
-    schedule_repository = providers.Singleton(
+    schedule_repository = providers.Factory(
         ScheduleRepository,
         db=db
     )
     
-    notification_repository = providers.Singleton(
+    notification_repository = providers.Factory(
         NotificationRepository,
         db=db
     )
     
-    excel_template_repository = providers.Singleton(
+    excel_template_repository = providers.Factory(
         ExcelTemplateRepository,
         db=db
     )
     
-    config_repository = providers.Singleton(
+    config_repository = providers.Factory(
         ConfigRepository,
         db=db
     )
 
-    exam_repository = providers.Singleton(
+    exam_repository = providers.Factory(
         ExamRepository,
         db=db
     )
     
+    # In-process room occupancy index shared by all requests
+    room_occupancy_index = providers.Singleton(
+        RoomOccupancyIndex
+    )
+    
     # Services
     user_service = providers.Factory(
         UserService,
@@ -151,7 +157,8 @@ class Container(containers.DeclarativeContainer):
         user_repository=user_repository,
         room_repository=room_repository,
         group_repository=group_repository,
-        email_service=email_service
+        email_service=email_service,
+        occupancy_index=room_occupancy_index
     )
     
     notification_service = providers.Factory(
@@ -188,7 +195,8 @@ class Container(containers.DeclarativeContainer):
         email_service=email_service,
         notification_service=notification_service,
         user_service=user_service,
-        exam_repository=exam_repository
+        exam_repository=exam_repository,
+        occupancy_index=room_occupancy_index
     )
     
     excel_service = providers.Factory(
@@ -206,5 +214,6 @@ class Container(containers.DeclarativeContainer):
         user_service=user_service,
         subject_service=subject_service,
         config_service=config_service,
-        room_service=room_service
+        room_service=room_service,
+        occupancy_index=room_occupancy_index
     )
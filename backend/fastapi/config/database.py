@@ -1,12 +1,16 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.sql import Select
 from sqlalchemy.future import Engine
 import os
 import asyncio
 import logging
 from dotenv import load_dotenv
 
+from config.settings import get_settings
+from config.pool_metrics import InstrumentedAsyncQueuePool, pool_metrics, pool_state
+
 logger = logging.getLogger(__name__)
 
 load_dotenv()
@@ -21,15 +25,72 @@ POSTGRES_DB = os.getenv("POSTGRES_DB", "twaaos")
 # Update the URL to use async driver
 SQLALCHEMY_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_SERVER}:{POSTGRES_PORT}/{POSTGRES_DB}"
 
-engine = create_async_engine(
-    SQLALCHEMY_DATABASE_URL, 
+settings = get_settings()
+
+# asyncpg connection options: its own statement cache and the server-side statement timeout
+connect_args = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+engine_options = dict(
     echo=False,  # Disable SQL statement logging
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=connect_args,
     future=True
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=AsyncSession)
+engine = create_async_engine(
+    # SQLAlchemy keeps a separate prepared statement cache per connection, sized from the URL
+    f"{SQLALCHEMY_DATABASE_URL}?prepared_statement_cache_size={settings.DB_STATEMENT_CACHE_SIZE}",
+    poolclass=InstrumentedAsyncQueuePool,
+    **engine_options
+)
+
+# Optional read replica; without POSTGRES_REPLICA_SERVER everything goes to the primary
+POSTGRES_REPLICA_SERVER = os.getenv("POSTGRES_REPLICA_SERVER")
+POSTGRES_REPLICA_PORT = os.getenv("POSTGRES_REPLICA_PORT", POSTGRES_PORT)
+replica_engine = None
+if POSTGRES_REPLICA_SERVER:
+    replica_engine = create_async_engine(
+        f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_REPLICA_SERVER}:{POSTGRES_REPLICA_PORT}/{POSTGRES_DB}"
+        f"?prepared_statement_cache_size={settings.DB_STATEMENT_CACHE_SIZE}",
+        **engine_options
+    )
+    logger.info(f"Routing read-only queries to replica {POSTGRES_REPLICA_SERVER}:{POSTGRES_REPLICA_PORT}")
+
+
+class RoutingSession(Session):
+    """Session that sends plain SELECTs to the read replica and everything else to the primary.
+    
+    Once a session has flushed or executed a write it stays on the primary, so a request
+    always reads its own writes. SELECT ... FOR UPDATE also goes to the primary, and so
+    does every query of a session whose info["wrote"] is set up front, which is how
+    session_scope() keeps the reads of mutating requests off the replica.
+    """
+    
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or not isinstance(clause, Select) or clause._for_update_arg is not None:
+            self.info["wrote"] = True
+        if replica_engine is None or self.info.get("wrote"):
+            return engine.sync_engine
+        return replica_engine.sync_engine
+
+
+def get_pool_metrics() -> dict:
+    """Get the current connection pool state and usage counters"""
+    metrics = pool_metrics.snapshot(engine.pool)
+    if replica_engine is not None:
+        metrics["replica"] = pool_state(replica_engine.pool)
+    return metrics
+
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, class_=AsyncSession,
+    **({"sync_session_class": RoutingSession} if replica_engine is not None else {})
+)
 Base = declarative_base()
 
 # Async dependency to get DB session with improved transaction management
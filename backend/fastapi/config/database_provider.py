@@ -1,22 +1,92 @@
-from typing import AsyncGenerator
-import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional
+import logging
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from config.database import SessionLocal
 
+logger = logging.getLogger(__name__)
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Provide an async database session.
-    
-    This function is used by the dependency injector to provide a database session
-    to the repositories. It properly handles closing the async session.
-    
-    Returns:
-        AsyncSession: An async database session
+# Holder of the session of the current request (or other unit of work). The holder is
+# created when the scope opens and the session inside it only on first use, so requests
+# that never touch the database never check out a connection.
+_session_holder: ContextVar[Optional[Dict[str, Any]]] = ContextVar("db_session_holder", default=None)
+
+# HTTP methods that only read; every other request runs its whole unit of work on the primary
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+@asynccontextmanager
+async def session_scope(read_only: bool = False) -> AsyncIterator[None]:
+    """Open a unit of work with its own database session.
+
+    Every repository resolved inside the scope shares one AsyncSession, and different
+    scopes (concurrent requests) get different sessions, so they run in parallel on
+    separate pooled connections. The scope never commits: repositories commit their own
+    writes, and anything left uncommitted is rolled back when the session is closed at
+    the end of the scope.
+
+    Args:
+        read_only: Allow the reads of the scope to go to the read replica until its first
+            write. Scopes that may write keep every query, including the reads made
+            before the first write, on the primary.
     """
-    db = SessionLocal()
+    holder: Dict[str, Any] = {"read_only": read_only}
+    token = _session_holder.set(holder)
     try:
-        yield db
+        yield
+    except Exception:
+        session = holder.get("session")
+        if session is not None:
+            await session.rollback()
+        raise
     finally:
-        # Properly await the close coroutine
-        await db.close()
+        session = holder.pop("session", None)
+        if session is not None:
+            await session.close()
+        _session_holder.reset(token)
+
+
+def get_request_session() -> AsyncSession:
+    """Get the database session of the current unit of work.
+
+    This function is used by the dependency injector to provide a database session
+    to the repositories.
+
+    Returns:
+        AsyncSession: The session bound to the current request
+
+    Raises:
+        RuntimeError: If called outside of session_scope()
+    """
+    holder = _session_holder.get()
+    if holder is None:
+        raise RuntimeError("No database session scope is active; wrap the work in session_scope()")
+    session = holder.get("session")
+    if session is None:
+        session = SessionLocal()
+        if not holder["read_only"]:
+            # Pins the whole unit of work to the primary (see RoutingSession)
+            session.info["wrote"] = True
+        holder["session"] = session
+    return session
+
+
+class DatabaseSessionMiddleware:
+    """ASGI middleware that runs every HTTP request in its own session_scope().
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware so background tasks, which
+    run inside the response, still see the request's session.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        async with session_scope(read_only=scope["method"] in READ_ONLY_METHODS):
+            await self.app(scope, receive, send)
@@ -0,0 +1,79 @@
+from threading import Lock
+from time import perf_counter
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+def pool_state(pool: Any) -> Dict[str, Any]:
+    """Current size and usage of a connection pool"""
+    return {
+        "poolSize": pool.size(),
+        "checkedIn": pool.checkedin(),
+        "checkedOut": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0)
+    }
+
+
+class PoolMetrics:
+    """Counters describing how the database connection pool is used.
+
+    Wait times cover the whole checkout, i.e. waiting for a free connection plus
+    opening a new one when the pool is allowed to grow.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+
+    def record_checkout(self, wait: float, checked_out: int, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+            self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool: Any) -> Dict[str, Any]:
+        """Current pool state together with the counters collected so far"""
+        with self._lock:
+            return {
+                **pool_state(pool),
+                "peakCheckedOut": self.peak_checked_out,
+                "peakOverflow": self.peak_overflow,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avgWaitMs": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "maxWaitMs": round(self.max_wait * 1000, 3)
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times and peaks in pool_metrics"""
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        pool_metrics.record_checkout(perf_counter() - start, self.checkedout(), max(self.overflow(), 0))
+        return connection
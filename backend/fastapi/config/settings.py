@@ -1,5 +1,6 @@
 import os
 from functools import lru_cache
+from typing import List
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from pathlib import Path
@@ -23,6 +24,30 @@ class Settings(BaseModel):
     
     # Flask Service URL
     FLASK_SERVICE_URL: str = os.getenv("FLASK_SERVICE_URL", "http://flask:5000")
+    
+    # Database connection pool
+    # Defaults match SQLAlchemy's own (5 + 10 overflow); raise them per deployment
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 30))  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 3600))  # Seconds before a connection is replaced
+    # Pre-ping costs one round-trip per checkout; with a short recycle time it can be turned off
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    # Prepared statements cached per connection; set to 0 behind pgbouncer in transaction mode
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+    # Server-side statement_timeout in milliseconds, 0 disables it
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", 0))
+
+    # Comma-separated emails of users an incremental sync never deactivates (the test
+    # accounts that do not exist in the USV data)
+    SYNC_PROTECTED_EMAILS: List[str] = [
+        email.strip().lower()
+        for email in os.getenv(
+            "SYNC_PROTECTED_EMAILS",
+            "niculai.crainiciuc@student.usv.ro,filaret.crainiciuc@student.usv.ro,c.filaret200@gmail.com,admin@usv.ro"
+        ).split(",")
+        if email.strip()
+    ]
 
     # Note: With BaseModel instead of BaseSettings, env_file loading is not automatic
     # We'll use os.getenv directly instead for environment variables
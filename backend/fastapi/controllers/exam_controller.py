@@ -1,29 +1,56 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Response
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Response, Query
 from dependency_injector.wiring import inject, Provide
 from typing import List, Dict, Any
 
-from models.DTOs.exam_dto import ExamResponse, ExamUpdateRequest, ExamProposalRequest
+from models.DTOs.exam_dto import ExamResponse, ExamUpdateRequest, ExamProposalRequest, ExamAutoScheduleRequest, ExamAutoScheduleResponse
 from services.abstract.exam_service_interface import IExamService
 from config.containers import Container
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from controllers.json_stream import streaming_json_response
 
 router = APIRouter(prefix="/exams", tags=["Exams"])
 
 @router.get("", response_model=List[ExamResponse], summary="Get all exams", description="Returns a list of all exams with detailed information")
 @inject
 async def get_all_exams(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; every exam is returned if omitted"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    sortBy: str = Query("id", description="Sort key: id or date"),
+    stream: bool = Query(False, description="Stream the full list as it is read from the database; limit and after are ignored"),
     service: IExamService = Depends(Provide[Container.exam_service])
 ):
     """Get all exams with associated information.
     
+    With stream the full list is written to the client while it is read through a
+    server-side cursor, keeping memory flat for large exports. Without limit and after
+    the full list is returned. Otherwise one keyset page is returned and the cursor of
+    the next page, if any, is sent in the X-Next-Cursor header.
+    
+    Args:
+        limit (Optional[int]): Page size
+        after (Optional[str]): Cursor of the previous page
+        sortBy (str): Sort key
+        stream (bool): Stream the response instead of building it in memory
+    
     Returns:
         List[ExamResponse]: List of exams with subject, teacher and group details
     """
     print("[DEBUG] ExamController - get_all_exams: Request received")
+    if stream:
+        return streaming_json_response(service.stream_exams())
     try:
-        exams = await service.get_all_exams()
+        if limit is None and after is None:
+            exams = await service.get_all_exams()
+        else:
+            exams, next_cursor = await service.get_exams_page(limit or DEFAULT_PAGE_SIZE, after, sortBy)
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
         print(f"[DEBUG] ExamController - Returning {len(exams)} exams")
         return exams
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         print(f"[DEBUG] ExamController - Error: {str(e)}")
         raise HTTPException(
@@ -158,73 +185,36 @@ async def update_exam(
 @inject
 async def get_teacher_dashboard_data(
     teacher_id: int,
+    includeExams: bool = Query(True, description="Include the exam lists grouped by status"),
+    examsLimit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of exams in each list"),
     service: IExamService = Depends(Provide[Container.exam_service])
 ):
     """Get dashboard data for a teacher including exams by status and various stats.
     
+    The stats and the next exam are aggregated in the database and count every exam;
+    each exam list holds at most examsLimit exams, earliest first. Pass
+    includeExams=false to skip the lists.
+    
     Args:
         teacher_id (int): ID of the teacher
+        includeExams (bool): Whether to include the exam lists grouped by status
+        examsLimit (int): Maximum number of exams in each list
         
     Returns:
         Dict: Dashboard data including:
             - scheduledExams: List of approved exams
             - pendingExams: List of pending exams (no proposal yet)
             - pendingProposals: List of exams with 'proposed' status
+            - rejectedExams: List of rejected exams
             - nextExam: The next upcoming exam if any
             - stats: Various statistics (total subjects, exams by status)
     """
     print(f"[DEBUG] ExamController - get_teacher_dashboard_data for teacher: {teacher_id}")
     try:
-        # Get all exams for this teacher
-        exams = await service.get_exams_by_teacher_id(teacher_id)
-        print(f"[DEBUG] ExamController - Retrieved {len(exams)} exams for teacher {teacher_id}")
-        
-        # Categorize exams by status
-        scheduled_exams = [exam for exam in exams if exam.status.lower() == 'approved']
-        pending_exams = [exam for exam in exams if exam.status.lower() == 'pending']
-        pending_proposals = [exam for exam in exams if exam.status.lower() == 'proposed']
-        rejected_exams = [exam for exam in exams if exam.status.lower() == 'rejected']
-        
-        # Basic stats
-        total_subjects = len({exam.subjectId for exam in exams})
-        
-        # Find next exam (first upcoming approved exam)
-        from datetime import datetime
-        today = datetime.now().date()
-        
-        upcoming_exams = []
-        next_exam = None
+        dashboard = await service.get_teacher_dashboard(teacher_id, include_exams=includeExams, exams_limit=examsLimit)
         
-        for exam in scheduled_exams:
-            exam_date = datetime.fromisoformat(exam.date.replace('Z', '+00:00')) if isinstance(exam.date, str) else exam.date
-            if exam_date.date() >= today:
-                upcoming_exams.append(exam)
-        
-        # Sort by date
-        upcoming_exams.sort(key=lambda x: x.date if isinstance(x.date, str) else x.date.isoformat())
-        
-        if upcoming_exams:
-            next_exam = upcoming_exams[0]
-        
-        print(f"[DEBUG] ExamController - Returning dashboard data for teacher {teacher_id} with "
-              f"{len(scheduled_exams)} scheduled exams, {len(pending_exams)} pending exams, "
-              f"{len(pending_proposals)} pending proposals, and {len(rejected_exams)} rejected exams")
-              
-        # Return aggregated dashboard data
-        return {
-            "scheduledExams": scheduled_exams,
-            "pendingExams": pending_exams,
-            "pendingProposals": pending_proposals,
-            "rejectedExams": rejected_exams,
-            "nextExam": next_exam,
-            "stats": {
-                "totalSubjects": total_subjects,
-                "scheduledExams": len(scheduled_exams),
-                "pendingExams": len(pending_exams),
-                "pendingProposals": len(pending_proposals),
-                "rejectedExams": len(rejected_exams)
-            }
-        }
+        print(f"[DEBUG] ExamController - Returning dashboard data for teacher {teacher_id}: {dashboard['stats']}")
+        return dashboard
     except Exception as e:
         print(f"[DEBUG] ExamController - Error: {str(e)}")
         raise HTTPException(
@@ -278,6 +268,47 @@ async def propose_exam_date(
             detail=f"Error creating exam proposal: {str(e)}"
         )
 
+@router.post("/auto-schedule", response_model=ExamAutoScheduleResponse, summary="Automatically schedule pending exams", description="Assigns a date, time slot and rooms to every pending exam of the current exam period and saves them as proposed")
+@inject
+async def auto_schedule_exams(
+    request: ExamAutoScheduleRequest = Body(..., description="Time slot layout and constraints"),
+    service: IExamService = Depends(Provide[Container.exam_service])
+):
+    """Automatically schedule the pending exams of the current exam period.
+    
+    Exams are placed so that no group has overlapping exams, no teacher or assistant
+    is booked twice and the rooms seat the group. With dryRun set the timetable is
+    only returned and nothing is saved.
+    
+    Args:
+        request (ExamAutoScheduleRequest): Time slot layout and constraints
+        
+    Returns:
+        ExamAutoScheduleResponse: The assignments made and the exams that could not be placed
+        
+    Raises:
+        HTTPException: If no exam period is configured or scheduling fails
+    """
+    print(f"[DEBUG] ExamController - auto_schedule_exams: dryRun={request.dryRun}")
+    
+    try:
+        result = await service.auto_schedule_exams(request)
+        print(f"[DEBUG] ExamController - Scheduled {len(result.assignments)} exams, {len(result.unscheduled)} unscheduled")
+        return result
+        
+    except ValueError as e:
+        print(f"[DEBUG] ExamController - Value error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        print(f"[DEBUG] ExamController - Error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error scheduling exams: {str(e)}"
+        )
+
 @router.get("/export/pdf", summary="Export exams to PDF", description="Export the list of all exams in PDF format")
 @inject
 async def export_exams_to_pdf(
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Dict
+from fastapi import APIRouter, Depends, HTTPException, status, Body
+from typing import List, Dict, Any
 from dependency_injector.wiring import inject, Provide
 
 from models.DTOs.group_dto import GroupCreate, GroupUpdate, GroupResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 from services.abstract.group_service_interface import IGroupService
 from config.containers import Container
 
@@ -85,6 +86,58 @@ async def get_group_by_name(
         )
     return group
 
+@router.post("/bulk", response_model=BulkCreateResponse, summary="Create groups in bulk", description="Validate many groups and insert the valid ones in a single transaction. Invalid rows are reported by index instead of failing the request")
+@inject
+async def create_groups_bulk(
+    rows: List[Dict[str, Any]] = Body(..., description="Groups in the GroupCreate format"),
+    service: IGroupService = Depends(Provide[Container.group_service])
+):
+    """Create many groups at once.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The groups to create
+        
+    Returns:
+        BulkCreateResponse: The ID or the error of every row, by position in the request
+        
+    Raises:
+        HTTPException: If the request has too many rows
+    """
+    try:
+        return await service.create_groups_bulk(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.post("/sync", response_model=SyncDiffResponse, summary="Sync groups from a snapshot", description="Compare a full snapshot of the groups with the stored ones by natural key and write only the inserts, updates and deactivations")
+@inject
+async def sync_groups_snapshot(
+    rows: List[Dict[str, Any]] = Body(..., description="Every group in the GroupCreate format"),
+    service: IGroupService = Depends(Provide[Container.group_service])
+):
+    """Apply a group snapshot incrementally.
+    
+    Matched rows keep their IDs and groups missing from it are deactivated instead of being deleted.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The snapshot
+        
+    Returns:
+        SyncDiffResponse: What happened to every row, by position in the request
+        
+    Raises:
+        HTTPException: If the snapshot has too many rows
+    """
+    try:
+        return await service.sync_groups_snapshot(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @router.post("", response_model=GroupResponse, status_code=status.HTTP_201_CREATED, summary="Create new group", description="Create a new group in the system")
 @inject
 async def create_group(
@@ -0,0 +1,42 @@
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+# Bytes buffered before a chunk is written to the client
+FLUSH_SIZE = 64 * 1024
+
+
+async def json_array_stream(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """Serialize models one by one as the elements of a JSON array.
+
+    Args:
+        items: Models to serialize, typically read from a server-side cursor
+
+    Yields:
+        bytes: Chunks of the JSON document
+    """
+    buffer = bytearray(b"[")
+    first = True
+    async for item in items:
+        if not first:
+            buffer += b","
+        buffer += item.model_dump_json().encode()
+        first = False
+        if len(buffer) >= FLUSH_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+def streaming_json_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+    """Build a response that writes a JSON array while the models are produced.
+
+    Args:
+        items: Models to send
+
+    Returns:
+        StreamingResponse: The streamed JSON array
+    """
+    return StreamingResponse(json_array_stream(items), media_type="application/json")
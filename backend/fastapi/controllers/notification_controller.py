@@ -1,24 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from typing import List, Optional
 from dependency_injector.wiring import inject, Provide
 
 from models.DTOs.notification_dto import NotificationCreate, NotificationUpdate, NotificationResponse
 from services.abstract.notification_service_interface import INotificationService
 from config.containers import Container
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from controllers.json_stream import streaming_json_response
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
 @router.get("", response_model=List[NotificationResponse], summary="Get all notifications", description="Retrieve a list of all notifications in the system")
 @inject
 async def get_all_notifications(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; every notification is returned if omitted"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    sortBy: str = Query("id", description="Sort key: id or dateSent"),
+    stream: bool = Query(False, description="Stream the full list as it is read from the database; limit and after are ignored"),
     service: INotificationService = Depends(Provide[Container.notification_service])
 ):
     """Get all notifications endpoint.
     
+    With stream the full list is written to the client while it is read through a
+    server-side cursor, keeping memory flat for large exports. Without limit and after
+    the full list is returned. Otherwise one keyset page is returned and the cursor of
+    the next page, if any, is sent in the X-Next-Cursor header.
+    
+    Args:
+        limit (Optional[int]): Page size
+        after (Optional[str]): Cursor of the previous page
+        sortBy (str): Sort key
+        stream (bool): Stream the response instead of building it in memory
+    
     Returns:
-        List[NotificationResponse]: A list of all notifications
+        List[NotificationResponse]: A list of all notifications, or one page of them
+        
+    Raises:
+        HTTPException: If the sort key or cursor is invalid
     """
-    return await service.get_all_notifications()
+    if stream:
+        return streaming_json_response(service.stream_notifications())
+    if limit is None and after is None:
+        return await service.get_all_notifications()
+    try:
+        notifications, next_cursor = await service.get_notifications_page(limit or DEFAULT_PAGE_SIZE, after, sortBy)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return notifications
 
 @router.get("/{notification_id}", response_model=NotificationResponse, summary="Get notification by ID", description="Retrieve a specific notification by its ID")
 @inject
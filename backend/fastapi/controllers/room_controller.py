@@ -1,10 +1,13 @@
-from typing import List, Dict
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Dict, Optional, Any
+from datetime import date, time
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, Body
 from dependency_injector.wiring import inject, Provide
 
 from models.DTOs.room_dto import RoomCreate, RoomUpdate, RoomResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 from services.abstract.room_service_interface import IRoomService
 from config.containers import Container
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/rooms", tags=["rooms"])
 
@@ -24,14 +27,72 @@ async def get_room_count(
 @router.get("", response_model=List[RoomResponse], summary="Get all rooms", description="Retrieve a list of all rooms in the system")
 @inject
 async def get_all_rooms(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; every room is returned if omitted"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    sortBy: str = Query("id", description="Sort key: id, name or capacity"),
     service: IRoomService = Depends(Provide[Container.room_service])
 ):
     """Get all rooms endpoint.
     
+    Without limit and after the full list is returned. Otherwise one keyset page is
+    returned and the cursor of the next page, if any, is sent in the X-Next-Cursor header.
+    
+    Args:
+        limit (Optional[int]): Page size
+        after (Optional[str]): Cursor of the previous page
+        sortBy (str): Sort key
+    
     Returns:
-        List[RoomResponse]: A list of all rooms
+        List[RoomResponse]: A list of all rooms, or one page of them
+        
+    Raises:
+        HTTPException: If the sort key or cursor is invalid
     """
-    return await service.get_all_rooms()
+    if limit is None and after is None:
+        return await service.get_all_rooms()
+    try:
+        rooms, next_cursor = await service.get_rooms_page(limit or DEFAULT_PAGE_SIZE, after, sortBy)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return rooms
+
+@router.get("/free", response_model=List[RoomResponse], summary="Find free rooms", description="Retrieve the rooms that have no approved exam in a time window and meet the capacity and computer requirements")
+@inject
+async def get_free_rooms(
+    date: date,
+    startTime: time,
+    endTime: time,
+    minCapacity: int = Query(0, ge=0, description="Minimum room capacity"),
+    minComputers: int = Query(0, ge=0, description="Minimum number of computers"),
+    buildingName: Optional[str] = Query(None, description="Restrict the search to one building"),
+    service: IRoomService = Depends(Provide[Container.room_service])
+):
+    """Find the rooms that are free for an exam.
+    
+    Args:
+        date (date): The exam date
+        startTime (time): Start of the exam
+        endTime (time): End of the exam
+        minCapacity (int): Minimum room capacity
+        minComputers (int): Minimum number of computers
+        buildingName (Optional[str]): Restrict the search to one building
+        
+    Returns:
+        List[RoomResponse]: Free rooms ordered by capacity, smallest first
+        
+    Raises:
+        HTTPException: If the time window is invalid
+    """
+    try:
+        return await service.get_free_rooms(date, startTime, endTime, minCapacity, minComputers, buildingName)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 @router.get("/{room_id}", response_model=RoomResponse, summary="Get room by ID", description="Retrieve a specific room by its ID")
 @inject
@@ -74,6 +135,58 @@ async def get_rooms_by_building(
     """
     return await service.get_rooms_by_building(building_name)
 
+@router.post("/bulk", response_model=BulkCreateResponse, summary="Create rooms in bulk", description="Validate many rooms and insert the valid ones in a single transaction. Invalid rows are reported by index instead of failing the request")
+@inject
+async def create_rooms_bulk(
+    rows: List[Dict[str, Any]] = Body(..., description="Rooms in the RoomCreate format"),
+    service: IRoomService = Depends(Provide[Container.room_service])
+):
+    """Create many rooms at once.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The rooms to create
+        
+    Returns:
+        BulkCreateResponse: The ID or the error of every row, by position in the request
+        
+    Raises:
+        HTTPException: If the request has too many rows
+    """
+    try:
+        return await service.create_rooms_bulk(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.post("/sync", response_model=SyncDiffResponse, summary="Sync rooms from a snapshot", description="Compare a full snapshot of the rooms with the stored ones by natural key and write only the inserts, updates and deactivations")
+@inject
+async def sync_rooms_snapshot(
+    rows: List[Dict[str, Any]] = Body(..., description="Every room in the RoomCreate format"),
+    service: IRoomService = Depends(Provide[Container.room_service])
+):
+    """Apply a room snapshot incrementally.
+    
+    Matched rows keep their IDs and rooms missing from it are deactivated instead of being deleted.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The snapshot
+        
+    Returns:
+        SyncDiffResponse: What happened to every row, by position in the request
+        
+    Raises:
+        HTTPException: If the snapshot has too many rows
+    """
+    try:
+        return await service.sync_rooms_snapshot(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @router.post("", response_model=RoomResponse, status_code=status.HTTP_201_CREATED, summary="Create room", description="Create a new room record")
 @inject
 async def create_room(
@@ -1,27 +1,61 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Response
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import date
 from dependency_injector.wiring import inject, Provide
 
-from models.DTOs.schedule_dto import ScheduleCreate, ScheduleUpdate, ScheduleResponse
+from models.DTOs.schedule_dto import (
+    ScheduleCreate, ScheduleUpdate, ScheduleResponse,
+    ScheduleBulkStatusUpdate, ScheduleBulkStatusResponse
+)
 from models.DTOs.user_dto import UserResponse
 from services.abstract.schedule_service_interface import IScheduleService
 from config.containers import Container
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from controllers.json_stream import streaming_json_response
 
 router = APIRouter(prefix="/schedules", tags=["schedules"])
 
 @router.get("", response_model=List[ScheduleResponse], summary="Get all schedules", description="Retrieve a list of all schedules in the system")
 @inject
 async def get_all_schedules(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; every schedule is returned if omitted"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    sortBy: str = Query("id", description="Sort key: id or date"),
+    stream: bool = Query(False, description="Stream the full list as it is read from the database; limit and after are ignored"),
     service: IScheduleService = Depends(Provide[Container.schedule_service])
 ):
     """Get all schedules endpoint.
     
+    With stream the full list is written to the client while it is read through a
+    server-side cursor, keeping memory flat for large exports. Without limit and after
+    the full list is returned. Otherwise one keyset page is returned and the cursor of
+    the next page, if any, is sent in the X-Next-Cursor header.
+    
+    Args:
+        limit (Optional[int]): Page size
+        after (Optional[str]): Cursor of the previous page
+        sortBy (str): Sort key
+        stream (bool): Stream the response instead of building it in memory
+    
     Returns:
-        List[ScheduleResponse]: A list of all schedules
+        List[ScheduleResponse]: A list of all schedules, or one page of them
+        
+    Raises:
+        HTTPException: If the sort key or cursor is invalid
     """
-    return await service.get_all_schedules()
+    if stream:
+        return streaming_json_response(service.stream_schedules())
+    if limit is None and after is None:
+        return await service.get_all_schedules()
+    try:
+        schedules, next_cursor = await service.get_schedules_page(limit or DEFAULT_PAGE_SIZE, after, sortBy)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return schedules
 
 @router.get("/{schedule_id}", response_model=ScheduleResponse, summary="Get schedule by ID", description="Retrieve a specific schedule by its ID")
 @inject
@@ -166,6 +200,42 @@ async def create_schedule(
             detail=str(e)
         )
 
+@router.post("/bulk-status", response_model=ScheduleBulkStatusResponse, summary="Bulk update schedule status", description="Approve, reject or reset many schedules in one transaction")
+@inject
+async def bulk_update_schedule_status(
+    update_data: ScheduleBulkStatusUpdate,
+    background_tasks: BackgroundTasks,
+    service: IScheduleService = Depends(Provide[Container.schedule_service])
+):
+    """Change the status of many schedules at once.
+    
+    Room conflicts are checked for the whole set before anything is written. Conflicting
+    schedules are skipped unless allowConflicts is set, and notification emails are sent
+    in one batch after the response.
+    
+    Args:
+        update_data (ScheduleBulkStatusUpdate): Schedule IDs, target status and options
+        
+    Returns:
+        ScheduleBulkStatusResponse: Updated IDs, skipped schedules and room conflicts
+        
+    Raises:
+        HTTPException: If the status is invalid
+    """
+    try:
+        return await service.bulk_update_status(update_data, background_tasks)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        print(f"[DEBUG] ScheduleController - Error in bulk status update: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error updating schedules: {str(e)}"
+        )
+
 from fastapi.encoders import jsonable_encoder
 from fastapi import Body
 
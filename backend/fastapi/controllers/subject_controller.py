@@ -1,14 +1,17 @@
 import logging
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, Body
 from dependency_injector.wiring import inject, Provide
 
 from models.DTOs.subject_dto import SubjectCreate, SubjectUpdate, SubjectResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 from services.abstract.subject_service_interface import ISubjectService
 from services.abstract.exam_service_interface import IExamService
 from services.abstract.user_service_interface import IUserService
 from config.containers import Container
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from controllers.json_stream import streaming_json_response
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,14 +21,43 @@ router = APIRouter(prefix="/subjects", tags=["subjects"])
 @router.get("", response_model=List[SubjectResponse], summary="Get all subjects", description="Retrieve a list of all subjects in the system")
 @inject
 async def get_all_subjects(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; every subject is returned if omitted"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    sortBy: str = Query("id", description="Sort key: id or name"),
+    stream: bool = Query(False, description="Stream the full list as it is read from the database; limit and after are ignored"),
     service: ISubjectService = Depends(Provide[Container.subject_service])
 ):
     """Get all subjects endpoint.
     
+    With stream the full list is written to the client while it is read through a
+    server-side cursor, keeping memory flat for large exports. Without limit and after
+    the full list is returned. Otherwise one keyset page is returned and the cursor of
+    the next page, if any, is sent in the X-Next-Cursor header.
+    
+    Args:
+        limit (Optional[int]): Page size
+        after (Optional[str]): Cursor of the previous page
+        sortBy (str): Sort key
+        stream (bool): Stream the response instead of building it in memory
+    
     Returns:
-        List[SubjectResponse]: A list of all subjects
+        List[SubjectResponse]: A list of all subjects, or one page of them
+        
+    Raises:
+        HTTPException: If the sort key or cursor is invalid
     """
-    return await service.get_all_subjects()
+    if stream:
+        return streaming_json_response(service.stream_subjects())
+    if limit is None and after is None:
+        return await service.get_all_subjects()
+    try:
+        subjects, next_cursor = await service.get_subjects_page(limit or DEFAULT_PAGE_SIZE, after, sortBy)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return subjects
 
 @router.get("/{subject_id}", response_model=SubjectResponse, summary="Get subject by ID", description="Retrieve a specific subject by its ID")
 @inject
@@ -199,6 +231,58 @@ async def get_subjects_by_assistant(
     """
     return await service.get_subjects_by_assistant_id(assistant_id)
 
+@router.post("/bulk", response_model=BulkCreateResponse, summary="Create subjects in bulk", description="Validate many subjects and insert the valid ones in a single transaction. Invalid rows are reported by index instead of failing the request")
+@inject
+async def create_subjects_bulk(
+    rows: List[Dict[str, Any]] = Body(..., description="Subjects in the SubjectCreate format"),
+    service: ISubjectService = Depends(Provide[Container.subject_service])
+):
+    """Create many subjects at once.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The subjects to create
+        
+    Returns:
+        BulkCreateResponse: The ID or the error of every row, by position in the request
+        
+    Raises:
+        HTTPException: If the request has too many rows
+    """
+    try:
+        return await service.create_subjects_bulk(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.post("/sync", response_model=SyncDiffResponse, summary="Sync subjects from a snapshot", description="Compare a full snapshot of the subjects with the stored ones by natural key and write only the inserts, updates and deactivations")
+@inject
+async def sync_subjects_snapshot(
+    rows: List[Dict[str, Any]] = Body(..., description="Subjects in the SubjectCreate format, grouped by the groups they cover"),
+    service: ISubjectService = Depends(Provide[Container.subject_service])
+):
+    """Apply a subject snapshot incrementally.
+    
+    Matched rows keep their IDs and subjects of the covered groups missing from it are deactivated instead of being deleted.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The snapshot
+        
+    Returns:
+        SyncDiffResponse: What happened to every row, by position in the request
+        
+    Raises:
+        HTTPException: If the snapshot has too many rows
+    """
+    try:
+        return await service.sync_subjects_snapshot(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @router.post("", response_model=SubjectResponse, status_code=status.HTTP_201_CREATED, summary="Create subject", description="Create a new subject in the system")
 @inject
 async def create_subject(
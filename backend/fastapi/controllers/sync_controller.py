@@ -1,7 +1,7 @@
-from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File
+from fastapi import APIRouter, HTTPException, status, Depends, UploadFile, File, Query
 from dependency_injector.wiring import inject, Provide
 from pydantic import BaseModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal
 import logging
 from config.containers import Container
 from services.abstract.sync_service_interface import ISyncService
@@ -180,15 +180,20 @@ async def upload_group_leaders(
 
 @router.post("/data", response_model=SyncResponse,
            summary="Sync data from USV API",
-           description="Trigger the Flask service to fetch data from USV API and sync it to the database")
+           description="Trigger the Flask service to fetch data from USV API and sync it to the database. "
+                       "The 'full' mode wipes and reloads everything; the 'incremental' mode writes only the "
+                       "differences and keeps existing schedules and exam proposals")
 @inject
 async def sync_data(
+    mode: Literal["full", "incremental"] = Query("full", description="'full' to delete and reload, 'incremental' to apply only the differences"),
     sync_service: ISyncService = Depends(Provide[Container.sync_service])
 ):
     """
-    Deletes all existing data and triggers the Flask service to fetch data from USV API and sync it to the database.
+    Triggers the Flask service to fetch data from USV API and sync it to the database.
+    A full sync deletes all existing data first; an incremental sync updates it in place.
     
     Args:
+        mode: 'full' or 'incremental'
         sync_service: The sync service that coordinates the entire synchronization process
         
     Returns:
@@ -199,8 +204,8 @@ async def sync_data(
     """
     try:
         # Use the sync service to handle the entire synchronization process
-        logger.info("Starting synchronization process using SyncService")
-        result = await sync_service.sync_all_data()
+        logger.info(f"Starting {mode} synchronization process using SyncService")
+        result = await sync_service.sync_all_data(incremental=mode == "incremental")
         
         # Extract counts for the response message
         groups_count = result.get('synced', {}).get('groups', 0)
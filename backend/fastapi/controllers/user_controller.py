@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List, Optional, Dict
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response, Body
+from typing import List, Optional, Dict, Any
 from dependency_injector.wiring import inject, Provide
 
 from models.DTOs.user_dto import UserCreate, UserUpdate, UserResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 from services.abstract.user_service_interface import IUserService
 from config.containers import Container
+from repositories.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from controllers.json_stream import streaming_json_response
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -24,14 +27,43 @@ async def get_professor_count(
 @router.get("", response_model=List[UserResponse], summary="Get all users", description="Retrieve a list of all users in the system")
 @inject
 async def get_all_users(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; every user is returned if omitted"),
+    after: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    sortBy: str = Query("id", description="Sort key: id, lastName or email"),
+    stream: bool = Query(False, description="Stream the full list as it is read from the database; limit and after are ignored"),
     service: IUserService = Depends(Provide[Container.user_service])
 ):
     """Get all users endpoint.
     
+    With stream the full list is written to the client while it is read through a
+    server-side cursor, keeping memory flat for large exports. Without limit and after
+    the full list is returned. Otherwise one keyset page is returned and the cursor of
+    the next page, if any, is sent in the X-Next-Cursor header.
+    
+    Args:
+        limit (Optional[int]): Page size
+        after (Optional[str]): Cursor of the previous page
+        sortBy (str): Sort key
+        stream (bool): Stream the response instead of building it in memory
+    
     Returns:
-        List[UserResponse]: A list of all users
+        List[UserResponse]: A list of all users, or one page of them
+        
+    Raises:
+        HTTPException: If the sort key or cursor is invalid
     """
-    return await service.get_all_users()
+    if stream:
+        return streaming_json_response(service.stream_users())
+    if limit is None and after is None:
+        return await service.get_all_users()
+    try:
+        users, next_cursor = await service.get_users_page(limit or DEFAULT_PAGE_SIZE, after, sortBy)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return users
 
 @router.get("/search", response_model=List[UserResponse], summary="Search users", description="Search for users by name and role")
 @inject
@@ -106,6 +138,58 @@ async def get_user_by_email(
 
 
 
+@router.post("/bulk", response_model=BulkCreateResponse, summary="Create users in bulk", description="Validate many users and insert the valid ones in a single transaction. Invalid rows are reported by index instead of failing the request")
+@inject
+async def create_users_bulk(
+    rows: List[Dict[str, Any]] = Body(..., description="Users in the UserCreate format"),
+    service: IUserService = Depends(Provide[Container.user_service])
+):
+    """Create many users at once.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The users to create
+        
+    Returns:
+        BulkCreateResponse: The ID or the error of every row, by position in the request
+        
+    Raises:
+        HTTPException: If the request has too many rows
+    """
+    try:
+        return await service.create_users_bulk(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.post("/sync", response_model=SyncDiffResponse, summary="Sync users from a snapshot", description="Compare a full snapshot of the users with the stored ones by natural key and write only the inserts, updates and deactivations")
+@inject
+async def sync_users_snapshot(
+    rows: List[Dict[str, Any]] = Body(..., description="Every teaching staff member in the UserCreate format"),
+    service: IUserService = Depends(Provide[Container.user_service])
+):
+    """Apply a user snapshot incrementally.
+    
+    Matched rows keep their IDs and teaching staff missing from it are deactivated instead of being deleted.
+    
+    Args:
+        rows (List[Dict[str, Any]]): The snapshot
+        
+    Returns:
+        SyncDiffResponse: What happened to every row, by position in the request
+        
+    Raises:
+        HTTPException: If the snapshot has too many rows
+    """
+    try:
+        return await service.sync_users_snapshot(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED, summary="Create user", description="Create a new user in the system")
 @inject
 async def create_user(
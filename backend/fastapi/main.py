@@ -18,7 +18,8 @@ from controllers import config_controller
 from controllers import exam_controller
 
 from models.user import Base
-from config.database import engine
+from config.database import engine, get_pool_metrics
+from config.database_provider import DatabaseSessionMiddleware
 from config.containers import Container
 from dependency_injector.wiring import Provide, inject
 
@@ -55,8 +56,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Cursor of the next page on paginated list endpoints
 )
 
+# Give every request its own database session
+app.add_middleware(DatabaseSessionMiddleware)
+
 # Include routers
 app.include_router(user_controller.router)
 app.include_router(group_controller.router)
@@ -81,6 +86,16 @@ async def read_root():
     return {"message": "Welcome to TWAAOS API"}
 
 
+@app.get("/metrics/db-pool", tags=["root"], summary="Database pool metrics", description="Returns the connection pool state, peak usage and checkout wait times")
+async def read_db_pool_metrics():
+    """Connection pool metrics used to size the pool.
+    
+    Returns:
+        dict: Pool size, checked-in/out and overflow connections, their peaks and checkout wait times
+    """
+    return get_pool_metrics()
+
+
 # Custom OpenAPI schema
 @app.get("/openapi.json", include_in_schema=False)
 async def get_open_api_endpoint():
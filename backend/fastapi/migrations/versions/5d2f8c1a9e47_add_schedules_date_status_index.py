@@ -0,0 +1,24 @@
+"""Add schedules date/status index
+
+Revision ID: 5d2f8c1a9e47
+Revises: 21b0a3db077c
+Create Date: 2026-10-17 09:12:40.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5d2f8c1a9e47'
+down_revision = '21b0a3db077c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_schedules_date_status', 'schedules', ['date', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_schedules_date_status', table_name='schedules')
@@ -0,0 +1,24 @@
+"""Add users role/groupId index
+
+Revision ID: 8b3e6f0d2c71
+Revises: 5d2f8c1a9e47
+Create Date: 2026-10-17 11:03:27.561930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b3e6f0d2c71'
+down_revision = '5d2f8c1a9e47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_users_role_group_id', 'users', ['role', 'groupId'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_users_role_group_id', table_name='users')
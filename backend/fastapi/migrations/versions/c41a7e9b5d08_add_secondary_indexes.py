@@ -0,0 +1,40 @@
+"""Add secondary indexes on foreign-key and filter columns
+
+Revision ID: c41a7e9b5d08
+Revises: 8b3e6f0d2c71
+Create Date: 2026-10-17 11:48:05.204117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41a7e9b5d08'
+down_revision = '8b3e6f0d2c71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # schedules.date and users.role are the leading columns of
+    # ix_schedules_date_status and ix_users_role_group_id, which already serve them
+    op.create_index(op.f('ix_subjects_groupId'), 'subjects', ['groupId'], unique=False)
+    op.create_index(op.f('ix_subjects_teacherId'), 'subjects', ['teacherId'], unique=False)
+    op.create_index(op.f('ix_schedules_subjectId'), 'schedules', ['subjectId'], unique=False)
+    op.create_index(op.f('ix_schedules_status'), 'schedules', ['status'], unique=False)
+    op.create_index(op.f('ix_users_groupId'), 'users', ['groupId'], unique=False)
+    op.create_index(op.f('ix_notifications_userId'), 'notifications', ['userId'], unique=False)
+    op.create_index(op.f('ix_notifications_status'), 'notifications', ['status'], unique=False)
+    op.create_index('ix_excel_templates_type_group_id', 'excel_templates', ['type', 'groupId'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_excel_templates_type_group_id', table_name='excel_templates')
+    op.drop_index(op.f('ix_notifications_status'), table_name='notifications')
+    op.drop_index(op.f('ix_notifications_userId'), table_name='notifications')
+    op.drop_index(op.f('ix_users_groupId'), table_name='users')
+    op.drop_index(op.f('ix_schedules_status'), table_name='schedules')
+    op.drop_index(op.f('ix_schedules_subjectId'), table_name='schedules')
+    op.drop_index(op.f('ix_subjects_teacherId'), table_name='subjects')
+    op.drop_index(op.f('ix_subjects_groupId'), table_name='subjects')
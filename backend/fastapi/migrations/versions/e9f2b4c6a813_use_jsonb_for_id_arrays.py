@@ -0,0 +1,49 @@
+"""Use JSONB with GIN indexes for roomIds and assistantIds
+
+Revision ID: e9f2b4c6a813
+Revises: c41a7e9b5d08
+Create Date: 2026-10-17 12:26:51.870342
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9f2b4c6a813'
+down_revision = 'c41a7e9b5d08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('schedules', 'roomIds',
+                    existing_type=sa.JSON(),
+                    type_=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=True,
+                    postgresql_using='"roomIds"::jsonb')
+    op.alter_column('subjects', 'assistantIds',
+                    existing_type=sa.JSON(),
+                    type_=postgresql.JSONB(astext_type=sa.Text()),
+                    existing_nullable=False,
+                    postgresql_using='"assistantIds"::jsonb')
+    op.create_index('ix_schedules_room_ids_gin', 'schedules', ['roomIds'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'roomIds': 'jsonb_path_ops'})
+    op.create_index('ix_subjects_assistant_ids_gin', 'subjects', ['assistantIds'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'assistantIds': 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_subjects_assistant_ids_gin', table_name='subjects')
+    op.drop_index('ix_schedules_room_ids_gin', table_name='schedules')
+    op.alter_column('subjects', 'assistantIds',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    type_=sa.JSON(),
+                    existing_nullable=False,
+                    postgresql_using='"assistantIds"::json')
+    op.alter_column('schedules', 'roomIds',
+                    existing_type=postgresql.JSONB(astext_type=sa.Text()),
+                    type_=sa.JSON(),
+                    existing_nullable=True,
+                    postgresql_using='"roomIds"::json')
@@ -0,0 +1,28 @@
+"""Add isActive to groups, rooms and subjects
+
+Revision ID: f3a8d1c5b702
+Revises: e9f2b4c6a813
+Create Date: 2026-10-17 14:08:42.319574
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3a8d1c5b702'
+down_revision = 'e9f2b4c6a813'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('groups', sa.Column('isActive', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.add_column('rooms', sa.Column('isActive', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.add_column('subjects', sa.Column('isActive', sa.Boolean(), server_default=sa.true(), nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('subjects', 'isActive')
+    op.drop_column('rooms', 'isActive')
+    op.drop_column('groups', 'isActive')
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from typing import Optional, List
+
+class BulkItemResult(BaseModel):
+    index: int  # Position of the row in the request body
+    id: Optional[int] = None  # ID of the created row
+    error: Optional[str] = None  # Why the row was rejected
+
+class BulkCreateResponse(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkItemResult]  # One entry per request row, in request order
+
+class SyncItemResult(BulkItemResult):
+    action: Optional[str] = None  # 'inserted', 'updated' or 'unchanged' for accepted rows
+
+class SyncDiffResponse(BaseModel):
+    inserted: int
+    updated: int
+    unchanged: int
+    deactivated: int  # Existing rows missing from the snapshot, now marked inactive
+    failed: int
+    results: List[SyncItemResult]  # One entry per request row, in request order
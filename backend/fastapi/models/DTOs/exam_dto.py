@@ -133,3 +133,49 @@ class ExamProposalRequest(BaseModel):
             }
         }
     }
+
+class ExamAutoScheduleRequest(BaseModel):
+    """Request model for automatically scheduling the pending exams of the current exam period"""
+    dayStartTime: time = time(8, 0)
+    dayEndTime: time = time(20, 0)
+    examDurationHours: int = Field(2, ge=1, le=12)
+    groupSize: int = Field(30, ge=1, description="Number of seats needed by every exam")
+    maxRoomsPerExam: int = Field(3, ge=1)
+    maxExamsPerGroupPerDay: int = Field(1, ge=1)
+    excludeWeekends: bool = True
+    dryRun: bool = Field(False, description="Compute the timetable without saving it")
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "dayStartTime": "08:00:00",
+                "dayEndTime": "20:00:00",
+                "examDurationHours": 2,
+                "groupSize": 30,
+                "maxRoomsPerExam": 3,
+                "maxExamsPerGroupPerDay": 1,
+                "excludeWeekends": True,
+                "dryRun": False
+            }
+        }
+    }
+
+class ExamAssignment(BaseModel):
+    """Date, time slot and rooms assigned to an exam by the automatic scheduler"""
+    scheduleId: int
+    date: date
+    startTime: time
+    endTime: time
+    roomIds: List[int] = Field(default_factory=list)
+
+class UnscheduledExam(BaseModel):
+    """Exam the automatic scheduler could not place"""
+    scheduleId: int
+    subjectId: Optional[int] = None
+    reason: str
+
+class ExamAutoScheduleResponse(BaseModel):
+    """Response model for the automatic exam scheduler"""
+    assignments: List[ExamAssignment] = Field(default_factory=list)
+    unscheduled: List[UnscheduledExam] = Field(default_factory=list)
+    dryRun: bool = False
@@ -19,6 +19,7 @@ class GroupUpdate(BaseModel):
 
 class GroupResponse(GroupBase):
     id: int
+    isActive: bool = True
 
     class Config:
         from_attributes = True
@@ -20,6 +20,7 @@ class RoomUpdate(BaseModel):
 
 class RoomResponse(RoomBase):
     id: int
+    isActive: bool = True
 
     class Config:
         from_attributes = True
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, model_validator, field_validator, field_serializer
+from pydantic import BaseModel, Field, model_validator, field_validator, field_serializer
 from typing import Optional, Dict, Any, List, Union
 from datetime import date, time, datetime
 
@@ -152,3 +152,32 @@ class ScheduleResponse(BaseModel):
                 data['date'] = data['date'].isoformat()
             # Keep strings as they are
         return data
+
+class ScheduleBulkStatusUpdate(BaseModel):
+    """Status change applied to many schedules at once"""
+    scheduleIds: List[int] = Field(..., min_length=1)
+    status: str  # 'pending', 'proposed', 'approved' or 'rejected'
+    reason: Optional[str] = None  # Reason for rejection, included in the emails
+    sendEmail: Optional[bool] = None  # Flag to trigger email notifications
+    allowConflicts: bool = False  # Approve schedules even if their rooms are already booked
+    
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "scheduleIds": [101, 102, 103],
+                "status": "approved",
+                "sendEmail": True,
+                "allowConflicts": False
+            }
+        }
+    }
+
+class ScheduleBulkSkipped(BaseModel):
+    scheduleId: int
+    reason: str
+
+class ScheduleBulkStatusResponse(BaseModel):
+    updatedIds: List[int] = Field(default_factory=list)
+    skipped: List[ScheduleBulkSkipped] = Field(default_factory=list)
+    roomConflicts: List[Dict[str, Any]] = Field(default_factory=list)
+    notificationsQueued: int = 0
@@ -22,6 +22,7 @@ class SubjectUpdate(BaseModel):
 
 class SubjectResponse(SubjectBase):
     id: int
+    isActive: bool = True
     professorName: Optional[str] = None  # Add teacher name field
     professorEmail: Optional[str] = None  # Add teacher email field
     
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, Enum, LargeBinary, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Enum, LargeBinary, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from models.base import Base
 
 class ExcelTemplate(Base):
     __tablename__ = "excel_templates"
+    __table_args__ = (
+        # Type first so both the (groupId, type) and the type-only lookups can use it
+        Index("ix_excel_templates_type_group_id", "type", "groupId"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     groupId = Column(Integer, ForeignKey("groups.id"), nullable=True)  # Can be null for templates not specific to a group
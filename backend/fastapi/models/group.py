@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ARRAY
+from sqlalchemy import Column, Integer, String, Boolean, ARRAY, true
 from sqlalchemy.orm import relationship
 from models.base import Base
 
@@ -10,6 +10,7 @@ class Group(Base):
     studyYear = Column(Integer, nullable=False)
     specializationShortName = Column(String, nullable=False)
     groupIds = Column(ARRAY(Integer), nullable=True)  # List of original IDs from USV API
+    isActive = Column(Boolean, nullable=False, default=True, server_default=true())  # False once dropped from the USV data
     
     # Relationships
     users = relationship("User", back_populates="group")
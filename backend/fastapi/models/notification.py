@@ -6,10 +6,10 @@ class Notification(Base):
     __tablename__ = "notifications"
 
     id = Column(Integer, primary_key=True, index=True)
-    userId = Column(Integer, ForeignKey("users.id"), nullable=False)
+    userId = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     message = Column(Text, nullable=False)
     dateSent = Column(DateTime, default=func.now(), nullable=False)
-    status = Column(String, nullable=False)  # ex: 'trimis', 'citit'
+    status = Column(String, nullable=False, index=True)  # ex: 'trimis', 'citit'
     
     # Relationships
     user = relationship("User")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Boolean, true
 from models.base import Base
 
 class Room(Base):
@@ -10,6 +10,7 @@ class Room(Base):
     buildingName = Column(String, nullable=False)
     capacity = Column(Integer, nullable=False)
     computers = Column(Integer, nullable=False)
+    isActive = Column(Boolean, nullable=False, default=True, server_default=true())  # False once dropped from the USV data
     
     # No direct ORM relationship with Schedule
     # We're using a JSON array column in Schedule (roomIds), so we'll use repository methods
@@ -1,19 +1,27 @@
-from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Date, Time, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from models.base import Base
 from typing import List, Optional
 
 class Schedule(Base):
     __tablename__ = "schedules"
+    __table_args__ = (
+        # Used by conflict detection, which looks up approved exams on a given date
+        Index("ix_schedules_date_status", "date", "status"),
+        # Containment (@>) lookups of a single room
+        Index("ix_schedules_room_ids_gin", "roomIds", postgresql_using="gin",
+              postgresql_ops={"roomIds": "jsonb_path_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    subjectId = Column(Integer, ForeignKey("subjects.id"), nullable=False)
-    # Replace single roomId with roomIds as JSON array
-    roomIds = Column(JSON, nullable=True, default=list)  # Store room IDs as a JSON array
+    subjectId = Column(Integer, ForeignKey("subjects.id"), nullable=False, index=True)
+    # Replace single roomId with roomIds as JSONB array (GIN-indexed for containment lookups)
+    roomIds = Column(JSONB, nullable=True, default=list)  # Store room IDs as a JSONB array
     date = Column(Date, nullable=True)  # Now nullable for SG to set later
     startTime = Column(Time, nullable=True)  # Now nullable for CD to set later
     endTime = Column(Time, nullable=True)  # Now nullable for CD to set later
-    status = Column(String, nullable=True)  # ex: 'pending', 'proposed', 'approved', 'rejected', null means not ready but its not an label
+    status = Column(String, nullable=True, index=True)  # ex: 'pending', 'proposed', 'approved', 'rejected', null means not ready but its not an label
     message = Column(String(200), nullable=True)  # New field for CD to give guidance to SG
     
     # Relationships
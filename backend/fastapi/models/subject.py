@@ -1,21 +1,28 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, Index, true
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from models.base import Base
 from typing import List, Optional
 
 class Subject(Base):
     __tablename__ = "subjects"
+    __table_args__ = (
+        # Containment (@>) lookups of a single assistant
+        Index("ix_subjects_assistant_ids_gin", "assistantIds", postgresql_using="gin",
+              postgresql_ops={"assistantIds": "jsonb_path_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     shortName = Column(String, nullable=False)
     # Removed studyProgram and studyYear fields as requested
-    groupId = Column(Integer, ForeignKey("groups.id"), nullable=False)
-    teacherId = Column(Integer, ForeignKey("users.id"), nullable=False)
+    groupId = Column(Integer, ForeignKey("groups.id"), nullable=False, index=True)
+    teacherId = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     
-    # Store assistant IDs directly as a JSON array instead of using a relationship
+    # Store assistant IDs directly as a JSONB array instead of using a relationship
     # This defaults to an empty list
-    assistantIds = Column(JSON, nullable=False, default=list)
+    assistantIds = Column(JSONB, nullable=False, default=list)
+    isActive = Column(Boolean, nullable=False, default=True, server_default=true())  # False once dropped from the USV data
     
     # Relationships
     group = relationship("Group", back_populates="subjects")
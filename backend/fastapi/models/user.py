@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from models.base import Base
 from enum import Enum
@@ -12,13 +12,17 @@ class UserRole(str, Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Group leader lookups filter on both columns
+        Index("ix_users_role_group_id", "role", "groupId"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     firstName = Column(String)
     lastName = Column(String)
     email = Column(String, unique=True, nullable=False, index=True)
     role = Column(String, nullable=False)  # 'SG', 'CD', 'SEC', 'ADM'
-    groupId = Column(Integer, ForeignKey("groups.id"), nullable=True)  # Only for SG users
+    groupId = Column(Integer, ForeignKey("groups.id"), nullable=True, index=True)  # Only for SG users
     department = Column(String, nullable=True)  # For CD users
     phone = Column(String(25), nullable=True)  # Optional
     passwordHash = Column(String, nullable=True)  # Only for ADM users
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import date
 
 class IExamRepository(ABC):
@@ -23,6 +23,31 @@ class IExamRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def stream_exams_with_details(self) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all exams with joined details using a server-side cursor
+        
+        Returns:
+            AsyncIterator[Dict[str, Any]]: Exam data ordered by ID, read one chunk at a time
+        """
+        pass
+    
+    @abstractmethod
+    async def get_exams_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one keyset page of exams with joined details
+        
+        Args:
+            limit (int): Page size
+            after (Optional[str]): Cursor returned with the previous page
+            sort_by (str): Sort key ('id' or 'date')
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The exams of the page and the cursor
+            of the next page, or None if this is the last one
+        """
+        pass
+    
     @abstractmethod
     async def get_exams_by_study_program(self, program_code: str) -> List[Dict[str, Any]]:
         """Get exams filtered by study program
@@ -59,6 +84,34 @@ class IExamRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_teacher_dashboard_summary(self, teacher_id: int) -> Dict[str, Any]:
+        """Get aggregated dashboard data for a teacher
+        
+        Args:
+            teacher_id (int): ID of the teacher
+            
+        Returns:
+            Dict[str, Any]: Dictionary with statusCounts (lowercase status -> count),
+                totalSubjects and nextExam (exam data or None)
+        """
+        pass
+    
+    @abstractmethod
+    async def get_teacher_exams_by_status(self, teacher_id: int, statuses: List[str],
+                                          limit_per_status: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the first exams of a teacher for each of several statuses
+        
+        Args:
+            teacher_id (int): ID of the teacher
+            statuses (List[str]): Lowercase statuses to load
+            limit_per_status (int): Maximum number of exams returned per status
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Exams per status, ordered by date and start time
+        """
+        pass
+    
     @abstractmethod
     async def update_exam(self, exam_id: int, exam_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an exam with new information
@@ -83,3 +136,28 @@ class IExamRepository(ABC):
             Dict[str, Any]: Created exam data with ID and other details
         """
         pass
+    
+    @abstractmethod
+    async def get_exams_for_timetable(self, statuses: List[str]) -> List[Dict[str, Any]]:
+        """Get the scheduling data of every exam with one of the given statuses
+        
+        Args:
+            statuses (List[str]): Lowercase statuses to include
+            
+        Returns:
+            List[Dict[str, Any]]: Exams with scheduleId, subjectId, status, date, startTime,
+                endTime, roomIds, groupId, teacherId and assistantIds
+        """
+        pass
+    
+    @abstractmethod
+    async def bulk_propose_exams(self, assignments: List[Dict[str, Any]]) -> int:
+        """Save the date, time and rooms of many exams at once and mark them as proposed
+        
+        Args:
+            assignments (List[Dict[str, Any]]): Items with scheduleId, date, startTime, endTime and roomIds
+            
+        Returns:
+            int: Number of exams updated
+        """
+        pass
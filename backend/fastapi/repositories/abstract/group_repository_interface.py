@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple, Dict, Any
 from models.group import Group
 
 class IGroupRepository(ABC):
     @abstractmethod
-    async def get_all(self) -> List[Group]:
+    async def get_all(self, include_inactive: bool = False) -> List[Group]:
+        """Get the groups, leaving out the ones deactivated by a sync unless include_inactive is set"""
         pass
 
     @abstractmethod
@@ -27,10 +28,38 @@ class IGroupRepository(ABC):
     async def exists_by_id(self, group_id: int) -> bool:
         pass
 
+    @abstractmethod
+    async def get_existing_ids(self, group_ids: List[int]) -> Set[int]:
+        """Get which of the given group IDs exist, with a single query.
+        
+        Returns:
+            Set[int]: The IDs that belong to an existing group
+        """
+        pass
+
     @abstractmethod
     async def create(self, group: Group) -> Group:
         pass
 
+    @abstractmethod
+    async def create_many(self, groups: List[Group]) -> List[int]:
+        """Insert many groups in a single transaction.
+        
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
+        pass
+
+    @abstractmethod
+    async def apply_sync_changes(self, inserts: List[Group], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate groups in a single transaction.
+        
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        pass
+
     @abstractmethod
     async def update(self, group: Group) -> Group:
         pass
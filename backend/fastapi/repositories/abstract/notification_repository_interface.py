@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, AsyncIterator
 from models.notification import Notification
 
 class INotificationRepository(ABC):
@@ -7,6 +7,33 @@ class INotificationRepository(ABC):
     async def get_all(self) -> List[Notification]:
         pass
 
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[Notification]:
+        """Iterate over all notifications with a server-side cursor
+        
+        Returns:
+            Async iterator of notifications ordered by ID; only one chunk is held in memory
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Notification], Optional[str]]:
+        """Get one keyset page of notifications
+        
+        Args:
+            limit: Page size
+            after: Cursor returned with the previous page
+            sort_by: Sort key, one of SORT_KEYS
+            
+        Returns:
+            Tuple of (page, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the sort key or cursor is invalid
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, notification_id: int) -> Optional[Notification]:
         pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, Dict, Any
+from datetime import date, time
 from models.room import Room
 
 class IRoomRepository(ABC):
@@ -7,18 +8,79 @@ class IRoomRepository(ABC):
     async def get_all(self) -> List[Room]:
         pass
 
+    @abstractmethod
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Room], Optional[str]]:
+        """Get one keyset page of rooms
+        
+        Args:
+            limit: Page size
+            after: Cursor returned with the previous page
+            sort_by: Sort key, one of SORT_KEYS
+            
+        Returns:
+            Tuple of (page, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the sort key or cursor is invalid
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, room_id: int) -> Optional[Room]:
         pass
+
+    @abstractmethod
+    async def get_by_ids(self, room_ids: List[int]) -> List[Room]:
+        """Get several rooms in one query; unknown IDs are ignored"""
+        pass
     
     @abstractmethod
     async def get_by_building(self, building_name: str) -> List[Room]:
         pass
 
+    @abstractmethod
+    async def get_free_rooms(self, schedule_date: date, start_time: time, end_time: time,
+                             min_capacity: int = 0, min_computers: int = 0,
+                             building_name: Optional[str] = None) -> List[Room]:
+        """Get the rooms that match the constraints and have no approved exam in a time window.
+        
+        Args:
+            schedule_date (date): The date to check
+            start_time (time): Start of the time window
+            end_time (time): End of the time window
+            min_capacity (int): Minimum room capacity
+            min_computers (int): Minimum number of computers
+            building_name (Optional[str]): Restrict the search to one building
+            
+        Returns:
+            List[Room]: Free rooms ordered by capacity, smallest first
+        """
+        pass
+
     @abstractmethod
     async def create(self, room: Room) -> Room:
         pass
 
+    @abstractmethod
+    async def create_many(self, rooms: List[Room]) -> List[int]:
+        """Insert many rooms in a single transaction.
+        
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
+        pass
+
+    @abstractmethod
+    async def apply_sync_changes(self, inserts: List[Room], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate rooms in a single transaction.
+        
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        pass
+
     @abstractmethod
     async def update(self, room: Room) -> Room:
         pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from datetime import date
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
+from datetime import date, time
 from models.schedule import Schedule
 
 class IScheduleRepository(ABC):
@@ -8,6 +8,33 @@ class IScheduleRepository(ABC):
     async def get_all(self) -> List[Schedule]:
         pass
 
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[Schedule]:
+        """Iterate over all schedules with a server-side cursor
+        
+        Returns:
+            Async iterator of schedules ordered by ID; only one chunk is held in memory
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Schedule], Optional[str]]:
+        """Get one keyset page of schedules
+        
+        Args:
+            limit: Page size
+            after: Cursor returned with the previous page
+            sort_by: Sort key, one of SORT_KEYS
+            
+        Returns:
+            Tuple of (page, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the sort key or cursor is invalid
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, schedule_id: int) -> Optional[Schedule]:
         pass
@@ -32,6 +59,71 @@ class IScheduleRepository(ABC):
     async def get_by_status(self, status: str) -> List[Schedule]:
         pass
 
+    @abstractmethod
+    async def get_by_group_id(self, group_id: int) -> List[Schedule]:
+        """Get the schedules of a group's subjects with subject and group loaded in the same query"""
+        pass
+
+    @abstractmethod
+    async def get_by_teacher_id(self, teacher_id: int) -> List[Schedule]:
+        """Get the schedules of a teacher's subjects with subject and group loaded in the same query"""
+        pass
+
+    @abstractmethod
+    async def get_room_conflicts(self, schedule_date: date, start_time: time, end_time: time,
+                                 room_ids: List[int], exclude_schedule_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find approved exams that occupy any of the given rooms during a time window
+        
+        Args:
+            schedule_date (date): Date of the exam
+            start_time (time): Start of the time window
+            end_time (time): End of the time window
+            room_ids (List[int]): Room IDs to check
+            exclude_schedule_id (Optional[int]): Schedule to ignore, usually the one being edited
+            
+        Returns:
+            List[Dict[str, Any]]: One entry per conflicting (schedule, room) pair with
+                scheduleId, subjectId, subjectName, roomId, roomName, startTime and endTime
+        """
+        pass
+
+    @abstractmethod
+    async def get_room_conflicts_for_schedules(self, schedule_ids: List[int]) -> List[Tuple[int, int, int]]:
+        """Find the approved exams outside a set of schedules that share a room and a time with them
+        
+        Args:
+            schedule_ids (List[int]): Schedules to check; they are not compared with each other
+            
+        Returns:
+            List[Tuple[int, int, int]]: (schedule_id, room_id, conflicting_schedule_id) triples
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_ids(self, schedule_ids: List[int]) -> List[Schedule]:
+        """Get several schedules by ID with their subjects loaded
+        
+        Args:
+            schedule_ids: IDs of the schedules to load
+            
+        Returns:
+            List[Schedule]: The schedules that exist, in no particular order
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_update_status(self, schedule_ids: List[int], status: str) -> int:
+        """Set the status of several schedules in one statement and commit
+        
+        Args:
+            schedule_ids: IDs of the schedules to update
+            status: New status
+            
+        Returns:
+            int: Number of schedules updated
+        """
+        pass
+
     @abstractmethod
     async def create(self, schedule: Schedule) -> Schedule:
         pass
@@ -64,3 +156,12 @@ class IScheduleRepository(ABC):
             Dict[str, Any]: Statistics about the population process
         """
         pass
+
+    @abstractmethod
+    async def populate_missing_from_subjects(self) -> Dict[str, Any]:
+        """Create a preliminary schedule for every active subject that has none
+        
+        Returns:
+            Dict[str, Any]: Statistics about the population process
+        """
+        pass
@@ -1,10 +1,38 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Any
 from models.subject import Subject
 
 class ISubjectRepository(ABC):
     @abstractmethod
-    async def get_all(self) -> List[Subject]:
+    async def get_all(self, include_inactive: bool = False) -> List[Subject]:
+        """Get the subjects, leaving out the ones deactivated by a sync unless include_inactive is set"""
+        pass
+
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[Subject]:
+        """Iterate over all subjects with a server-side cursor
+        
+        Returns:
+            Async iterator of subjects ordered by ID; only one chunk is held in memory
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Subject], Optional[str]]:
+        """Get one keyset page of subjects
+        
+        Args:
+            limit: Page size
+            after: Cursor returned with the previous page
+            sort_by: Sort key, one of SORT_KEYS
+            
+        Returns:
+            Tuple of (page, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the sort key or cursor is invalid
+        """
         pass
 
     @abstractmethod
@@ -15,6 +43,11 @@ class ISubjectRepository(ABC):
     async def get_by_group_id(self, group_id: int) -> List[Subject]:
         pass
     
+    @abstractmethod
+    async def get_by_group_ids(self, group_ids: List[int]) -> List[Subject]:
+        """Get the subjects of several groups with a single query."""
+        pass
+    
     @abstractmethod
     async def get_by_teacher_id(self, teacher_id: int) -> List[Subject]:
         pass
@@ -52,6 +85,25 @@ class ISubjectRepository(ABC):
     async def create(self, subject: Subject) -> Subject:
         pass
 
+    @abstractmethod
+    async def create_many(self, subjects: List[Subject]) -> List[int]:
+        """Insert many subjects in a single transaction.
+        
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
+        pass
+
+    @abstractmethod
+    async def apply_sync_changes(self, inserts: List[Subject], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate subjects in a single transaction.
+        
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        pass
+
     @abstractmethod
     async def update(self, subject: Subject) -> Subject:
         pass
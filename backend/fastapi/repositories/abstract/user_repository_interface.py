@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Set, Any
 from models.user import User
 
 class IUserRepository(ABC):
@@ -7,6 +7,33 @@ class IUserRepository(ABC):
     async def get_all(self) -> List[User]:
         pass
 
+    @abstractmethod
+    def stream_all(self) -> AsyncIterator[User]:
+        """Iterate over all users with a server-side cursor
+        
+        Returns:
+            Async iterator of users ordered by ID; only one chunk is held in memory
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[User], Optional[str]]:
+        """Get one keyset page of users
+        
+        Args:
+            limit: Page size
+            after: Cursor returned with the previous page
+            sort_by: Sort key, one of SORT_KEYS
+            
+        Returns:
+            Tuple of (page, next_cursor); next_cursor is None on the last page
+            
+        Raises:
+            ValueError: If the sort key or cursor is invalid
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, user_id: int) -> Optional[User]:
         pass
@@ -19,10 +46,47 @@ class IUserRepository(ABC):
     async def get_by_google_id(self, google_id: str) -> Optional[User]:
         pass
 
+    @abstractmethod
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Get which of the given emails are already registered, with a single query.
+        
+        Returns:
+            Set[str]: The emails that belong to an existing user
+        """
+        pass
+
+    @abstractmethod
+    async def get_roles_by_ids(self, user_ids: List[int]) -> Dict[int, str]:
+        """Get the role of every existing user among the given IDs, with a single query.
+        
+        Returns:
+            Dict[int, str]: Mapping of user ID to role; unknown IDs are left out
+        """
+        pass
+
     @abstractmethod
     async def create(self, user: User) -> User:
         pass
 
+    @abstractmethod
+    async def create_many(self, users: List[User]) -> List[int]:
+        """Insert many users in a single transaction.
+        
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
+        pass
+
+    @abstractmethod
+    async def apply_sync_changes(self, inserts: List[User], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate users in a single transaction.
+        
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        pass
+
     @abstractmethod
     async def update(self, user: User) -> User:
         pass
@@ -62,4 +126,17 @@ class IUserRepository(ABC):
         Returns:
             List[User]: List of users with the specified role
         """
-        pass
\ No newline at end of file
+        pass
+    
+    @abstractmethod
+    async def get_by_role_and_group(self, role: str, group_id: int) -> List[User]:
+        """Get the users with a specific role in a group.
+        
+        Args:
+            role (str): The role to filter users by (e.g., 'SG')
+            group_id (int): The ID of the group
+            
+        Returns:
+            List[User]: List of matching users
+        """
+        pass
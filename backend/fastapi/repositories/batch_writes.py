@@ -0,0 +1,68 @@
+from typing import Any, Dict, List, Sequence, Tuple
+import logging
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+async def apply_changes(db: AsyncSession, model: Any, inserts: Sequence[Any],
+                        updates: Sequence[Tuple[int, Dict[str, Any]]],
+                        deactivate_ids: Sequence[int]) -> List[int]:
+    """Write the inserts, updates and soft-deletes of a sync in one transaction.
+
+    Updates that touch the same set of columns are sent as one executemany statement,
+    so the number of round-trips grows with the number of distinct column sets rather
+    than with the number of changed rows. Deactivated rows keep their ID and their
+    references; only isActive is cleared.
+
+    Args:
+        db: Session to write with
+        model: Mapped class of the rows (must have id and isActive columns)
+        inserts: New instances of the model
+        updates: (id, {column name: new value}) pairs of the rows to change
+        deactivate_ids: IDs of the rows to mark inactive
+
+    Returns:
+        List[int]: The IDs generated for the inserts, in input order
+    """
+    table = model.__table__
+    try:
+        ids = []
+        if inserts:
+            db.add_all(inserts)
+            await db.flush()
+            # Read the IDs before the commit expires the instances
+            ids = [row.id for row in inserts]
+
+        by_columns: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row_id, changes in updates:
+            columns = tuple(sorted(changes))
+            params = {f"b_{column}": value for column, value in changes.items()}
+            params["b_id"] = row_id
+            by_columns.setdefault(columns, []).append(params)
+        for columns, params in by_columns.items():
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values({
+                    column: bindparam(f"b_{column}", type_=table.c[column].type)
+                    for column in columns
+                })
+            )
+            await db.execute(statement, params)
+
+        if deactivate_ids:
+            await db.execute(
+                update(table).where(table.c.id.in_(list(deactivate_ids))).values(isActive=False)
+            )
+
+        await db.commit()
+        logger.info(f"[DEBUG] apply_changes - {table.name}: {len(ids)} inserted, {len(updates)} updated, "
+                    f"{len(deactivate_ids)} deactivated")
+        return ids
+    except Exception as e:
+        logger.error(f"Error applying sync changes to {table.name}: {str(e)}")
+        await db.rollback()
+        raise
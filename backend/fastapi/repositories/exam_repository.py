@@ -1,7 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
-from typing import List, Dict, Any
+from sqlalchemy import select, update, func, distinct, bindparam
+from sqlalchemy.orm import contains_eager
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from datetime import date
 import logging
 
@@ -11,11 +11,16 @@ from models.user import User
 from models.room import Room
 from models.group import Group
 from repositories.abstract.exam_repository_interface import IExamRepository
+from repositories.pagination import apply_keyset, resolve_sort_column, split_page, MAX_PAGE_SIZE
+from repositories.streaming import stream_partitions
 
 logger = logging.getLogger(__name__)
 
 class ExamRepository(IExamRepository):
     """Repository implementation for exam-related operations"""
+    # Columns the paginated exam listing may sort on
+    SORT_KEYS = {"id": Schedule.id, "date": Schedule.date}
+
     def __init__(self, db: AsyncSession):
         self.db = db
         
@@ -61,119 +66,198 @@ class ExamRepository(IExamRepository):
             logger.error(f"[DEBUG] ExamRepository - Error in update_sg_exam_statuses_to_pending: {str(e)}")
             raise
         
+    async def _load_room_names(self, schedules: List[Schedule]) -> Dict[int, str]:
+        """Load the names of every room referenced by the given schedules
+        
+        All room IDs are collected up front so the names are resolved with a single
+        query instead of one query per schedule.
+        
+        Args:
+            schedules (List[Schedule]): Schedules whose roomIds should be resolved
+            
+        Returns:
+            Dict[int, str]: Mapping of room ID to room name
+        """
+        room_ids = {room_id for schedule in schedules for room_id in schedule.get_room_ids()}
+        if not room_ids:
+            return {}
+        
+        result = await self.db.execute(select(Room.id, Room.name).where(Room.id.in_(room_ids)))
+        return {room_id: room_name for room_id, room_name in result.all()}
+    
+    def _format_exam(self, schedule: Schedule, room_mapping: Dict[int, str]) -> Optional[Dict[str, Any]]:
+        """Format a schedule and its loaded relations as an exam dictionary
+        
+        Args:
+            schedule (Schedule): Schedule with subject, group and teacher relations loaded
+            room_mapping (Dict[int, str]): Mapping of room ID to room name
+            
+        Returns:
+            Optional[Dict[str, Any]]: Exam data, or None if a required relation is missing
+        """
+        # Get associated objects safely
+        subject = schedule.subject
+        if not subject:
+            logger.warning(f"[DEBUG] ExamRepository - Schedule {schedule.id} has no subject relation")
+            return None
+            
+        group = subject.group
+        if not group:
+            logger.warning(f"[DEBUG] ExamRepository - Subject {subject.id} has no group relation")
+            return None
+            
+        teacher = subject.teacher
+        if not teacher:
+            logger.warning(f"[DEBUG] ExamRepository - Subject {subject.id} has no teacher relation")
+            return None
+            
+        # Handle roomIds JSON array instead of direct room relation
+        room_ids = schedule.get_room_ids()  # Use helper method from Schedule model
+        room_id = None
+        room_name = None
+        room_names = [room_mapping.get(rid, f"Unknown Room {rid}") for rid in room_ids]
+        
+        # For backward compatibility, we'll use the first room ID
+        if room_ids and room_ids[0] in room_mapping:
+            room_id = room_ids[0]
+            room_name = room_mapping[room_id]
+        
+        # Handle nullable start and end times
+        duration = None
+        start_time = schedule.startTime
+        end_time = schedule.endTime
+        
+        # Calculate duration only if both times are available
+        if start_time is not None and end_time is not None:
+            # Calculate hours difference
+            hours_diff = end_time.hour - start_time.hour
+            if end_time.minute < start_time.minute:
+                hours_diff -= 1
+            
+            # Ensure duration is at least 1 hour
+            duration = max(1, hours_diff)
+        
+        # Create formatted exam entry with proper handling of nullable fields
+        return {
+            "id": schedule.id,
+            "subjectId": subject.id,  # Only required field
+            "subjectName": subject.name,
+            "subjectShortName": subject.shortName,
+            "teacherId": teacher.id,
+            "teacherName": f"{teacher.lastName} {teacher.firstName}",
+            "teacherEmail": teacher.email,
+            "teacherPhone": teacher.phone,
+            "roomIds": room_ids,       # New field with full list of room IDs
+            "roomNames": room_names,   # New field with list of room names
+            "roomId": room_id,         # Keep for backward compatibility (first room or null)
+            "roomName": room_name,     # Keep for backward compatibility (first room name or null)
+            "date": schedule.date,     # Nullable
+            "startTime": schedule.startTime, # Nullable
+            "endTime": schedule.endTime,   # Nullable
+            "duration": duration,      # Calculated field, may be None
+            "status": schedule.status, # Nullable
+            "message": schedule.message, # New nullable message field
+            "groupId": group.id,
+            "groupName": group.name,
+            "specializationShortName": group.specializationShortName,
+            "studyYear": group.studyYear
+        }
+        
+    def _build_exams_query(self, *conditions, include_inactive: bool = False):
+        """Build the exam listing query with optional filter conditions
+        
+        Schedules are joined with their subject, group and teacher so filters on any of
+        these tables are evaluated by PostgreSQL, and the joined rows are used to populate
+        the relationships without extra queries. Exams of subjects or groups deactivated
+        by a sync are left out unless include_inactive is set.
+        
+        Args:
+            *conditions: SQLAlchemy filter expressions applied to the joined query
+            include_inactive (bool): Also return exams of deactivated subjects and groups
+            
+        Returns:
+            Select: The exam listing query
+        """
+        query = (
+            select(Schedule)
+            .join(Schedule.subject)
+            .join(Subject.group)
+            .join(Subject.teacher)
+            .options(
+                contains_eager(Schedule.subject).contains_eager(Subject.group),
+                contains_eager(Schedule.subject).contains_eager(Subject.teacher)
+                # We no longer have a direct relationship between Schedule and Room
+                # Instead, we have roomIds as a JSON array in Schedule
+            )
+        )
+        if not include_inactive:
+            conditions += (Subject.isActive.is_(True), Group.isActive.is_(True))
+        if conditions:
+            query = query.where(*conditions)
+        return query
+    
+    async def _fetch_exams(self, *conditions, order_by: Optional[List[Any]] = None,
+                           limit: Optional[int] = None, include_inactive: bool = False) -> List[Dict[str, Any]]:
+        """Run the exam listing query and format its rows
+        
+        Args:
+            *conditions: SQLAlchemy filter expressions applied to the joined query
+            order_by (Optional[List[Any]]): Optional ordering expressions
+            limit (Optional[int]): Optional maximum number of rows
+            include_inactive (bool): Also return exams of deactivated subjects and groups
+            
+        Returns:
+            List[Dict[str, Any]]: List of exam data with subject, teacher, room and group details
+        """
+        query = self._build_exams_query(*conditions, include_inactive=include_inactive)
+        if order_by:
+            query = query.order_by(*order_by)
+        if limit is not None:
+            query = query.limit(limit)
+            
+        result = await self.db.execute(query)
+        schedules = result.unique().scalars().all()
+        
+        logger.info(f"[DEBUG] ExamRepository - Query returned {len(schedules)} schedules")
+        
+        # Resolve all room names at once
+        room_mapping = await self._load_room_names(schedules)
+        
+        # Format the result with calculated fields
+        formatted_exams = []
+        for schedule in schedules:
+            formatted_exam = self._format_exam(schedule, room_mapping)
+            if formatted_exam is not None:
+                formatted_exams.append(formatted_exam)
+        
+        return formatted_exams
+    
+    async def _get_exam_with_details(self, exam_id: int) -> Optional[Dict[str, Any]]:
+        """Get a single exam with joined details, even if its subject was deactivated
+        
+        Args:
+            exam_id (int): ID of the exam
+            
+        Returns:
+            Optional[Dict[str, Any]]: Exam data, or None if not found
+        """
+        exams = await self._fetch_exams(Schedule.id == exam_id, include_inactive=True)
+        return exams[0] if exams else None
+        
     async def get_all_exams_with_details(self) -> List[Dict[str, Any]]:
         """Get all exams with joined details from related tables
         
+        Subjects, groups and teachers are joined in the main query and every room name
+        is resolved with one extra batched query, so the number of round-trips does not
+        grow with the number of schedules.
+        
         Returns:
             List[Dict[str, Any]]: List of exam data with subject, teacher, room and group details
         """
         logger.info("[DEBUG] ExamRepository - get_all_exams_with_details: Starting execution")
         
         try:
-            # Build a query that joins schedules with related tables
-            query = (
-                select(Schedule)
-                .options(
-                    joinedload(Schedule.subject).joinedload(Subject.group),
-                    joinedload(Schedule.subject).joinedload(Subject.teacher)
-                    # We no longer have a direct relationship between Schedule and Room
-                    # Instead, we have roomIds as a JSON array in Schedule
-                )
-            )
-            
-            # Execute the query
-            result = await self.db.execute(query)
-            schedules = result.unique().scalars().all()
-            
-            logger.info(f"[DEBUG] ExamRepository - Query returned {len(schedules)} schedules")
-            
-            # Format the result with calculated fields
-            formatted_exams = []
-            for schedule in schedules:
-                # Get associated objects safely
-                subject = schedule.subject
-                if not subject:
-                    logger.warning(f"[DEBUG] ExamRepository - Schedule {schedule.id} has no subject relation")
-                    continue
-                    
-                group = subject.group
-                if not group:
-                    logger.warning(f"[DEBUG] ExamRepository - Subject {subject.id} has no group relation")
-                    continue
-                    
-                teacher = subject.teacher
-                if not teacher:
-                    logger.warning(f"[DEBUG] ExamRepository - Subject {subject.id} has no teacher relation")
-                    continue
-                    
-                # Handle roomIds JSON array instead of direct room relation
-                room_ids = schedule.get_room_ids()  # Use helper method from Schedule model
-                room_id = None
-                room_name = None
-                room_names = []
-                
-                # Fetch all room names for the roomIds
-                if room_ids and len(room_ids) > 0:
-                    # For backward compatibility, we'll use the first room ID
-                    first_room_id = room_ids[0]
-                    
-                    # Get all rooms in a single query
-                    room_query = select(Room).where(Room.id.in_(room_ids))
-                    room_result = await self.db.execute(room_query)
-                    rooms = room_result.scalars().all()
-                    
-                    # Create a mapping of room_id to room_name
-                    room_mapping = {room.id: room.name for room in rooms}
-                    
-                    # Set room names based on the mapping
-                    room_names = [room_mapping.get(rid, f"Unknown Room {rid}") for rid in room_ids]
-                    
-                    # For backward compatibility
-                    if first_room_id in room_mapping:
-                        room_id = first_room_id
-                        room_name = room_mapping[first_room_id]
-                
-                # Handle nullable start and end times
-                duration = None
-                start_time = schedule.startTime
-                end_time = schedule.endTime
-                
-                # Calculate duration only if both times are available
-                if start_time is not None and end_time is not None:
-                    # Calculate hours difference
-                    hours_diff = end_time.hour - start_time.hour
-                    if end_time.minute < start_time.minute:
-                        hours_diff -= 1
-                    
-                    # Ensure duration is at least 1 hour
-                    duration = max(1, hours_diff)
-                
-                # Create formatted exam entry with proper handling of nullable fields
-                formatted_exam = {
-                    "id": schedule.id,
-                    "subjectId": subject.id,  # Only required field
-                    "subjectName": subject.name,
-                    "subjectShortName": subject.shortName,
-                    "teacherId": teacher.id,
-                    "teacherName": f"{teacher.lastName} {teacher.firstName}",
-                    "teacherEmail": teacher.email,
-                    "teacherPhone": teacher.phone,
-                    "roomIds": schedule.get_room_ids(),  # New field with full list of room IDs
-                    "roomNames": room_names,    # New field with list of room names
-                    "roomId": room_id,         # Keep for backward compatibility (first room or null)
-                    "roomName": room_name,     # Keep for backward compatibility (first room name or null)
-                    "date": schedule.date,     # Nullable
-                    "startTime": schedule.startTime, # Nullable
-                    "endTime": schedule.endTime,   # Nullable
-                    "duration": duration,      # Calculated field, may be None
-                    "status": schedule.status, # Nullable
-                    "message": schedule.message, # New nullable message field
-                    "groupId": group.id,
-                    "groupName": group.name,
-                    "specializationShortName": group.specializationShortName,
-                    "studyYear": group.studyYear
-                }
-                formatted_exams.append(formatted_exam)
+            formatted_exams = await self._fetch_exams()
             
             logger.info(f"[DEBUG] ExamRepository - Formatted {len(formatted_exams)} exam records")
             return formatted_exams
@@ -182,6 +266,56 @@ class ExamRepository(IExamRepository):
             logger.error(f"[DEBUG] ExamRepository - Error in get_all_exams_with_details: {str(e)}")
             raise
     
+    async def stream_exams_with_details(self) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all exams with joined details using a server-side cursor
+        
+        Rows are read in chunks and the room names of each chunk are resolved with one
+        batched query, so memory use stays flat however many exams there are.
+        
+        Yields:
+            Dict[str, Any]: Exam data with subject, teacher, room and group details, ordered by ID
+        """
+        query = self._build_exams_query().order_by(Schedule.id)
+        async for schedules in stream_partitions(self.db, query):
+            room_mapping = await self._load_room_names(schedules)
+            for schedule in schedules:
+                formatted_exam = self._format_exam(schedule, room_mapping)
+                if formatted_exam is not None:
+                    yield formatted_exam
+    
+    async def get_exams_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one keyset page of exams with joined details
+        
+        Args:
+            limit (int): Page size
+            after (Optional[str]): Cursor returned with the previous page
+            sort_by (str): Sort key, one of SORT_KEYS
+            
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: The exams of the page and the cursor
+            of the next page, or None if this is the last one
+            
+        Raises:
+            ValueError: If the sort key or cursor is invalid
+        """
+        sort_column = resolve_sort_column(self.SORT_KEYS, sort_by)
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        query = apply_keyset(self._build_exams_query(), sort_column, Schedule.id, limit, after)
+        
+        result = await self.db.execute(query)
+        schedules, next_cursor = split_page(result.unique().scalars().all(), limit, sort_column.key)
+        
+        room_mapping = await self._load_room_names(schedules)
+        formatted_exams = []
+        for schedule in schedules:
+            formatted_exam = self._format_exam(schedule, room_mapping)
+            if formatted_exam is not None:
+                formatted_exams.append(formatted_exam)
+        
+        logger.info(f"[DEBUG] ExamRepository - Returning page of {len(formatted_exams)} exams")
+        return formatted_exams, next_cursor
+    
     async def get_exams_by_study_program(self, program_code: str) -> List[Dict[str, Any]]:
         """Get exams filtered by study program
         
@@ -194,14 +328,7 @@ class ExamRepository(IExamRepository):
         logger.info(f"[DEBUG] ExamRepository - get_exams_by_study_program: {program_code}")
         
         try:
-            # Get all exams with details first
-            all_exams = await self.get_all_exams_with_details()
-            
-            # Filter by program code
-            filtered_exams = [
-                exam for exam in all_exams
-                if exam["specializationShortName"] == program_code
-            ]
+            filtered_exams = await self._fetch_exams(Group.specializationShortName == program_code)
             
             logger.info(f"[DEBUG] ExamRepository - Found {len(filtered_exams)} exams for program {program_code}")
             return filtered_exams
@@ -222,14 +349,7 @@ class ExamRepository(IExamRepository):
         logger.info(f"[DEBUG] ExamRepository - get_exams_by_teacher_id: {teacher_id}")
         
         try:
-            # Get all exams with details first
-            all_exams = await self.get_all_exams_with_details()
-            
-            # Filter by teacher ID
-            filtered_exams = [
-                exam for exam in all_exams
-                if exam["teacherId"] == teacher_id
-            ]
+            filtered_exams = await self._fetch_exams(Subject.teacherId == teacher_id)
             
             logger.info(f"[DEBUG] ExamRepository - Found {len(filtered_exams)} exams for teacher {teacher_id}")
             return filtered_exams
@@ -250,14 +370,7 @@ class ExamRepository(IExamRepository):
         logger.info(f"[DEBUG] ExamRepository - get_exams_by_group_id: {group_id}")
         
         try:
-            # Get all exams with details first
-            all_exams = await self.get_all_exams_with_details()
-            
-            # Filter by group ID
-            filtered_exams = [
-                exam for exam in all_exams
-                if exam["groupId"] == group_id
-            ]
+            filtered_exams = await self._fetch_exams(Subject.groupId == group_id)
             
             logger.info(f"[DEBUG] ExamRepository - Found {len(filtered_exams)} exams for group {group_id}")
             return filtered_exams
@@ -266,6 +379,113 @@ class ExamRepository(IExamRepository):
             logger.error(f"[DEBUG] ExamRepository - Error in get_exams_by_group_id: {str(e)}")
             raise
             
+    async def get_teacher_dashboard_summary(self, teacher_id: int) -> Dict[str, Any]:
+        """Get aggregated dashboard data for a teacher
+        
+        Status counts and the number of distinct subjects are computed by PostgreSQL
+        with a single GROUP BY query, and the next upcoming approved exam is fetched
+        with ORDER BY date LIMIT 1, so the cost does not depend on how many exams the
+        teacher has.
+        
+        Args:
+            teacher_id (int): ID of the teacher
+            
+        Returns:
+            Dict[str, Any]: Dictionary with statusCounts (lowercase status -> count),
+                totalSubjects and nextExam (exam data or None)
+        """
+        logger.info(f"[DEBUG] ExamRepository - get_teacher_dashboard_summary: {teacher_id}")
+        
+        try:
+            status_column = func.lower(Schedule.status)
+            total_subjects = (
+                select(func.count(distinct(Schedule.subjectId)))
+                .join(Schedule.subject)
+                .where(Subject.teacherId == teacher_id, Subject.isActive.is_(True))
+                .scalar_subquery()
+            )
+            counts_query = (
+                select(status_column, func.count(Schedule.id), total_subjects)
+                .join(Schedule.subject)
+                .where(Subject.teacherId == teacher_id, Subject.isActive.is_(True))
+                .group_by(status_column)
+            )
+            result = await self.db.execute(counts_query)
+            
+            status_counts = {}
+            subject_count = 0
+            for status, count, subjects in result.all():
+                if status is not None:
+                    status_counts[status] = count
+                subject_count = subjects
+            
+            # Next upcoming approved exam
+            next_exams = await self._fetch_exams(
+                Subject.teacherId == teacher_id,
+                status_column == "approved",
+                Schedule.date >= date.today(),
+                order_by=[Schedule.date, Schedule.startTime.asc().nulls_last(), Schedule.id],
+                limit=1
+            )
+            
+            logger.info(f"[DEBUG] ExamRepository - Dashboard summary for teacher {teacher_id}: {status_counts}")
+            return {
+                "statusCounts": status_counts,
+                "totalSubjects": subject_count,
+                "nextExam": next_exams[0] if next_exams else None
+            }
+            
+        except Exception as e:
+            logger.error(f"[DEBUG] ExamRepository - Error in get_teacher_dashboard_summary: {str(e)}")
+            raise
+            
+    async def get_teacher_exams_by_status(self, teacher_id: int, statuses: List[str],
+                                          limit_per_status: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the first exams of a teacher for each of several statuses
+        
+        The rows are ranked per status with a window function, so a single query returns
+        at most limit_per_status exams for each status however many the teacher has.
+        
+        Args:
+            teacher_id (int): ID of the teacher
+            statuses (List[str]): Lowercase statuses to load
+            limit_per_status (int): Maximum number of exams returned per status
+            
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Exams per status, ordered by date and start time
+        """
+        logger.info(f"[DEBUG] ExamRepository - get_teacher_exams_by_status: {teacher_id}, {statuses}")
+        
+        try:
+            status_column = func.lower(Schedule.status)
+            order = [Schedule.date.asc().nulls_last(), Schedule.startTime.asc().nulls_last(), Schedule.id]
+            ranked = (
+                select(
+                    Schedule.id.label("schedule_id"),
+                    func.row_number().over(partition_by=status_column, order_by=order).label("position")
+                )
+                .join(Schedule.subject)
+                .join(Subject.group)
+                .where(
+                    Subject.teacherId == teacher_id,
+                    status_column.in_(statuses),
+                    Subject.isActive.is_(True),
+                    Group.isActive.is_(True)
+                )
+                .subquery()
+            )
+            first_ids = select(ranked.c.schedule_id).where(ranked.c.position <= limit_per_status)
+            exams = await self._fetch_exams(Schedule.id.in_(first_ids), order_by=order)
+            
+            exams_by_status: Dict[str, List[Dict[str, Any]]] = {exam_status: [] for exam_status in statuses}
+            for exam in exams:
+                exams_by_status[(exam.get("status") or "").lower()].append(exam)
+            return exams_by_status
+            
+        except Exception as e:
+            logger.error(f"[DEBUG] ExamRepository - Error in get_teacher_exams_by_status: {str(e)}")
+            raise
+            
     async def get_subject_ids_by_group_id(self, group_id: int) -> List[int]:
         """Get all subject IDs for a specific group
         
@@ -282,7 +502,7 @@ class ExamRepository(IExamRepository):
             query = (
                 select(Subject.id)
                 .join(Subject.group)
-                .where(Group.id == group_id)
+                .where(Group.id == group_id, Subject.isActive.is_(True), Group.isActive.is_(True))
             )
             
             result = await self.db.execute(query)
@@ -295,6 +515,110 @@ class ExamRepository(IExamRepository):
             logger.error(f"[DEBUG] ExamRepository - Error in get_subject_ids_by_group_id: {str(e)}")
             raise
             
+    async def get_exams_for_timetable(self, statuses: List[str]) -> List[Dict[str, Any]]:
+        """Get the scheduling data of every exam with one of the given statuses
+        
+        Only the columns the timetable solver needs are selected, with the subject
+        joined in, so the whole exam session is loaded in a single query. Exams of
+        deactivated subjects or groups are not returned, so they are never scheduled.
+        
+        Args:
+            statuses (List[str]): Lowercase statuses to include
+            
+        Returns:
+            List[Dict[str, Any]]: Exams with scheduleId, subjectId, status, date, startTime,
+                endTime, roomIds, groupId, teacherId and assistantIds
+        """
+        logger.info(f"[DEBUG] ExamRepository - get_exams_for_timetable: {statuses}")
+        
+        try:
+            query = (
+                select(
+                    Schedule.id, Schedule.subjectId, Schedule.status, Schedule.date,
+                    Schedule.startTime, Schedule.endTime, Schedule.roomIds,
+                    Subject.groupId, Subject.teacherId, Subject.assistantIds
+                )
+                .join(Subject, Schedule.subjectId == Subject.id)
+                .join(Group, Subject.groupId == Group.id)
+                .where(
+                    func.lower(Schedule.status).in_(statuses),
+                    Subject.isActive.is_(True),
+                    Group.isActive.is_(True)
+                )
+            )
+            result = await self.db.execute(query)
+            
+            exams = [
+                {
+                    "scheduleId": row.id,
+                    "subjectId": row.subjectId,
+                    "status": row.status.lower(),
+                    "date": row.date,
+                    "startTime": row.startTime,
+                    "endTime": row.endTime,
+                    "roomIds": row.roomIds or [],
+                    "groupId": row.groupId,
+                    "teacherId": row.teacherId,
+                    "assistantIds": row.assistantIds or []
+                }
+                for row in result.all()
+            ]
+            
+            logger.info(f"[DEBUG] ExamRepository - Found {len(exams)} exams for the timetable")
+            return exams
+            
+        except Exception as e:
+            logger.error(f"[DEBUG] ExamRepository - Error in get_exams_for_timetable: {str(e)}")
+            raise
+    
+    async def bulk_propose_exams(self, assignments: List[Dict[str, Any]]) -> int:
+        """Save the date, time and rooms of many exams at once and mark them as proposed
+        
+        All rows are written by one executemany UPDATE in a single transaction.
+        
+        Args:
+            assignments (List[Dict[str, Any]]): Items with scheduleId, date, startTime, endTime and roomIds
+            
+        Returns:
+            int: Number of exams updated
+        """
+        logger.info(f"[DEBUG] ExamRepository - bulk_propose_exams: {len(assignments)} exams")
+        
+        if not assignments:
+            return 0
+        
+        try:
+            table = Schedule.__table__
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("b_id"))
+                .values(
+                    date=bindparam("b_date", type_=table.c.date.type),
+                    startTime=bindparam("b_start_time", type_=table.c.startTime.type),
+                    endTime=bindparam("b_end_time", type_=table.c.endTime.type),
+                    roomIds=bindparam("b_room_ids", type_=table.c.roomIds.type),
+                    status="proposed"
+                )
+            )
+            await self.db.execute(statement, [
+                {
+                    "b_id": assignment["scheduleId"],
+                    "b_date": assignment["date"],
+                    "b_start_time": assignment["startTime"],
+                    "b_end_time": assignment["endTime"],
+                    "b_room_ids": assignment["roomIds"]
+                }
+                for assignment in assignments
+            ])
+            await self.db.commit()
+            
+            return len(assignments)
+            
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"[DEBUG] ExamRepository - Error in bulk_propose_exams: {str(e)}")
+            raise
+            
     async def update_exam(self, exam_id: int, exam_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an exam with new information
         
@@ -363,8 +687,7 @@ class ExamRepository(IExamRepository):
             await self.db.refresh(schedule)
             
             # Get the updated exam with details
-            all_exams = await self.get_all_exams_with_details()
-            updated_exam = next((exam for exam in all_exams if exam["id"] == exam_id), None)
+            updated_exam = await self._get_exam_with_details(exam_id)
             
             if updated_exam:
                 logger.info(f"[DEBUG] ExamRepository - Successfully updated exam {exam_id}")
@@ -417,8 +740,7 @@ class ExamRepository(IExamRepository):
                     await self.db.refresh(existing_schedule)
                     
                     # Get the updated exam with all details
-                    all_exams = await self.get_all_exams_with_details()
-                    updated_exam = next((exam for exam in all_exams if exam["id"] == existing_schedule.id), None)
+                    updated_exam = await self._get_exam_with_details(existing_schedule.id)
                     
                     if updated_exam:
                         return updated_exam
@@ -492,8 +814,7 @@ class ExamRepository(IExamRepository):
             await self.db.refresh(new_schedule)
             
             # Get the created exam with all details
-            all_exams = await self.get_all_exams_with_details()
-            created_exam = next((exam for exam in all_exams if exam["id"] == new_schedule.id), None)
+            created_exam = await self._get_exam_with_details(new_schedule.id)
             
             if created_exam:
                 return created_exam
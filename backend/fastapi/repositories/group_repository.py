@@ -1,17 +1,22 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple, Dict, Any
+import logging
 from sqlalchemy import exists, select, func, delete
 from sqlalchemy.future import select
 
 from models.group import Group
 from repositories.abstract.group_repository_interface import IGroupRepository
+from repositories.batch_writes import apply_changes
 
 class GroupRepository(IGroupRepository):
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_all(self) -> List[Group]:
-        result = await self.db.execute(select(Group))
+    async def get_all(self, include_inactive: bool = False) -> List[Group]:
+        query = select(Group)
+        if not include_inactive:
+            query = query.filter(Group.isActive.is_(True))
+        result = await self.db.execute(query)
         return result.scalars().all()
 
     async def get_by_id(self, group_id: int) -> Optional[Group]:
@@ -37,6 +42,20 @@ class GroupRepository(IGroupRepository):
         result = await self.db.execute(stmt)
         return result.scalar()
 
+    async def get_existing_ids(self, group_ids: List[int]) -> Set[int]:
+        """Get which of the given group IDs exist, with a single query.
+        
+        Args:
+            group_ids (List[int]): The group IDs to check
+            
+        Returns:
+            Set[int]: The IDs that belong to an existing group
+        """
+        if not group_ids:
+            return set()
+        result = await self.db.execute(select(Group.id).where(Group.id.in_(group_ids)))
+        return set(result.scalars().all())
+
     async def create(self, group: Group) -> Group:
         try:
             self.db.add(group)
@@ -53,6 +72,41 @@ class GroupRepository(IGroupRepository):
             logging.error(f"Error in group repository create: {str(e)}")
             await self.db.rollback()  # Explicitly rollback on error
             raise
+    async def create_many(self, groups: List[Group]) -> List[int]:
+        """Insert many groups in a single transaction.
+        
+        Args:
+            groups (List[Group]): The groups to insert
+            
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
+        try:
+            self.db.add_all(groups)
+            await self.db.flush()
+            # Read the IDs before the commit expires the instances
+            ids = [group.id for group in groups]
+            await self.db.commit()
+            return ids
+        except Exception as e:
+            logging.error(f"Error in group repository create_many: {str(e)}")
+            await self.db.rollback()
+            raise
+
+    async def apply_sync_changes(self, inserts: List[Group], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate groups in a single transaction.
+        
+        Args:
+            inserts (List[Group]): New groups
+            updates (List[Tuple[int, Dict[str, Any]]]): (id, changed columns) pairs
+            deactivate_ids (List[int]): IDs of the groups to mark inactive
+            
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        return await apply_changes(self.db, Group, inserts, updates, deactivate_ids)
+
     async def update(self, group: Group) -> Group:
         await self.db.commit()
         await self.db.refresh(group)
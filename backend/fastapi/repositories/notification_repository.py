@@ -1,11 +1,16 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from typing import List, Optional
+from typing import List, Optional, Tuple, AsyncIterator
 
 from models.notification import Notification
 from repositories.abstract.notification_repository_interface import INotificationRepository
+from repositories.pagination import fetch_page
+from repositories.streaming import stream_partitions
 
 class NotificationRepository(INotificationRepository):
+    # Columns the paginated list endpoint may sort on
+    SORT_KEYS = {"id": Notification.id, "dateSent": Notification.dateSent}
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -13,6 +18,15 @@ class NotificationRepository(INotificationRepository):
         result = await self.db.execute(select(Notification))
         return result.scalars().all()
 
+    async def stream_all(self) -> AsyncIterator[Notification]:
+        async for notifications in stream_partitions(self.db, select(Notification).order_by(Notification.id)):
+            for notification in notifications:
+                yield notification
+
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Notification], Optional[str]]:
+        return await fetch_page(self.db, Notification, self.SORT_KEYS, limit, after, sort_by)
+
     async def get_by_id(self, notification_id: int) -> Optional[Notification]:
         result = await self.db.execute(select(Notification).filter(Notification.id == notification_id))
         return result.scalar_one_or_none()
@@ -0,0 +1,154 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Page size used when a cursor is given without a limit
+DEFAULT_PAGE_SIZE = 100
+# Largest page a client may ask for
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """Encode the position of a row as an opaque cursor.
+
+    Args:
+        sort_value: Value of the sort column for the row
+        row_id: Primary key of the row
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    payload = json.dumps([sort_value, row_id], separators=(",", ":"))
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_column: Any) -> Tuple[Any, int]:
+    """Decode a cursor produced by encode_cursor for the given sort column.
+
+    Args:
+        cursor: Cursor string from a previous page
+        sort_column: Column the page is sorted on, used to restore the value type
+
+    Returns:
+        Tuple[Any, int]: The sort value and the primary key of the last row of the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(urlsafe_b64decode(padded.encode()).decode())
+        if sort_value is not None:
+            python_type = sort_column.type.python_type
+            if python_type is datetime:
+                sort_value = datetime.fromisoformat(sort_value)
+            elif python_type is date:
+                sort_value = date.fromisoformat(sort_value)
+        return sort_value, int(row_id)
+    except Exception:
+        raise ValueError(f"Invalid pagination cursor: {cursor}")
+
+
+def apply_keyset(query, sort_column, id_column, limit: int, after: Optional[str] = None):
+    """Restrict a query to the page that follows a cursor.
+
+    Rows are ordered by (sort_column NULLS LAST, id_column) and limit + 1 rows are
+    requested so the caller can tell whether another page exists.
+
+    Args:
+        query: Select statement to paginate
+        sort_column: Column to sort on
+        id_column: Primary key column, used as the tie-breaker
+        limit: Page size
+        after: Cursor of the last row of the previous page
+
+    Returns:
+        The paginated select statement
+    """
+    if sort_column is id_column:
+        if after:
+            _, after_id = decode_cursor(after, id_column)
+            query = query.where(id_column > after_id)
+        return query.order_by(id_column.asc()).limit(limit + 1)
+
+    if after:
+        sort_value, after_id = decode_cursor(after, sort_column)
+        if sort_value is None:
+            query = query.where(sort_column.is_(None), id_column > after_id)
+        else:
+            query = query.where(or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > after_id),
+                sort_column.is_(None)
+            ))
+    return query.order_by(sort_column.asc().nulls_last(), id_column.asc()).limit(limit + 1)
+
+
+def split_page(rows: Sequence[Any], limit: int, sort_attr: str, id_attr: str = "id") -> Tuple[List[Any], Optional[str]]:
+    """Cut the extra row fetched by apply_keyset and build the next cursor.
+
+    Args:
+        rows: Rows returned by a query built with apply_keyset
+        limit: Page size
+        sort_attr: Name of the sort attribute on the rows
+        id_attr: Name of the primary key attribute on the rows
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The page and the cursor of the next page, or None
+            if this is the last one
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    get = last.get if isinstance(last, dict) else lambda name: getattr(last, name)
+    return rows, encode_cursor(get(sort_attr), get(id_attr))
+
+
+def resolve_sort_column(sort_keys: Dict[str, Any], sort_by: str):
+    """Look up the column for a sort key, rejecting keys that are not allowed.
+
+    Raises:
+        ValueError: If sort_by is not one of sort_keys
+    """
+    if sort_by not in sort_keys:
+        allowed = "', '".join(sorted(sort_keys))
+        raise ValueError(f"Invalid sort key '{sort_by}'. Allowed values are: '{allowed}'")
+    return sort_keys[sort_by]
+
+
+async def fetch_page(db: AsyncSession, model: Any, sort_keys: Dict[str, Any], limit: int,
+                     after: Optional[str] = None, sort_by: str = "id",
+                     conditions: Sequence[Any] = ()) -> Tuple[List[Any], Optional[str]]:
+    """Load one keyset page of a model.
+
+    Args:
+        db: Session to query with
+        model: Mapped class to page through
+        sort_keys: Allowed sort keys mapped to columns of the model
+        limit: Page size
+        after: Cursor of the last row of the previous page
+        sort_by: Sort key
+        conditions: Filter expressions applied before paginating
+
+    Returns:
+        Tuple[List[Any], Optional[str]]: The rows of the page and the next cursor
+
+    Raises:
+        ValueError: If the sort key or cursor is invalid
+    """
+    sort_column = resolve_sort_column(sort_keys, sort_by)
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    query = select(model)
+    if conditions:
+        query = query.where(*conditions)
+    query = apply_keyset(query, sort_column, model.id, limit, after)
+    result = await db.execute(query)
+    return split_page(result.scalars().all(), limit, sort_column.key)
@@ -1,11 +1,19 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from typing import List, Optional
+from sqlalchemy import select, delete, exists, func
+from typing import List, Optional, Tuple, Dict, Any
+import logging
+from datetime import date, time
 
 from models.room import Room
+from models.schedule import Schedule
 from repositories.abstract.room_repository_interface import IRoomRepository
+from repositories.pagination import fetch_page
+from repositories.batch_writes import apply_changes
 
 class RoomRepository(IRoomRepository):
+    # Columns the paginated list endpoint may sort on
+    SORT_KEYS = {"id": Room.id, "name": Room.name, "capacity": Room.capacity}
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -13,14 +21,66 @@ class RoomRepository(IRoomRepository):
         result = await self.db.execute(select(Room))
         return result.scalars().all()
 
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Room], Optional[str]]:
+        return await fetch_page(self.db, Room, self.SORT_KEYS, limit, after, sort_by)
+
     async def get_by_id(self, room_id: int) -> Optional[Room]:
         result = await self.db.execute(select(Room).filter(Room.id == room_id))
         return result.scalar_one_or_none()
     
+    async def get_by_ids(self, room_ids: List[int]) -> List[Room]:
+        if not room_ids:
+            return []
+        result = await self.db.execute(select(Room).filter(Room.id.in_(room_ids)))
+        return result.scalars().all()
+    
     async def get_by_building(self, building_name: str) -> List[Room]:
         result = await self.db.execute(select(Room).filter(Room.buildingName == building_name))
         return result.scalars().all()
 
+    async def get_free_rooms(self, schedule_date: date, start_time: time, end_time: time,
+                             min_capacity: int = 0, min_computers: int = 0,
+                             building_name: Optional[str] = None) -> List[Room]:
+        """Get the rooms that match the constraints and have no approved exam in a time window.
+        
+        Occupancy is checked with a correlated NOT EXISTS on the approved schedules of the
+        date (served by ix_schedules_date_status), so all free rooms come back in one query.
+        
+        Args:
+            schedule_date (date): The date to check
+            start_time (time): Start of the time window
+            end_time (time): End of the time window
+            min_capacity (int): Minimum room capacity
+            min_computers (int): Minimum number of computers
+            building_name (Optional[str]): Restrict the search to one building
+            
+        Returns:
+            List[Room]: Free rooms ordered by capacity, smallest first
+        """
+        occupied = exists().where(
+            Schedule.date == schedule_date,
+            Schedule.status == "approved",
+            Schedule.startTime < end_time,
+            Schedule.endTime > start_time,
+            Schedule.roomIds.contains(func.jsonb_build_array(Room.id))
+        )
+        query = (
+            select(Room)
+            .where(
+                Room.isActive.is_(True),
+                Room.capacity >= min_capacity,
+                Room.computers >= min_computers,
+                ~occupied
+            )
+            .order_by(Room.capacity, Room.name)
+        )
+        if building_name:
+            query = query.where(Room.buildingName == building_name)
+            
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
     async def create(self, room: Room) -> Room:
         try:
             self.db.add(room)
@@ -38,15 +98,51 @@ class RoomRepository(IRoomRepository):
             await self.db.rollback()  # Explicitly rollback on error
             raise
 
-    async def update(self, room: Room) -> Room:
+    async def create_many(self, rooms: List[Room]) -> List[int]:
+        """Insert many rooms in a single transaction.
+        
+        Args:
+            rooms (List[Room]): The rooms to insert
+            
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
         try:
-            # The commit is now handled by the database provider in the get_db function
+            self.db.add_all(rooms)
             await self.db.flush()
+            # Read the IDs before the commit expires the instances
+            ids = [room.id for room in rooms]
+            await self.db.commit()
+            return ids
+        except Exception as e:
+            logging.error(f"Error in room repository create_many: {str(e)}")
+            await self.db.rollback()
+            raise
+
+    async def apply_sync_changes(self, inserts: List[Room], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate rooms in a single transaction.
+        
+        Args:
+            inserts (List[Room]): New rooms
+            updates (List[Tuple[int, Dict[str, Any]]]): (id, changed columns) pairs
+            deactivate_ids (List[int]): IDs of the rooms to mark inactive
+            
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        return await apply_changes(self.db, Room, inserts, updates, deactivate_ids)
+
+    async def update(self, room: Room) -> Room:
+        try:
+            # Each request has its own session, which is closed without committing
+            await self.db.commit()
             await self.db.refresh(room)
             return room
         except Exception as e:
             import logging
             logging.error(f"Error in room repository update: {str(e)}")
+            await self.db.rollback()
             raise
 
     async def delete(self, room_id: int) -> bool:
@@ -54,13 +150,13 @@ class RoomRepository(IRoomRepository):
             room = await self.get_by_id(room_id)
             if room:
                 await self.db.delete(room)
-                # The commit is now handled by the database provider in the get_db function
-                await self.db.flush()
+                await self.db.commit()
                 return True
             return False
         except Exception as e:
             import logging
             logging.error(f"Error in room repository delete: {str(e)}")
+            await self.db.rollback()
             raise
         
     async def delete_all(self) -> int:
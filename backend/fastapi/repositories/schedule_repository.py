@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
-from typing import List, Optional, Dict, Any
+from sqlalchemy import select, insert, update, delete, exists, func, cast, true, and_, Integer
+from sqlalchemy.orm import aliased, selectinload, contains_eager
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
 from datetime import date, datetime, time
 import logging
 
@@ -8,10 +9,15 @@ from models.schedule import Schedule
 from models.subject import Subject
 from models.room import Room
 from repositories.abstract.schedule_repository_interface import IScheduleRepository
+from repositories.pagination import fetch_page
+from repositories.streaming import stream_partitions
 
 logger = logging.getLogger(__name__)
 
 class ScheduleRepository(IScheduleRepository):
+    # Columns the paginated list endpoint may sort on
+    SORT_KEYS = {"id": Schedule.id, "date": Schedule.date}
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -19,6 +25,15 @@ class ScheduleRepository(IScheduleRepository):
         result = await self.db.execute(select(Schedule))
         return result.scalars().all()
 
+    async def stream_all(self) -> AsyncIterator[Schedule]:
+        async for schedules in stream_partitions(self.db, select(Schedule).order_by(Schedule.id)):
+            for schedule in schedules:
+                yield schedule
+
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Schedule], Optional[str]]:
+        return await fetch_page(self.db, Schedule, self.SORT_KEYS, limit, after, sort_by)
+
     async def get_by_id(self, schedule_id: int) -> Optional[Schedule]:
         result = await self.db.execute(select(Schedule).filter(Schedule.id == schedule_id))
         return result.scalar_one_or_none()
@@ -28,8 +43,7 @@ class ScheduleRepository(IScheduleRepository):
         return result.scalars().all()
     
     async def get_by_room_id(self, room_id: int) -> List[Schedule]:
-        # Need to query the JSON array column for containment
-        # Using the JSON containment operator to find schedules where roomIds contains the room_id
+        # JSONB containment (@>) on roomIds is answered by its GIN index
         query = select(Schedule).filter(Schedule.roomIds.contains([room_id]))
         result = await self.db.execute(query)
         return result.scalars().all()
@@ -46,6 +60,154 @@ class ScheduleRepository(IScheduleRepository):
         result = await self.db.execute(select(Schedule).filter(Schedule.status == status))
         return result.scalars().all()
 
+    def _schedules_with_group_query(self):
+        # Schedule -> Subject -> Group in one statement, with both relationships populated
+        return (
+            select(Schedule)
+            .join(Schedule.subject)
+            .join(Subject.group)
+            .options(contains_eager(Schedule.subject).contains_eager(Subject.group))
+        )
+
+    async def get_by_group_id(self, group_id: int) -> List[Schedule]:
+        result = await self.db.execute(
+            self._schedules_with_group_query().where(Subject.groupId == group_id)
+        )
+        return result.scalars().all()
+
+    async def get_by_teacher_id(self, teacher_id: int) -> List[Schedule]:
+        result = await self.db.execute(
+            self._schedules_with_group_query().where(Subject.teacherId == teacher_id)
+        )
+        return result.scalars().all()
+
+    async def get_room_conflicts(self, schedule_date: date, start_time: time, end_time: time,
+                                 room_ids: List[int], exclude_schedule_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Find approved exams that occupy any of the given rooms during a time window
+        
+        The date/status filter uses the ix_schedules_date_status index, the time overlap
+        and room intersection are evaluated by PostgreSQL, and room and subject names are
+        returned in the same query.
+        
+        Args:
+            schedule_date (date): Date of the exam
+            start_time (time): Start of the time window
+            end_time (time): End of the time window
+            room_ids (List[int]): Room IDs to check
+            exclude_schedule_id (Optional[int]): Schedule to ignore, usually the one being edited
+            
+        Returns:
+            List[Dict[str, Any]]: One entry per conflicting (schedule, room) pair with
+                scheduleId, subjectId, subjectName, roomId, roomName, startTime and endTime
+        """
+        if not room_ids:
+            return []
+            
+        room_element = func.jsonb_array_elements_text(Schedule.roomIds).table_valued("value").lateral("room_element")
+        query = (
+            select(
+                Schedule.id,
+                Schedule.subjectId,
+                Subject.name,
+                Room.id,
+                Room.name,
+                Schedule.startTime,
+                Schedule.endTime
+            )
+            .select_from(Schedule)
+            .join(room_element, true())
+            .join(Room, Room.id == cast(room_element.c.value, Integer))
+            .join(Subject, Subject.id == Schedule.subjectId)
+            .where(
+                Schedule.date == schedule_date,
+                Schedule.status == "approved",
+                Schedule.startTime < end_time,
+                Schedule.endTime > start_time,
+                Room.id.in_(room_ids)
+            )
+            .order_by(Schedule.startTime, Room.id)
+        )
+        if exclude_schedule_id is not None:
+            query = query.where(Schedule.id != exclude_schedule_id)
+            
+        result = await self.db.execute(query)
+        return [
+            {
+                "scheduleId": schedule_id,
+                "subjectId": subject_id,
+                "subjectName": subject_name,
+                "roomId": room_id,
+                "roomName": room_name,
+                "startTime": conflict_start,
+                "endTime": conflict_end
+            }
+            for schedule_id, subject_id, subject_name, room_id, room_name, conflict_start, conflict_end in result.all()
+        ]
+
+    async def get_room_conflicts_for_schedules(self, schedule_ids: List[int]) -> List[Tuple[int, int, int]]:
+        """Find the approved exams outside a set of schedules that share a room and a time with them
+        
+        The whole set is checked with one query: every room of every schedule is matched
+        against the approved exams of the same date whose time window overlaps.
+        
+        Args:
+            schedule_ids (List[int]): Schedules to check; they are not compared with each other
+            
+        Returns:
+            List[Tuple[int, int, int]]: (schedule_id, room_id, conflicting_schedule_id) triples
+        """
+        if not schedule_ids:
+            return []
+            
+        candidate = aliased(Schedule)
+        other = aliased(Schedule)
+        candidate_room = func.jsonb_array_elements_text(candidate.roomIds).table_valued("value").lateral("candidate_room")
+        other_room = func.jsonb_array_elements_text(other.roomIds).table_valued("value").lateral("other_room")
+        room_id = cast(candidate_room.c.value, Integer)
+        query = (
+            select(candidate.id, room_id, other.id)
+            .select_from(candidate)
+            .join(candidate_room, true())
+            .join(other, and_(
+                other.date == candidate.date,
+                other.status == "approved",
+                other.startTime < candidate.endTime,
+                other.endTime > candidate.startTime,
+                other.id.notin_(schedule_ids)
+            ))
+            .join(other_room, cast(other_room.c.value, Integer) == room_id)
+            .where(candidate.id.in_(schedule_ids))
+            .distinct()
+        )
+        result = await self.db.execute(query)
+        return [(schedule_id, conflict_room_id, other_id) for schedule_id, conflict_room_id, other_id in result.all()]
+
+    async def get_by_ids(self, schedule_ids: List[int]) -> List[Schedule]:
+        if not schedule_ids:
+            return []
+        result = await self.db.execute(
+            select(Schedule)
+            .options(selectinload(Schedule.subject))
+            .where(Schedule.id.in_(schedule_ids))
+        )
+        return result.scalars().all()
+
+    async def bulk_update_status(self, schedule_ids: List[int], status: str) -> int:
+        if not schedule_ids:
+            return 0
+        try:
+            result = await self.db.execute(
+                update(Schedule)
+                .where(Schedule.id.in_(schedule_ids))
+                .values(status=status)
+            )
+            await self.db.commit()
+            return result.rowcount
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"[DEBUG] Repository - bulk_update_status error: {str(e)}")
+            raise
+
     async def create(self, schedule: Schedule) -> Schedule:
         self.db.add(schedule)
         await self.db.commit()
@@ -169,3 +331,31 @@ class ScheduleRepository(IScheduleRepository):
         except Exception as e:
             logger.error(f"[DEBUG] Repository - populate_from_subjects error: {str(e)}")
             raise
+
+    async def populate_missing_from_subjects(self) -> Dict[str, Any]:
+        """Create a preliminary schedule for every active subject that has none
+        
+        Existing schedules, and the proposals and approvals stored in them, are left
+        untouched. The rows are created with a single INSERT ... SELECT.
+        
+        Returns:
+            Dict[str, Any]: Statistics about the population process
+        """
+        has_schedule = exists().where(Schedule.subjectId == Subject.id)
+        missing = (
+            select(Subject.id, func.jsonb_build_array())
+            .where(Subject.isActive.is_(True), ~has_schedule)
+            .order_by(Subject.id)
+        )
+        try:
+            result = await self.db.execute(
+                insert(Schedule).from_select(["subjectId", "roomIds"], missing)
+            )
+            await self.db.commit()
+            created = result.rowcount or 0
+            logger.info(f"[DEBUG] Repository - populate_missing_from_subjects created {created} schedules")
+            return {"processed": created, "created": created, "errors": 0, "error_details": []}
+        except Exception as e:
+            logger.error(f"[DEBUG] Repository - populate_missing_from_subjects error: {str(e)}")
+            await self.db.rollback()
+            raise
@@ -0,0 +1,29 @@
+from typing import Any, AsyncIterator, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Rows fetched from the server-side cursor per round-trip
+STREAM_CHUNK_SIZE = 500
+
+
+async def stream_partitions(db: AsyncSession, query, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[List[Any]]:
+    """Run a select with a server-side cursor and yield its entities in chunks.
+
+    Only one chunk is held in memory at a time, so the cost of reading a table does not
+    grow with its size. The cursor lives on the session's connection, so the session
+    must stay open until the iterator is exhausted.
+
+    Args:
+        db: Session to query with
+        query: Select statement returning one entity per row
+        chunk_size: Number of rows fetched per round-trip
+
+    Yields:
+        List[Any]: The next chunk of entities
+    """
+    result = await db.stream_scalars(query.execution_options(yield_per=chunk_size))
+    try:
+        async for partition in result.partitions(chunk_size):
+            yield partition
+    finally:
+        await result.close()
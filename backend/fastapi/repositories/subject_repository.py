@@ -1,32 +1,70 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Any
 from sqlalchemy import select, delete
 from sqlalchemy.future import select
 import logging
 
 from models.subject import Subject
 from repositories.abstract.subject_repository_interface import ISubjectRepository
+from repositories.pagination import fetch_page
+from repositories.streaming import stream_partitions
+from repositories.batch_writes import apply_changes
 
 logger = logging.getLogger(__name__)
 
 class SubjectRepository(ISubjectRepository):
+    # Columns the paginated list endpoint may sort on
+    SORT_KEYS = {"id": Subject.id, "name": Subject.name}
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_all(self) -> List[Subject]:
-        result = await self.db.execute(select(Subject))
+    async def get_all(self, include_inactive: bool = False) -> List[Subject]:
+        query = select(Subject)
+        if not include_inactive:
+            query = query.filter(Subject.isActive.is_(True))
+        result = await self.db.execute(query)
         return result.scalars().all()
 
+    async def stream_all(self) -> AsyncIterator[Subject]:
+        query = select(Subject).filter(Subject.isActive.is_(True)).order_by(Subject.id)
+        async for subjects in stream_partitions(self.db, query):
+            for subject in subjects:
+                yield subject
+
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[Subject], Optional[str]]:
+        return await fetch_page(self.db, Subject, self.SORT_KEYS, limit, after, sort_by,
+                                conditions=[Subject.isActive.is_(True)])
+
     async def get_by_id(self, subject_id: int) -> Optional[Subject]:
         result = await self.db.execute(select(Subject).filter(Subject.id == subject_id))
         return result.scalars().first()
     
     async def get_by_group_id(self, group_id: int) -> List[Subject]:
-        result = await self.db.execute(select(Subject).filter(Subject.groupId == group_id))
+        result = await self.db.execute(
+            select(Subject).filter(Subject.groupId == group_id, Subject.isActive.is_(True))
+        )
+        return result.scalars().all()
+    
+    async def get_by_group_ids(self, group_ids: List[int]) -> List[Subject]:
+        """Get the subjects of several groups with a single query.
+        
+        Args:
+            group_ids (List[int]): The IDs of the groups
+            
+        Returns:
+            List[Subject]: The subjects of all the groups, active or not
+        """
+        if not group_ids:
+            return []
+        result = await self.db.execute(select(Subject).filter(Subject.groupId.in_(group_ids)))
         return result.scalars().all()
     
     async def get_by_teacher_id(self, teacher_id: int) -> List[Subject]:
-        result = await self.db.execute(select(Subject).filter(Subject.teacherId == teacher_id))
+        result = await self.db.execute(
+            select(Subject).filter(Subject.teacherId == teacher_id, Subject.isActive.is_(True))
+        )
         return result.scalars().all()
         
     async def get_subject_with_teacher(self, subject_id: int) -> Optional[Subject]:
@@ -50,13 +88,9 @@ class SubjectRepository(ISubjectRepository):
         return result.scalars().first()
         
     async def get_by_assistant_id(self, assistant_id: int) -> List[Subject]:
-        # Use JSON containment to find subjects where the assistant ID is in the assistantIds array
-        from sqlalchemy import text
-        
-        # In PostgreSQL, we need to check if the array contains the value
-        # Use the ? operator to check if the value exists in the JSON array
+        # JSONB containment (@>) on assistantIds is answered by its GIN index
         query = select(Subject).where(
-            text(f"assistantIds @> '[{assistant_id}]'::jsonb")
+            Subject.assistantIds.contains([assistant_id]), Subject.isActive.is_(True)
         )
         
         result = await self.db.execute(query)
@@ -74,6 +108,41 @@ class SubjectRepository(ISubjectRepository):
             # Re-raise the exception after rollback
             raise e
 
+    async def create_many(self, subjects: List[Subject]) -> List[int]:
+        """Insert many subjects in a single transaction.
+        
+        Args:
+            subjects (List[Subject]): The subjects to insert
+            
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
+        try:
+            self.db.add_all(subjects)
+            await self.db.flush()
+            # Read the IDs before the commit expires the instances
+            ids = [subject.id for subject in subjects]
+            await self.db.commit()
+            return ids
+        except Exception as e:
+            logging.error(f"Error in subject repository create_many: {str(e)}")
+            await self.db.rollback()
+            raise
+
+    async def apply_sync_changes(self, inserts: List[Subject], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate subjects in a single transaction.
+        
+        Args:
+            inserts (List[Subject]): New subjects
+            updates (List[Tuple[int, Dict[str, Any]]]): (id, changed columns) pairs
+            deactivate_ids (List[int]): IDs of the subjects to mark inactive
+            
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        return await apply_changes(self.db, Subject, inserts, updates, deactivate_ids)
+
     async def update(self, subject: Subject) -> Subject:
         try:
             await self.db.commit()
@@ -1,12 +1,19 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete
-from typing import List, Optional
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Set, Any
+import logging
 
 from models.user import User
 from models.notification import Notification
 from repositories.abstract.user_repository_interface import IUserRepository
+from repositories.pagination import fetch_page
+from repositories.streaming import stream_partitions
+from repositories.batch_writes import apply_changes
 
 class UserRepository(IUserRepository):
+    # Columns the paginated list endpoint may sort on
+    SORT_KEYS = {"id": User.id, "lastName": User.lastName, "email": User.email}
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
@@ -14,6 +21,15 @@ class UserRepository(IUserRepository):
         result = await self.db.execute(select(User))
         return result.scalars().all()
 
+    async def stream_all(self) -> AsyncIterator[User]:
+        async for users in stream_partitions(self.db, select(User).order_by(User.id)):
+            for user in users:
+                yield user
+
+    async def get_page(self, limit: int, after: Optional[str] = None,
+                       sort_by: str = "id") -> Tuple[List[User], Optional[str]]:
+        return await fetch_page(self.db, User, self.SORT_KEYS, limit, after, sort_by)
+
     async def get_by_id(self, user_id: int) -> Optional[User]:
         result = await self.db.execute(select(User).filter(User.id == user_id))
         return result.scalar_one_or_none()
@@ -26,6 +42,34 @@ class UserRepository(IUserRepository):
         result = await self.db.execute(select(User).filter(User.googleId == google_id))
         return result.scalar_one_or_none()
 
+    async def get_existing_emails(self, emails: List[str]) -> Set[str]:
+        """Get which of the given emails are already registered, with a single query.
+        
+        Args:
+            emails (List[str]): The emails to check
+            
+        Returns:
+            Set[str]: The emails that belong to an existing user
+        """
+        if not emails:
+            return set()
+        result = await self.db.execute(select(User.email).where(User.email.in_(emails)))
+        return set(result.scalars().all())
+
+    async def get_roles_by_ids(self, user_ids: List[int]) -> Dict[int, str]:
+        """Get the role of every existing user among the given IDs, with a single query.
+        
+        Args:
+            user_ids (List[int]): The user IDs to look up
+            
+        Returns:
+            Dict[int, str]: Mapping of user ID to role; unknown IDs are left out
+        """
+        if not user_ids:
+            return {}
+        result = await self.db.execute(select(User.id, User.role).where(User.id.in_(user_ids)))
+        return {user_id: role for user_id, role in result.all()}
+
     async def create(self, user: User) -> User:
         try:
             self.db.add(user)
@@ -43,15 +87,51 @@ class UserRepository(IUserRepository):
             await self.db.rollback()  # Explicitly rollback on error
             raise
 
-    async def update(self, user: User) -> User:
+    async def create_many(self, users: List[User]) -> List[int]:
+        """Insert many users in a single transaction.
+        
+        Args:
+            users (List[User]): The users to insert
+            
+        Returns:
+            List[int]: The generated IDs, in the order of the input
+        """
         try:
-            # The commit is now handled by the database provider in the get_db function
+            self.db.add_all(users)
             await self.db.flush()
+            # Read the IDs before the commit expires the instances
+            ids = [user.id for user in users]
+            await self.db.commit()
+            return ids
+        except Exception as e:
+            logging.error(f"Error in user repository create_many: {str(e)}")
+            await self.db.rollback()
+            raise
+
+    async def apply_sync_changes(self, inserts: List[User], updates: List[Tuple[int, Dict[str, Any]]],
+                                 deactivate_ids: List[int]) -> List[int]:
+        """Insert, update and deactivate users in a single transaction.
+        
+        Args:
+            inserts (List[User]): New users
+            updates (List[Tuple[int, Dict[str, Any]]]): (id, changed columns) pairs
+            deactivate_ids (List[int]): IDs of the users to mark inactive
+            
+        Returns:
+            List[int]: The IDs generated for the inserts, in input order
+        """
+        return await apply_changes(self.db, User, inserts, updates, deactivate_ids)
+
+    async def update(self, user: User) -> User:
+        try:
+            # Each request has its own session, which is closed without committing
+            await self.db.commit()
             await self.db.refresh(user)
             return user
         except Exception as e:
             import logging
             logging.error(f"Error in user repository update: {str(e)}")
+            await self.db.rollback()
             raise
 
     async def delete(self, user_id: int) -> bool:
@@ -136,4 +216,21 @@ class UserRepository(IUserRepository):
             List[User]: List of users with the specified role
         """
         result = await self.db.execute(select(User).filter(User.role == role))
-        return result.scalars().all()
\ No newline at end of file
+        return result.scalars().all()
+
+    async def get_by_role_and_group(self, role: str, group_id: int) -> List[User]:
+        """Get the users with a specific role in a group.
+        
+        Served by the composite (role, groupId) index.
+        
+        Args:
+            role (str): The role to filter users by (e.g., 'SG')
+            group_id (int): The ID of the group
+            
+        Returns:
+            List[User]: List of matching users
+        """
+        result = await self.db.execute(
+            select(User).filter(User.role == role, User.groupId == group_id)
+        )
+        return result.scalars().all()
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from models.DTOs.exam_dto import ExamResponse
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from models.DTOs.exam_dto import ExamResponse, ExamAutoScheduleRequest, ExamAutoScheduleResponse
+from repositories.pagination import DEFAULT_PAGE_SIZE
 
 class IExamService(ABC):
     """Interface defining methods for exam-related operations"""
@@ -14,6 +15,31 @@ class IExamService(ABC):
         """
         pass
     
+    @abstractmethod
+    def stream_exams(self) -> AsyncIterator[ExamResponse]:
+        """Iterate over all exams without loading the whole list in memory
+        
+        Returns:
+            AsyncIterator[ExamResponse]: Exams with subject, teacher and group details, ordered by ID
+        """
+        pass
+    
+    @abstractmethod
+    async def get_exams_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[ExamResponse], Optional[str]]:
+        """Get one keyset page of exams with associated information
+        
+        Args:
+            limit (int): Page size
+            after (Optional[str]): Cursor returned with the previous page
+            sort_by (str): Sort key ('id' or 'date')
+            
+        Returns:
+            Tuple[List[ExamResponse], Optional[str]]: The exams of the page and the cursor
+            of the next page, or None if this is the last one
+        """
+        pass
+    
     @abstractmethod
     async def get_exams_by_study_program(self, program_code: str) -> List[ExamResponse]:
         """Get exams filtered by study program
@@ -50,6 +76,22 @@ class IExamService(ABC):
         """
         pass
         
+    @abstractmethod
+    async def get_teacher_dashboard(self, teacher_id: int, include_exams: bool = True,
+                                    exams_limit: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """Get dashboard data for a teacher
+        
+        Args:
+            teacher_id (int): ID of the teacher
+            include_exams (bool): Whether to include the exam lists grouped by status
+            exams_limit (int): Maximum number of exams in each list
+            
+        Returns:
+            Dict[str, Any]: Dashboard data with stats, nextExam and, if requested,
+                scheduledExams, pendingExams, pendingProposals and rejectedExams
+        """
+        pass
+        
     @abstractmethod
     async def update_exam(self, exam_id: int, exam_data: Dict[str, Any]) -> ExamResponse:
         """Update an exam with new information
@@ -75,6 +117,18 @@ class IExamService(ABC):
         """
         pass
         
+    @abstractmethod
+    async def auto_schedule_exams(self, request: ExamAutoScheduleRequest) -> ExamAutoScheduleResponse:
+        """Assign a date, time slot and rooms to every pending exam of the current exam period
+        
+        Args:
+            request (ExamAutoScheduleRequest): Time slot layout and constraints to use
+            
+        Returns:
+            ExamAutoScheduleResponse: The assignments made and the exams that could not be placed
+        """
+        pass
+        
     @abstractmethod
     async def export_exams_to_pdf(self) -> bytes:
         """Export the list of all exams to PDF format
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from models.DTOs.group_dto import GroupCreate, GroupUpdate, GroupResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 
 class IGroupService(ABC):
     @abstractmethod
@@ -15,6 +16,22 @@ class IGroupService(ABC):
     async def create_group(self, group_data: GroupCreate) -> GroupResponse:
         pass
 
+    @abstractmethod
+    async def create_groups_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        pass
+
+    @abstractmethod
+    async def sync_groups_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored groups match a full snapshot, writing only the differences.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Every group, in the GroupCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated groups
+        """
+        pass
+
     @abstractmethod
     async def update_group(self, group_id: int, group_data: GroupUpdate) -> Optional[GroupResponse]:
         pass
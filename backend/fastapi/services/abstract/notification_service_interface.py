@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, AsyncIterator
 from models.DTOs.notification_dto import NotificationCreate, NotificationUpdate, NotificationResponse
 
 class INotificationService(ABC):
@@ -7,6 +7,15 @@ class INotificationService(ABC):
     async def get_all_notifications(self) -> List[NotificationResponse]:
         pass
 
+    @abstractmethod
+    def stream_notifications(self) -> AsyncIterator[NotificationResponse]:
+        pass
+
+    @abstractmethod
+    async def get_notifications_page(self, limit: int, after: Optional[str] = None,
+                                     sort_by: str = "id") -> Tuple[List[NotificationResponse], Optional[str]]:
+        pass
+
     @abstractmethod
     async def get_notification_by_id(self, notification_id: int) -> Optional[NotificationResponse]:
         pass
@@ -1,12 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple, Dict, Any
+from datetime import date, time
 from models.DTOs.room_dto import RoomCreate, RoomUpdate, RoomResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 
 class IRoomService(ABC):
     @abstractmethod
     async def get_all_rooms(self) -> List[RoomResponse]:
         pass
 
+    @abstractmethod
+    async def get_rooms_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[RoomResponse], Optional[str]]:
+        pass
+
     @abstractmethod
     async def get_room_by_id(self, room_id: int) -> Optional[RoomResponse]:
         pass
@@ -15,10 +22,45 @@ class IRoomService(ABC):
     async def get_rooms_by_building(self, building_name: str) -> List[RoomResponse]:
         pass
 
+    @abstractmethod
+    async def get_free_rooms(self, schedule_date: date, start_time: time, end_time: time,
+                             min_capacity: int = 0, min_computers: int = 0,
+                             building_name: Optional[str] = None) -> List[RoomResponse]:
+        """Get the rooms that match the constraints and are free during a time window.
+        
+        Args:
+            schedule_date (date): The date to check
+            start_time (time): Start of the time window
+            end_time (time): End of the time window
+            min_capacity (int): Minimum room capacity
+            min_computers (int): Minimum number of computers
+            building_name (Optional[str]): Restrict the search to one building
+            
+        Returns:
+            List[RoomResponse]: Free rooms ordered by capacity, smallest first
+        """
+        pass
+
     @abstractmethod
     async def create_room(self, room_data: RoomCreate) -> RoomResponse:
         pass
 
+    @abstractmethod
+    async def create_rooms_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        pass
+
+    @abstractmethod
+    async def sync_rooms_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored rooms match a full snapshot, writing only the differences.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Every room, in the RoomCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated rooms
+        """
+        pass
+
     @abstractmethod
     async def update_room(self, room_id: int, room_data: RoomUpdate) -> Optional[RoomResponse]:
         pass
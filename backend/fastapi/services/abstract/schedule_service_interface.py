@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, AsyncIterator
 from datetime import date
-from models.DTOs.schedule_dto import ScheduleCreate, ScheduleUpdate, ScheduleResponse
+from fastapi import BackgroundTasks
+from models.DTOs.schedule_dto import (
+    ScheduleCreate, ScheduleUpdate, ScheduleResponse,
+    ScheduleBulkStatusUpdate, ScheduleBulkStatusResponse
+)
 from models.DTOs.user_dto import UserResponse
 
 class IScheduleService(ABC):
@@ -9,6 +13,15 @@ class IScheduleService(ABC):
     async def get_all_schedules(self) -> List[ScheduleResponse]:
         pass
 
+    @abstractmethod
+    def stream_schedules(self) -> AsyncIterator[ScheduleResponse]:
+        pass
+
+    @abstractmethod
+    async def get_schedules_page(self, limit: int, after: Optional[str] = None,
+                                 sort_by: str = "id") -> Tuple[List[ScheduleResponse], Optional[str]]:
+        pass
+
     @abstractmethod
     async def get_schedule_by_id(self, schedule_id: int) -> Optional[ScheduleResponse]:
         pass
@@ -61,6 +74,15 @@ class IScheduleService(ABC):
             Dict[str, Any]: Statistics about the population process
         """
         pass
+
+    @abstractmethod
+    async def populate_missing_schedules(self) -> Dict[str, Any]:
+        """Create preliminary schedules only for the active subjects that have none
+        
+        Returns:
+            Dict[str, Any]: Statistics about the population process
+        """
+        pass
         
     @abstractmethod
     async def validate_teacher_id(self, teacher_id: int) -> Tuple[bool, Optional[str]]:
@@ -82,6 +104,20 @@ class IScheduleService(ABC):
     async def update_schedule(self, schedule_id: int, schedule_data: ScheduleUpdate) -> Optional[ScheduleResponse]:
         pass
 
+    @abstractmethod
+    async def bulk_update_status(self, update_data: ScheduleBulkStatusUpdate,
+                                 background_tasks: Optional[BackgroundTasks] = None) -> ScheduleBulkStatusResponse:
+        """Change the status of many schedules in one transaction
+        
+        Args:
+            update_data (ScheduleBulkStatusUpdate): Schedule IDs, target status and notification options
+            background_tasks (Optional[BackgroundTasks]): Used to send the emails after the response
+            
+        Returns:
+            ScheduleBulkStatusResponse: Updated IDs, skipped schedules and room conflicts
+        """
+        pass
+
     @abstractmethod
     async def delete_schedule(self, schedule_id: int) -> bool:
         pass
@@ -1,12 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Any
 from models.DTOs.subject_dto import SubjectCreate, SubjectUpdate, SubjectResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 
 class ISubjectService(ABC):
     @abstractmethod
     async def get_all_subjects(self) -> List[SubjectResponse]:
         pass
 
+    @abstractmethod
+    def stream_subjects(self) -> AsyncIterator[SubjectResponse]:
+        pass
+
+    @abstractmethod
+    async def get_subjects_page(self, limit: int, after: Optional[str] = None,
+                                sort_by: str = "id") -> Tuple[List[SubjectResponse], Optional[str]]:
+        pass
+
     @abstractmethod
     async def get_subject_by_id(self, subject_id: int) -> Optional[SubjectResponse]:
         pass
@@ -64,6 +74,22 @@ class ISubjectService(ABC):
     async def create_subject(self, subject_data: SubjectCreate) -> SubjectResponse:
         pass
 
+    @abstractmethod
+    async def create_subjects_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        pass
+
+    @abstractmethod
+    async def sync_subjects_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored subjects match a full snapshot, writing only the differences.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Every subject, in the SubjectCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated subjects
+        """
+        pass
+
     @abstractmethod
     async def update_subject(self, subject_id: int, subject_data: SubjectUpdate) -> Optional[SubjectResponse]:
         pass
@@ -19,10 +19,13 @@ class ISyncService(ABC):
         pass
     
     @abstractmethod
-    async def fetch_data_from_flask(self) -> Dict[str, Any]:
+    async def fetch_data_from_flask(self, incremental: bool = False) -> Dict[str, Any]:
         """
         Call the Flask backend to fetch and sync data from USV API.
         
+        Args:
+            incremental (bool): Ask Flask to send snapshots to the /sync endpoints instead of bulk inserts
+        
         Returns:
             Dict[str, Any]: Synchronization result with counts of created entities
         """
@@ -66,13 +69,16 @@ class ISyncService(ABC):
         pass
     
     @abstractmethod
-    async def sync_all_data(self) -> Dict[str, Any]:
+    async def sync_all_data(self, incremental: bool = False) -> Dict[str, Any]:
         """
         Orchestrates the entire synchronization process:
-        1. Delete all existing data
+        1. Delete all existing data (full mode only)
         2. Fetch new data from Flask backend
         3. Create test users
         
+        Args:
+            incremental (bool): Apply only the differences instead of deleting and reloading
+        
         Returns:
             Dict[str, Any]: Detailed results of the synchronization process
         """
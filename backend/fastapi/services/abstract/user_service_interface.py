@@ -1,13 +1,23 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Any
 from models.user import User
 from models.DTOs.user_dto import UserCreate, UserUpdate, UserResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 
 class IUserService(ABC):
     @abstractmethod
     async def get_all_users(self) -> List[UserResponse]:
         pass
 
+    @abstractmethod
+    def stream_users(self) -> AsyncIterator[UserResponse]:
+        pass
+
+    @abstractmethod
+    async def get_users_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[UserResponse], Optional[str]]:
+        pass
+
     @abstractmethod
     async def get_user_by_id(self, user_id: int) -> Optional[UserResponse]:
         pass
@@ -24,6 +34,22 @@ class IUserService(ABC):
     async def create_user(self, user_data: UserCreate) -> UserResponse:
         pass
 
+    @abstractmethod
+    async def create_users_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        pass
+
+    @abstractmethod
+    async def sync_users_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored users match a full snapshot, writing only the differences.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Every teaching staff member (role CD), in the UserCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated users
+        """
+        pass
+
     @abstractmethod
     async def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[UserResponse]:
         pass
@@ -0,0 +1,57 @@
+from typing import Any, Dict, List, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from models.DTOs.bulk_dto import BulkItemResult, BulkCreateResponse
+
+# Largest number of rows accepted by one bulk request
+MAX_BULK_ROWS = 5000
+
+DTO = TypeVar("DTO", bound=BaseModel)
+
+
+def validate_rows(rows: Sequence[Dict[str, Any]], dto_class: Type[DTO],
+                  max_rows: int = MAX_BULK_ROWS) -> Tuple[List[Tuple[int, DTO]], List[BulkItemResult]]:
+    """Validate the rows of a bulk request one by one.
+
+    A row that fails validation is reported on its own instead of rejecting the whole
+    request, the same outcome the row would have had as a single POST.
+
+    Args:
+        rows: Raw rows from the request body
+        dto_class: Create DTO the rows must match
+        max_rows: Largest number of rows accepted
+
+    Returns:
+        Tuple of (index, DTO) pairs for the valid rows and the errors of the invalid ones
+
+    Raises:
+        ValueError: If the request has more than max_rows rows
+    """
+    if len(rows) > max_rows:
+        raise ValueError(f"A bulk request may contain at most {max_rows} rows, got {len(rows)}")
+
+    valid = []
+    errors = []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, dto_class.model_validate(row)))
+        except ValidationError as e:
+            errors.append(BulkItemResult(index=index, error=str(e)))
+    return valid, errors
+
+
+def build_bulk_response(created: Sequence[Tuple[int, int]], errors: Sequence[BulkItemResult]) -> BulkCreateResponse:
+    """Combine the created rows and the rejected ones into one response.
+
+    Args:
+        created: (index, id) pairs of the inserted rows
+        errors: Results of the rejected rows
+
+    Returns:
+        BulkCreateResponse: Counts and one result per request row, ordered by index
+    """
+    results = [BulkItemResult(index=index, id=row_id) for index, row_id in created]
+    results.extend(errors)
+    results.sort(key=lambda result: result.index)
+    return BulkCreateResponse(created=len(created), failed=len(errors), results=results)
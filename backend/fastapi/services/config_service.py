@@ -13,6 +13,7 @@ from services.abstract.config_service_interface import IConfigService
 from services.abstract.email_service_interface import IEmailService
 from services.abstract.notification_service_interface import INotificationService
 from services.abstract.user_service_interface import IUserService
+from services.room_occupancy_index import RoomOccupancyIndex
 from models.user import UserRole
 from models.config import Config
 from models.DTOs.config_dto import ConfigResponse
@@ -26,12 +27,14 @@ class ConfigService(IConfigService):
                  email_service: Optional[IEmailService] = None,
                  notification_service: Optional[INotificationService] = None,
                  user_service: Optional[IUserService] = None,
-                 exam_repository: Optional[IExamRepository] = None):
+                 exam_repository: Optional[IExamRepository] = None,
+                 occupancy_index: Optional[RoomOccupancyIndex] = None):
         self.config_repository = config_repository
         self.email_service = email_service
         self.notification_service = notification_service
         self.user_service = user_service
         self.exam_repository = exam_repository
+        self.occupancy_index = occupancy_index
 
     async def get_current_config(self) -> Optional[ConfigResponse]:
         """Get the current/latest configuration"""
@@ -78,6 +81,9 @@ class ConfigService(IConfigService):
             try:
                 updated_count = await self.exam_repository.update_sg_exam_statuses_to_pending()
                 logger.info(f"Updated {updated_count} SG user exams to 'pending' status")
+                # Approved exams may have been reset, so the occupancy index must be rebuilt
+                if self.occupancy_index:
+                    self.occupancy_index.invalidate()
             except Exception as e:
                 logger.error(f"Failed to update SG exam statuses: {e}")
                 # Don't fail the operation if exam status update fails
@@ -1,10 +1,10 @@
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, AsyncIterator
 import logging
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
 
-from models.DTOs.exam_dto import ExamResponse
-from models.DTOs.schedule_dto import ScheduleResponse
+from models.DTOs.exam_dto import ExamResponse, ExamAutoScheduleRequest, ExamAutoScheduleResponse
 from repositories.abstract.exam_repository_interface import IExamRepository
+from repositories.pagination import DEFAULT_PAGE_SIZE
 from services.abstract.email_service_interface import IEmailService
 from services.abstract.notification_service_interface import INotificationService
 from services.abstract.user_service_interface import IUserService
@@ -12,6 +12,8 @@ from services.abstract.subject_service_interface import ISubjectService
 from services.abstract.schedule_service_interface import IScheduleService
 from services.abstract.exam_service_interface import IExamService
 from services.abstract.config_service_interface import IConfigService
+from services.room_occupancy_index import RoomOccupancyIndex
+from services.exam_timetable_solver import ExamTimetableSolver
 from models.DTOs.notification_dto import NotificationCreate
 
 logger = logging.getLogger(__name__)
@@ -28,7 +30,8 @@ class ExamService(IExamService):
         user_service: Optional[IUserService] = None,
         subject_service: Optional[ISubjectService] = None,
         config_service: Optional[IConfigService] = None,
-        room_service = None  # IRoomService - not strictly typed to avoid circular imports
+        room_service = None,  # IRoomService - not strictly typed to avoid circular imports
+        occupancy_index: Optional[RoomOccupancyIndex] = None
     ):
         """Initialize with required repositories and services"""
         self.exam_repository = exam_repository
@@ -39,6 +42,15 @@ class ExamService(IExamService):
         self.subject_service = subject_service
         self.config_service = config_service
         self.room_service = room_service  # For resolving room names from IDs
+        self.occupancy_index = occupancy_index
+        
+    def _update_occupancy(self, exam_data: Dict[str, Any]) -> None:
+        """Reflect a saved exam in the room occupancy index, if one is configured"""
+        if self.occupancy_index:
+            self.occupancy_index.update_schedule(
+                exam_data["id"], exam_data.get("status"), exam_data.get("roomIds"),
+                exam_data.get("date"), exam_data.get("startTime"), exam_data.get("endTime")
+            )
         
     # Helper method to preprocess exam data before validation
     def _preprocess_exam_data(self, exam_data: Dict) -> Dict:
@@ -52,150 +64,38 @@ class ExamService(IExamService):
         
         return processed_data
         
-    async def _get_subject_ids_for_group(self, group_id: int) -> List[int]:
-        """Get all subject IDs associated with a specific group
+    def _to_exam_responses(self, exam_data: List[Dict[str, Any]]) -> List[ExamResponse]:
+        """Convert exam dictionaries from the repository to response models
         
-        Args:
-            group_id (int): The group ID to find subjects for
-            
-        Returns:
-            List[int]: List of subject IDs for the group
-        """
-        # We'll use the subject service if available, otherwise fall back to repository
-        if self.subject_service:
-            # This uses the proper layered approach going through the subject service
-            subjects = await self.subject_service.get_subjects_by_group_id(group_id)
-            return [subject.id for subject in subjects]
-        else:
-            # Fallback to repository call if service not available
-            # Note: In production, you should ensure subject_service is always provided
-            logger.warning(f"[DEBUG] ExamService - Subject service not available, using repository fallback for group {group_id}")
-            return await self.exam_repository.get_subject_ids_by_group_id(group_id)
-    
-    async def _enrich_schedule_with_metadata(self, schedule: ScheduleResponse, subject_id: int, group_id: int) -> Dict[str, Any]:
-        """Enrich a schedule with additional metadata to create an exam response
+        Exams that fail validation are retried once with their date cleared and are
+        skipped if they still fail, so one bad row does not fail the whole request.
         
         Args:
-            schedule: The schedule response from schedule service
-            subject_id: The subject ID for additional details
-            group_id: The group ID for additional details
+            exam_data: Exam dictionaries returned by the exam repository
             
         Returns:
-            Dict: Enriched exam data with all required fields
+            List[ExamResponse]: Validated exam responses
         """
-        # Start with schedule data
-        # Handle date conversion explicitly
-        date_value = schedule.date
-        if isinstance(date_value, date):
-            date_value = date_value.isoformat()
-        
-        # Initialize base exam data
-        exam_data = {
-            "id": schedule.id,
-            "date": date_value,
-            "startTime": schedule.startTime,
-            "endTime": schedule.endTime,
-            "status": schedule.status,
-            "message": schedule.message
-        }
-        
-        # Handle room data - properly handle both roomIds (array) and roomId (legacy single value)
-        if hasattr(schedule, 'roomIds') and schedule.roomIds:
-            # Use the roomIds array (the new, correct format)
-            logger.info(f"[DEBUG] ExamService - Schedule {schedule.id} has roomIds: {schedule.roomIds}")
-            exam_data["roomIds"] = schedule.roomIds
-            
-            # For backward compatibility, set roomId to first room if available
-            if schedule.roomIds and len(schedule.roomIds) > 0:
-                exam_data["roomId"] = schedule.roomIds[0]
-            else:
-                exam_data["roomId"] = None
-                
-            # Get room names if possible
-            if hasattr(self, 'room_service') and self.room_service:
-                room_names = []
-                for room_id in schedule.roomIds:
-                    try:
-                        room = await self.room_service.get_room_by_id(room_id)
-                        if room:
-                            room_names.append(room.name)
-                    except Exception as e:
-                        logger.error(f"[DEBUG] ExamService - Error getting room name for ID {room_id}: {str(e)}")
-                
-                if room_names:
-                    exam_data["roomNames"] = room_names
-                    # For backward compatibility
-                    exam_data["roomName"] = ", ".join(room_names)
-        elif hasattr(schedule, 'roomId') and schedule.roomId:
-            # Legacy format - single roomId
-            logger.info(f"[DEBUG] ExamService - Schedule {schedule.id} has single roomId: {schedule.roomId}")
-            exam_data["roomId"] = schedule.roomId
-            # Create roomIds array with single item for new format
-            exam_data["roomIds"] = [schedule.roomId]
-            
-            # Get room name if possible
-            if hasattr(self, 'room_service') and self.room_service:
+        exams = []
+        for exam in exam_data:
+            try:
+                exams.append(ExamResponse.model_validate(exam))
+            except Exception as validation_error:
+                logger.warning(f"[DEBUG] ExamService - Validation error for exam ID {exam.get('id')}: {str(validation_error)}")
+                # Try sanitizing the problematic fields
+                sanitized_exam = exam.copy()
+                # If date field is causing issues, convert explicitly to None
+                if 'date' in sanitized_exam and sanitized_exam['date'] is not None:
+                    # Log the original date for debugging
+                    logger.info(f"[DEBUG] ExamService - Converting date from {sanitized_exam['date']} to None for exam ID {exam.get('id')}")
+                    sanitized_exam['date'] = None
+                # Try validation again with sanitized data
                 try:
-                    room = await self.room_service.get_room_by_id(schedule.roomId)
-                    if room:
-                        exam_data["roomName"] = room.name
-                        exam_data["roomNames"] = [room.name]
-                except Exception as e:
-                    logger.error(f"[DEBUG] ExamService - Error getting room name for ID {schedule.roomId}: {str(e)}")
-        else:
-            # No room information
-            logger.warning(f"[DEBUG] ExamService - Schedule {schedule.id} has no room information")
-            exam_data["roomId"] = None
-            exam_data["roomIds"] = []
-            exam_data["roomName"] = ""
-            exam_data["roomNames"] = []
-        
-        # Get subject details
-        if self.subject_service:
-            subject = await self.subject_service.get_subject_by_id(subject_id)
-            if subject:
-                exam_data["subjectId"] = subject.id
-                exam_data["subjectName"] = subject.name
-                exam_data["subjectShortName"] = subject.shortName
-                
-                # Get teacher details from subject
-                if self.user_service and subject.teacherId:
-                    teacher = await self.user_service.get_user_by_id(subject.teacherId)
-                    if teacher:
-                        exam_data["teacherId"] = teacher.id
-                        exam_data["teacherName"] = f"{teacher.lastName} {teacher.firstName}"
-                        exam_data["teacherEmail"] = teacher.email
-                        exam_data["teacherPhone"] = teacher.phone
-        
-        # Get group details
-        if group_id:
-            # Use group repository or group service
-            group = None
-            if hasattr(self, 'group_service') and self.group_service:
-                group = await self.group_service.get_group_by_id(group_id)
-            
-            if group:
-                exam_data["groupId"] = group.id
-                exam_data["groupName"] = group.name
-                exam_data["specializationShortName"] = group.specializationShortName
-                exam_data["studyYear"] = group.studyYear
-            else:
-                # Fallback values if group details can't be retrieved
-                exam_data["groupId"] = group_id
-                exam_data["groupName"] = "Unknown Group"
-                exam_data["specializationShortName"] = "Unknown"
-                exam_data["studyYear"] = 0
-        
-        # Calculate duration if both startTime and endTime exist
-        if schedule.startTime and schedule.endTime:
-            hours_diff = schedule.endTime.hour - schedule.startTime.hour
-            if schedule.endTime.minute < schedule.startTime.minute:
-                hours_diff -= 1
-            exam_data["duration"] = max(1, hours_diff)  # Ensure at least 1 hour
-        else:
-            exam_data["duration"] = None
-            
-        return exam_data
+                    exams.append(ExamResponse.model_validate(sanitized_exam))
+                except Exception as second_error:
+                    logger.error(f"[DEBUG] ExamService - Failed validation after sanitizing for exam ID {exam.get('id')}: {str(second_error)}")
+                    # Skip this exam rather than failing the entire request
+        return exams
     
     async def get_all_exams(self) -> List[ExamResponse]:
         """Get all exams with associated information
@@ -210,28 +110,8 @@ class ExamService(IExamService):
             # that's used successfully by the get_exams_by_teacher_id endpoint
             exam_data = await self.exam_repository.get_all_exams_with_details()
             
-            # Convert to DTO response models with proper error handling - using the SAME
-            # approach as get_exams_by_teacher_id
-            exams = []
-            for exam in exam_data:
-                try:
-                    # Simple direct model validation, just like in get_exams_by_teacher_id
-                    exams.append(ExamResponse.model_validate(exam))
-                except Exception as validation_error:
-                    logger.warning(f"[DEBUG] ExamService - Validation error for exam ID {exam.get('id')}: {str(validation_error)}")
-                    # Try sanitizing the problematic fields
-                    sanitized_exam = exam.copy()
-                    # If date field is causing issues, convert explicitly to None
-                    if 'date' in sanitized_exam and sanitized_exam['date'] is not None:
-                        # Log the original date for debugging
-                        logger.info(f"[DEBUG] ExamService - Converting date from {sanitized_exam['date']} to None for exam ID {exam.get('id')}")
-                        sanitized_exam['date'] = None
-                    # Try validation again with sanitized data
-                    try:
-                        exams.append(ExamResponse.model_validate(sanitized_exam))
-                    except Exception as second_error:
-                        logger.error(f"[DEBUG] ExamService - Failed validation after sanitizing for exam ID {exam.get('id')}: {str(second_error)}")
-                        # Skip this exam rather than failing the entire request
+            # Convert to DTO response models with proper error handling
+            exams = self._to_exam_responses(exam_data)
             
             logger.info(f"[DEBUG] ExamService - Returning {len(exams)} exams after validation")
             return exams
@@ -240,6 +120,31 @@ class ExamService(IExamService):
             logger.error(f"[DEBUG] ExamService - Error in get_all_exams: {str(e)}")
             raise
     
+    async def stream_exams(self) -> AsyncIterator[ExamResponse]:
+        """Iterate over all exams without loading the whole list in memory
+        
+        Yields:
+            ExamResponse: Exams with subject, teacher and group details, ordered by ID
+        """
+        async for exam_data in self.exam_repository.stream_exams_with_details():
+            for exam in self._to_exam_responses([exam_data]):
+                yield exam
+    
+    async def get_exams_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[ExamResponse], Optional[str]]:
+        """Get one keyset page of exams with associated information
+        
+        Args:
+            limit (int): Page size
+            after (Optional[str]): Cursor returned with the previous page
+            sort_by (str): Sort key ('id' or 'date')
+            
+        Returns:
+            Tuple[List[ExamResponse], Optional[str]]: The exams of the page and the next cursor
+        """
+        exam_data, next_cursor = await self.exam_repository.get_exams_page(limit, after, sort_by)
+        return self._to_exam_responses(exam_data), next_cursor
+    
     async def get_exams_by_study_program(self, program_code: str) -> List[ExamResponse]:
         """Get exams filtered by study program
         
@@ -256,26 +161,7 @@ class ExamService(IExamService):
             exam_data = await self.exam_repository.get_exams_by_study_program(program_code)
             
             # Convert to DTO response models with proper error handling
-            exams = []
-            for exam in exam_data:
-                try:
-                    # If we encounter validation errors, we can try to sanitize the data
-                    exams.append(ExamResponse.model_validate(exam))
-                except Exception as validation_error:
-                    logger.warning(f"[DEBUG] ExamService - Validation error for exam ID {exam.get('id')}: {str(validation_error)}")
-                    # Try sanitizing the problematic fields
-                    sanitized_exam = exam.copy()
-                    # If date field is causing issues, convert explicitly to None
-                    if 'date' in sanitized_exam and sanitized_exam['date'] is not None:
-                        # Log the original date for debugging
-                        logger.info(f"[DEBUG] ExamService - Converting date from {sanitized_exam['date']} to None for exam ID {exam.get('id')}")
-                        sanitized_exam['date'] = None
-                    # Try validation again with sanitized data
-                    try:
-                        exams.append(ExamResponse.model_validate(sanitized_exam))
-                    except Exception as second_error:
-                        logger.error(f"[DEBUG] ExamService - Failed validation after sanitizing for exam ID {exam.get('id')}: {str(second_error)}")
-                        # Skip this exam rather than failing the entire request
+            exams = self._to_exam_responses(exam_data)
             
             logger.info(f"[DEBUG] ExamService - Returning {len(exams)} exams for program {program_code} after validation")
             return exams
@@ -300,26 +186,7 @@ class ExamService(IExamService):
             exam_data = await self.exam_repository.get_exams_by_teacher_id(teacher_id)
             
             # Convert to DTO response models with proper error handling
-            exams = []
-            for exam in exam_data:
-                try:
-                    # If we encounter validation errors, we can try to sanitize the data
-                    exams.append(ExamResponse.model_validate(exam))
-                except Exception as validation_error:
-                    logger.warning(f"[DEBUG] ExamService - Validation error for exam ID {exam.get('id')}: {str(validation_error)}")
-                    # Try sanitizing the problematic fields
-                    sanitized_exam = exam.copy()
-                    # If date field is causing issues, convert explicitly to None
-                    if 'date' in sanitized_exam and sanitized_exam['date'] is not None:
-                        # Log the original date for debugging
-                        logger.info(f"[DEBUG] ExamService - Converting date from {sanitized_exam['date']} to None for exam ID {exam.get('id')}")
-                        sanitized_exam['date'] = None
-                    # Try validation again with sanitized data
-                    try:
-                        exams.append(ExamResponse.model_validate(sanitized_exam))
-                    except Exception as second_error:
-                        logger.error(f"[DEBUG] ExamService - Failed validation after sanitizing for exam ID {exam.get('id')}: {str(second_error)}")
-                        # Skip this exam rather than failing the entire request
+            exams = self._to_exam_responses(exam_data)
             
             logger.info(f"[DEBUG] ExamService - Returning {len(exams)} exams for teacher {teacher_id} after validation")
             return exams
@@ -340,38 +207,74 @@ class ExamService(IExamService):
         logger.info(f"[DEBUG] ExamService - get_exams_by_group_id: {group_id}")
         
         try:
-            # First, get subject IDs for this group to identify relevant schedules
-            subject_ids = await self._get_subject_ids_for_group(group_id)
-            logger.info(f"[DEBUG] ExamService - Found {len(subject_ids)} subjects for group {group_id}")
-            
-            # Get exam data by mapping through schedules from the schedule service
-            exams = []
-            for subject_id in subject_ids:
-                # Get schedules from the schedule service rather than directly from repository
-                schedules = await self.schedule_service.get_schedules_by_subject_id(subject_id)
-                
-                # Map each schedule to an exam response with additional metadata
-                for schedule in schedules:
-                    try:
-                        # Get required related data (subject, teacher, group info)
-                        exam_data = await self._enrich_schedule_with_metadata(schedule, subject_id, group_id)
-                        
-                        # Process data before validation
-                        processed_exam = self._preprocess_exam_data(exam_data)
-                        
-                        # Create ExamResponse
-                        exams.append(ExamResponse.model_validate(processed_exam))
-                    except Exception as e:
-                        logger.error(f"[DEBUG] ExamService - Error processing schedule for subject {subject_id}: {str(e)}")
-                        # Skip this schedule rather than failing the entire request
-            
-            logger.info(f"[DEBUG] ExamService - Returning {len(exams)} exams for group {group_id} after processing")
+            # Schedules, subjects, teachers, groups and rooms are loaded in bulk by the repository
+            exam_data = await self.exam_repository.get_exams_by_group_id(group_id)
+            
+            # Convert to DTO response models with proper error handling
+            exams = self._to_exam_responses(exam_data)
+            
+            logger.info(f"[DEBUG] ExamService - Returning {len(exams)} exams for group {group_id} after validation")
             return exams
             
         except Exception as e:
             logger.error(f"[DEBUG] ExamService - Error in get_exams_by_group_id: {str(e)}")
             raise
     
+    async def get_teacher_dashboard(self, teacher_id: int, include_exams: bool = True,
+                                    exams_limit: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """Get dashboard data for a teacher
+        
+        The stats and the next exam are always aggregated in the database. The exam
+        lists, when requested, are loaded with one more query that returns at most
+        exams_limit exams per status; the stats hold the full counts.
+        
+        Args:
+            teacher_id (int): ID of the teacher
+            include_exams (bool): Whether to include the exam lists grouped by status
+            exams_limit (int): Maximum number of exams in each list
+            
+        Returns:
+            Dict[str, Any]: Dashboard data with stats, nextExam and, if requested,
+                scheduledExams, pendingExams, pendingProposals and rejectedExams
+        """
+        logger.info(f"[DEBUG] ExamService - get_teacher_dashboard: {teacher_id}")
+        
+        try:
+            summary = await self.exam_repository.get_teacher_dashboard_summary(teacher_id)
+            status_counts = summary["statusCounts"]
+            
+            next_exam = None
+            if summary["nextExam"] is not None:
+                next_exams = self._to_exam_responses([summary["nextExam"]])
+                next_exam = next_exams[0] if next_exams else None
+            
+            dashboard = {
+                "nextExam": next_exam,
+                "stats": {
+                    "totalSubjects": summary["totalSubjects"],
+                    "scheduledExams": status_counts.get("approved", 0),
+                    "pendingExams": status_counts.get("pending", 0),
+                    "pendingProposals": status_counts.get("proposed", 0),
+                    "rejectedExams": status_counts.get("rejected", 0)
+                }
+            }
+            
+            if include_exams:
+                exams_by_status = await self.exam_repository.get_teacher_exams_by_status(
+                    teacher_id, ["approved", "pending", "proposed", "rejected"], exams_limit
+                )
+                dashboard["scheduledExams"] = self._to_exam_responses(exams_by_status["approved"])
+                dashboard["pendingExams"] = self._to_exam_responses(exams_by_status["pending"])
+                dashboard["pendingProposals"] = self._to_exam_responses(exams_by_status["proposed"])
+                dashboard["rejectedExams"] = self._to_exam_responses(exams_by_status["rejected"])
+            
+            logger.info(f"[DEBUG] ExamService - Dashboard stats for teacher {teacher_id}: {dashboard['stats']}")
+            return dashboard
+            
+        except Exception as e:
+            logger.error(f"[DEBUG] ExamService - Error in get_teacher_dashboard: {str(e)}")
+            raise
+    
     async def update_exam(self, exam_id: int, exam_data: Dict[str, Any]) -> ExamResponse:
         """Update an exam with new information
         
@@ -387,6 +290,7 @@ class ExamService(IExamService):
         try:
             # Update exam in repository
             updated_exam_data = await self.exam_repository.update_exam(exam_id, exam_data)
+            self._update_occupancy(updated_exam_data)
             
             # Convert to DTO response model with sanitization if needed
             try:
@@ -459,6 +363,7 @@ class ExamService(IExamService):
                 
             # Create the exam proposal
             exam_data = await self.exam_repository.create_exam(proposal_data)
+            self._update_occupancy(exam_data)
             
             # Preprocess data before validation to handle date objects
             processed_exam_data = self._preprocess_exam_data(exam_data)
@@ -598,6 +503,90 @@ class ExamService(IExamService):
         # TODO: In the future, implement actual date range validation
         return True
         
+    def _build_exam_slots(self, request: ExamAutoScheduleRequest) -> List[Tuple[time, time]]:
+        """Split the exam day into consecutive slots of the requested duration"""
+        slots = []
+        start = datetime.combine(date.min, request.dayStartTime)
+        day_end = datetime.combine(date.min, request.dayEndTime)
+        duration = timedelta(hours=request.examDurationHours)
+        while start + duration <= day_end:
+            slots.append((start.time(), (start + duration).time()))
+            start += duration
+        return slots
+        
+    async def auto_schedule_exams(self, request: ExamAutoScheduleRequest) -> ExamAutoScheduleResponse:
+        """Assign a date, time slot and rooms to every pending exam of the current exam period
+        
+        Approved and proposed exams inside the period are kept where they are and their
+        groups, teachers, assistants and rooms are treated as booked. The pending exams
+        are placed by ExamTimetableSolver and saved in bulk with the 'proposed' status,
+        unless request.dryRun is set.
+        
+        Args:
+            request (ExamAutoScheduleRequest): Time slot layout and constraints to use
+            
+        Returns:
+            ExamAutoScheduleResponse: The assignments made and the exams that could not be placed
+            
+        Raises:
+            ValueError: If no exam period is configured or no time slot fits in a day
+        """
+        logger.info(f"[DEBUG] ExamService - auto_schedule_exams: {request.model_dump()}")
+        
+        try:
+            config = await self.config_service.get_current_config() if self.config_service else None
+            if not config:
+                raise ValueError("No exam period is configured")
+            
+            period_start = config.startDate.date()
+            period_end = config.endDate.date()
+            days = [
+                period_start + timedelta(days=offset)
+                for offset in range((period_end - period_start).days + 1)
+                if not (request.excludeWeekends and (period_start + timedelta(days=offset)).weekday() >= 5)
+            ]
+            slots = self._build_exam_slots(request)
+            if not days or not slots:
+                raise ValueError("The exam period has no day or time slot to schedule exams in")
+            
+            rooms = await self.room_service.get_all_rooms()
+            exams = await self.exam_repository.get_exams_for_timetable(["pending", "proposed", "approved"])
+            
+            solver = ExamTimetableSolver(
+                rooms=[(room.id, room.capacity) for room in rooms if room.isActive],
+                days=days,
+                slots=slots,
+                group_size=request.groupSize,
+                max_rooms_per_exam=request.maxRoomsPerExam,
+                max_exams_per_group_per_day=request.maxExamsPerGroupPerDay
+            )
+            pending_exams = []
+            for exam in exams:
+                if exam["status"] == "pending":
+                    pending_exams.append(exam)
+                else:
+                    solver.add_fixed_exam(
+                        exam["groupId"], [exam["teacherId"], *exam["assistantIds"]], exam["roomIds"],
+                        exam["date"], exam["startTime"], exam["endTime"]
+                    )
+            
+            logger.info(f"[DEBUG] ExamService - Scheduling {len(pending_exams)} pending exams over {len(days)} days x {len(slots)} slots")
+            assignments, unscheduled = solver.solve(pending_exams)
+            
+            if not request.dryRun:
+                updated = await self.exam_repository.bulk_propose_exams(assignments)
+                logger.info(f"[DEBUG] ExamService - Saved {updated} proposed exams")
+            
+            return ExamAutoScheduleResponse(
+                assignments=assignments,
+                unscheduled=unscheduled,
+                dryRun=request.dryRun
+            )
+            
+        except Exception as e:
+            logger.error(f"[DEBUG] ExamService - Error in auto_schedule_exams: {str(e)}")
+            raise
+        
     async def export_exams_to_pdf(self) -> bytes:
         """Export the list of all exams to PDF format
         
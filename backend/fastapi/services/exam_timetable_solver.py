@@ -0,0 +1,219 @@
+from bisect import bisect_left, insort
+from datetime import date, time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+NO_TIME_SLOT = "No time slot where the group, teacher and assistants are all free"
+NO_ROOM_CAPACITY = "Not enough free room capacity in any time slot where the group, teacher and assistants are free"
+
+
+class ExamTimetableSolver:
+    """Greedy heuristic that assigns a date, a time slot and rooms to every exam.
+
+    The exam period is split into discrete slots (day x time window). Exams are placed
+    one at a time, most constrained first (the ones sharing a group, teacher or
+    assistant with the most other exams), into the feasible slot that keeps the
+    group's exams furthest apart and the days evenly loaded. A slot is feasible when
+    the group and every teacher/assistant of the exam are free in it and the free
+    rooms can seat the group using at most max_rooms_per_exam rooms.
+
+    All bookkeeping is done with dictionaries and sorted lists, so one placement costs
+    roughly O(slots * (people + log rooms)) and a full faculty is solved in seconds.
+    """
+
+    def __init__(self, rooms: Iterable[Tuple[int, int]], days: List[date], slots: List[Tuple[time, time]],
+                 group_size: int, max_rooms_per_exam: int = 3, max_exams_per_group_per_day: int = 1):
+        """Initialize the solver for one exam period
+
+        Args:
+            rooms: (room_id, capacity) pairs of the rooms that can host exams
+            days: Dates of the exam period, in order
+            slots: (start_time, end_time) windows used on every day, in order
+            group_size: Number of seats an exam needs
+            max_rooms_per_exam: Maximum number of rooms one exam may be split across
+            max_exams_per_group_per_day: Maximum number of exams a group takes on one day
+        """
+        self.days = days
+        self.slots = slots
+        self.group_size = group_size
+        self.max_rooms_per_exam = max_rooms_per_exam
+        self.max_exams_per_group_per_day = max_exams_per_group_per_day
+
+        self._capacity = {room_id: capacity or 0 for room_id, capacity in rooms}
+        self._day_index = {day: index for index, day in enumerate(days)}
+        slot_count = len(days) * len(slots)
+
+        # Free rooms of every slot as a list sorted by (capacity, room_id)
+        all_rooms = sorted((capacity, room_id) for room_id, capacity in self._capacity.items())
+        self._free_rooms: List[List[Tuple[int, int]]] = [list(all_rooms) for _ in range(slot_count)]
+        self._person_slots: Dict[int, Set[int]] = {}
+        self._group_slots: Dict[int, Set[int]] = {}
+        self._group_days: Dict[int, List[int]] = {}
+        self._day_load = [0] * len(days)
+
+    def _slot_date_and_times(self, slot: int) -> Tuple[date, time, time]:
+        day_index, slot_index = divmod(slot, len(self.slots))
+        start_time, end_time = self.slots[slot_index]
+        return self.days[day_index], start_time, end_time
+
+    def _overlapping_slots(self, exam_date: date, start_time: time, end_time: time) -> List[int]:
+        day_index = self._day_index.get(exam_date)
+        if day_index is None:
+            return []
+        base = day_index * len(self.slots)
+        return [
+            base + slot_index
+            for slot_index, (slot_start, slot_end) in enumerate(self.slots)
+            if slot_start < end_time and start_time < slot_end
+        ]
+
+    def _book(self, slots: List[int], group_id: Optional[int], person_ids: Iterable[int],
+              room_ids: Iterable[int]) -> None:
+        person_ids = list(person_ids)
+        room_ids = list(room_ids)
+        for slot in slots:
+            if group_id is not None:
+                self._group_slots.setdefault(group_id, set()).add(slot)
+            for person_id in person_ids:
+                self._person_slots.setdefault(person_id, set()).add(slot)
+            free_rooms = self._free_rooms[slot]
+            for room_id in room_ids:
+                entry = (self._capacity.get(room_id, 0), room_id)
+                position = bisect_left(free_rooms, entry)
+                if position < len(free_rooms) and free_rooms[position] == entry:
+                    del free_rooms[position]
+        if group_id is not None and slots:
+            day_index = slots[0] // len(self.slots)
+            insort(self._group_days.setdefault(group_id, []), day_index)
+            self._day_load[day_index] += 1
+
+    def add_fixed_exam(self, group_id: Optional[int], person_ids: Iterable[int], room_ids: Iterable[int],
+                       exam_date: Optional[date], start_time: Optional[time], end_time: Optional[time]) -> None:
+        """Reserve the slots, people and rooms of an exam that is already placed
+
+        Args:
+            group_id: Group taking the exam
+            person_ids: Teacher and assistant IDs of the exam
+            room_ids: Rooms booked by the exam
+            exam_date: Date of the exam
+            start_time: Start time of the exam
+            end_time: End time of the exam
+        """
+        if exam_date is None or start_time is None or end_time is None:
+            return
+        self._book(self._overlapping_slots(exam_date, start_time, end_time), group_id, person_ids, room_ids)
+
+    def _pick_rooms(self, slot: int) -> Optional[List[int]]:
+        """Pick the rooms for an exam in a slot, or None if the group does not fit"""
+        free_rooms = self._free_rooms[slot]
+        # Best fit: the smallest single room that seats the whole group
+        position = bisect_left(free_rooms, (self.group_size, -1))
+        if position < len(free_rooms):
+            return [free_rooms[position][1]]
+        # Otherwise split the group across the largest free rooms
+        picked = []
+        seats = 0
+        for capacity, room_id in reversed(free_rooms[-self.max_rooms_per_exam:]):
+            picked.append(room_id)
+            seats += capacity
+            if seats >= self.group_size:
+                return picked
+        return None
+
+    def _day_gap(self, group_id: int, day_index: int) -> int:
+        """Distance in days from day_index to the group's nearest booked exam"""
+        group_days = self._group_days.get(group_id)
+        if not group_days:
+            return len(self.days)
+        position = bisect_left(group_days, day_index)
+        gap = len(self.days)
+        if position < len(group_days):
+            gap = min(gap, group_days[position] - day_index)
+        if position > 0:
+            gap = min(gap, day_index - group_days[position - 1])
+        return gap
+
+    def solve(self, exams: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Assign a slot and rooms to every exam that can be placed
+
+        Args:
+            exams: Exams to place, each with scheduleId, subjectId, groupId, teacherId and assistantIds
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: The assignments (scheduleId, date,
+            startTime, endTime, roomIds) and the exams that could not be placed (scheduleId,
+            subjectId, reason)
+        """
+        slots_per_day = len(self.slots)
+        slot_count = len(self.days) * slots_per_day
+
+        def people_of(exam: Dict[str, Any]) -> Set[int]:
+            people = {exam["teacherId"]} if exam.get("teacherId") is not None else set()
+            people.update(exam.get("assistantIds") or [])
+            return people
+
+        # Most constrained first: exams whose group and people have the most exams to place
+        group_demand: Dict[int, int] = {}
+        person_demand: Dict[int, int] = {}
+        for exam in exams:
+            group_demand[exam["groupId"]] = group_demand.get(exam["groupId"], 0) + 1
+            for person_id in people_of(exam):
+                person_demand[person_id] = person_demand.get(person_id, 0) + 1
+        ordered = sorted(
+            exams,
+            key=lambda exam: (
+                group_demand[exam["groupId"]] + sum(person_demand[p] for p in people_of(exam)),
+                len(exam.get("assistantIds") or []),
+            ),
+            reverse=True
+        )
+
+        assignments = []
+        unscheduled = []
+        for exam in ordered:
+            group_id = exam["groupId"]
+            people = people_of(exam)
+            group_slots = self._group_slots.get(group_id, set())
+            busy_slots = [self._person_slots[p] for p in people if p in self._person_slots]
+
+            best = None
+            people_free_somewhere = False
+            for slot in range(slot_count):
+                if slot in group_slots or any(slot in busy for busy in busy_slots):
+                    continue
+                day_index = slot // slots_per_day
+                group_days = self._group_days.get(group_id, [])
+                if self.max_exams_per_group_per_day and \
+                        group_days.count(day_index) >= self.max_exams_per_group_per_day:
+                    continue
+                people_free_somewhere = True
+                score = (-self._day_gap(group_id, day_index), self._day_load[day_index], slot)
+                if best is not None and score >= best[0]:
+                    continue
+                room_ids = self._pick_rooms(slot)
+                if room_ids is not None:
+                    best = (score, slot, room_ids)
+
+            if best is None:
+                unscheduled.append({
+                    "scheduleId": exam["scheduleId"],
+                    "subjectId": exam.get("subjectId"),
+                    "reason": NO_ROOM_CAPACITY if people_free_somewhere else NO_TIME_SLOT
+                })
+                continue
+
+            _, slot, room_ids = best
+            self._book([slot], group_id, people, room_ids)
+            exam_date, start_time, end_time = self._slot_date_and_times(slot)
+            assignments.append({
+                "scheduleId": exam["scheduleId"],
+                "date": exam_date,
+                "startTime": start_time,
+                "endTime": end_time,
+                "roomIds": room_ids
+            })
+
+        logger.info(f"[DEBUG] ExamTimetableSolver - Placed {len(assignments)} exams, {len(unscheduled)} left unscheduled")
+        return assignments, unscheduled
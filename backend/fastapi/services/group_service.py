@@ -1,9 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 
 from models.group import Group
 from models.DTOs.group_dto import GroupCreate, GroupUpdate, GroupResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 from repositories.abstract.group_repository_interface import IGroupRepository
 from services.abstract.group_service_interface import IGroupService
+from services.bulk_import import validate_rows, build_bulk_response
+from services.sync_diff import MAX_SYNC_ROWS, diff_snapshot, build_sync_response
 
 class GroupService(IGroupService):
     def __init__(self, group_repository: IGroupRepository):
@@ -19,19 +22,69 @@ class GroupService(IGroupService):
             return GroupResponse.model_validate(group)
         return None
 
-    async def create_group(self, group_data: GroupCreate) -> GroupResponse:
-        # Create new group object
-        group = Group(
+    def _build_group(self, group_data: GroupCreate) -> Group:
+        return Group(
             name=group_data.name,
             studyYear=group_data.studyYear,
             specializationShortName=group_data.specializationShortName,
             groupIds=group_data.groupIds
         )
+
+    async def create_group(self, group_data: GroupCreate) -> GroupResponse:
+        # Create new group object
+        group = self._build_group(group_data)
         
         # Save to database
         created_group = await self.group_repository.create(group)
         return GroupResponse.model_validate(created_group)
 
+    async def create_groups_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        """Validate many groups and insert the valid ones in one transaction.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Groups in the GroupCreate format
+            
+        Returns:
+            BulkCreateResponse: The ID or the validation error of every row
+            
+        Raises:
+            ValueError: If there are more rows than one bulk request allows
+        """
+        valid, errors = validate_rows(rows, GroupCreate)
+        ids = await self.group_repository.create_many([self._build_group(data) for _, data in valid]) if valid else []
+        return build_bulk_response([(index, group_id) for (index, _), group_id in zip(valid, ids)], errors)
+
+    async def sync_groups_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored groups match a full snapshot of the groups.
+        
+        Groups are matched on (name, studyYear, specializationShortName). Only the rows
+        that differ are written, and groups missing from the snapshot are deactivated
+        instead of deleted so their users, subjects and exams are kept.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Every group, in the GroupCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated groups
+            
+        Raises:
+            ValueError: If the snapshot has more rows than a sync request allows
+        """
+        valid, errors = validate_rows(rows, GroupCreate, MAX_SYNC_ROWS)
+        existing = await self.group_repository.get_all(include_inactive=True)
+        diff = diff_snapshot(
+            valid, existing,
+            key=lambda group: (group.name, group.studyYear, group.specializationShortName),
+            fields=("groupIds",)
+        )
+        diff.errors.extend(errors)
+        ids = await self.group_repository.apply_sync_changes(
+            [self._build_group(data) for _, data in diff.inserts],
+            [(group_id, changes) for _, group_id, changes in diff.updates],
+            diff.deactivate_ids
+        )
+        return build_sync_response(diff, ids)
+
     async def update_group(self, group_id: int, group_data: GroupUpdate) -> Optional[GroupResponse]:
         group = await self.group_repository.get_by_id(group_id)
         if not group:
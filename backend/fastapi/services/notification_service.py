@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, AsyncIterator
 from datetime import datetime
 
 from models.notification import Notification
@@ -17,6 +17,15 @@ class NotificationService(INotificationService):
         notifications = await self.notification_repository.get_all()
         return [NotificationResponse.model_validate(notification) for notification in notifications]
 
+    async def stream_notifications(self) -> AsyncIterator[NotificationResponse]:
+        async for notification in self.notification_repository.stream_all():
+            yield NotificationResponse.model_validate(notification)
+
+    async def get_notifications_page(self, limit: int, after: Optional[str] = None,
+                                     sort_by: str = "id") -> Tuple[List[NotificationResponse], Optional[str]]:
+        notifications, next_cursor = await self.notification_repository.get_page(limit, after, sort_by)
+        return [NotificationResponse.model_validate(notification) for notification in notifications], next_cursor
+
     async def get_notification_by_id(self, notification_id: int) -> Optional[NotificationResponse]:
         notification = await self.notification_repository.get_by_id(notification_id)
         if notification:
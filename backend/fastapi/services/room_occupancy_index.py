@@ -0,0 +1,174 @@
+from bisect import bisect_left, insort
+from datetime import date, time
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import logging
+
+from repositories.abstract.schedule_repository_interface import IScheduleRepository
+
+logger = logging.getLogger(__name__)
+
+
+class _IntervalIndex:
+    """Time intervals booked in one room on one date.
+
+    Intervals are kept sorted by start time together with a running maximum of the
+    end times. An overlap query finds the last interval starting before the window
+    ends with a binary search and walks back only while the running maximum still
+    reaches into the window, so "is this room busy" is answered in O(log n).
+    """
+
+    def __init__(self):
+        self._intervals: List[Tuple[time, time, int]] = []  # (start, end, schedule_id)
+        self._max_ends: List[time] = []
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def _rebuild_max_ends(self, start_index: int) -> None:
+        del self._max_ends[start_index:]
+        running = self._max_ends[start_index - 1] if start_index > 0 else None
+        for _, end, _ in self._intervals[start_index:]:
+            running = end if running is None or end > running else running
+            self._max_ends.append(running)
+
+    def add(self, start: time, end: time, schedule_id: int) -> None:
+        entry = (start, end, schedule_id)
+        insort(self._intervals, entry)
+        self._rebuild_max_ends(bisect_left(self._intervals, entry))
+
+    def remove(self, schedule_id: int) -> None:
+        for index, (_, _, existing_id) in enumerate(self._intervals):
+            if existing_id == schedule_id:
+                del self._intervals[index]
+                self._rebuild_max_ends(index)
+                return
+
+    def overlapping(self, start: time, end: time) -> List[int]:
+        """Get the IDs of schedules whose interval overlaps [start, end)."""
+        # Intervals in [0, index) start before the window ends
+        index = bisect_left(self._intervals, (end,))
+        result = []
+        for position in range(index - 1, -1, -1):
+            if self._max_ends[position] <= start:
+                # No earlier interval reaches into the window
+                break
+            interval_start, interval_end, schedule_id = self._intervals[position]
+            if interval_end > start:
+                result.append(schedule_id)
+        return result
+
+
+class RoomOccupancyIndex:
+    """In-process index of approved exams keyed by (room, date).
+
+    The index is built lazily from the approved schedules on first use and kept up
+    to date by the services that approve, move, reject or delete exams. Bulk
+    operations that bypass those paths call invalidate() so the next lookup reloads
+    it from the database.
+    """
+
+    def __init__(self):
+        self._rooms: Dict[Tuple[int, date], _IntervalIndex] = {}
+        self._schedules: Dict[int, Tuple[List[int], date, time, time]] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    async def ensure_loaded(self, schedule_repository: IScheduleRepository) -> None:
+        """Build the index from the approved schedules if it is not loaded yet.
+
+        Args:
+            schedule_repository: Repository used to load the approved schedules
+        """
+        if self._loaded:
+            return
+        async with self._lock:
+            if self._loaded:
+                return
+            schedules = await schedule_repository.get_by_status("approved")
+            self._rooms = {}
+            self._schedules = {}
+            for schedule in schedules:
+                self._add(schedule.id, schedule.get_room_ids(), schedule.date, schedule.startTime, schedule.endTime)
+            self._loaded = True
+            logger.info(f"[DEBUG] RoomOccupancyIndex - Loaded {len(self._schedules)} approved schedules")
+
+    def invalidate(self) -> None:
+        """Drop the index so it is rebuilt from the database on next use."""
+        self._rooms = {}
+        self._schedules = {}
+        self._loaded = False
+
+    def _add(self, schedule_id: int, room_ids: Iterable[int], exam_date: Optional[date],
+             start_time: Optional[time], end_time: Optional[time]) -> None:
+        room_ids = list(room_ids or [])
+        if not room_ids or exam_date is None or start_time is None or end_time is None:
+            return
+        for room_id in room_ids:
+            self._rooms.setdefault((room_id, exam_date), _IntervalIndex()).add(start_time, end_time, schedule_id)
+        self._schedules[schedule_id] = (room_ids, exam_date, start_time, end_time)
+
+    def remove_schedule(self, schedule_id: int) -> None:
+        """Remove a schedule from the index.
+
+        Args:
+            schedule_id: ID of the schedule to remove
+        """
+        entry = self._schedules.pop(schedule_id, None)
+        if entry is None:
+            return
+        room_ids, exam_date, _, _ = entry
+        for room_id in room_ids:
+            key = (room_id, exam_date)
+            intervals = self._rooms.get(key)
+            if intervals is not None:
+                intervals.remove(schedule_id)
+                if not intervals:
+                    del self._rooms[key]
+
+    def update_schedule(self, schedule_id: int, status: Optional[str], room_ids: Optional[List[int]],
+                        exam_date: Optional[date], start_time: Optional[time], end_time: Optional[time]) -> None:
+        """Apply the current state of a schedule to the index.
+
+        Approved schedules are (re)inserted with their rooms and time window, any other
+        status removes the schedule. Does nothing until the index has been loaded.
+
+        Args:
+            schedule_id: ID of the schedule
+            status: Current status of the schedule
+            room_ids: Rooms booked by the schedule
+            exam_date: Date of the exam
+            start_time: Start time of the exam
+            end_time: End time of the exam
+        """
+        if not self._loaded:
+            return
+        self.remove_schedule(schedule_id)
+        if status and status.lower() == "approved":
+            self._add(schedule_id, room_ids, exam_date, start_time, end_time)
+
+    def get_busy_schedule_ids(self, room_id: int, exam_date: date, start_time: time, end_time: time,
+                              exclude_schedule_id: Optional[int] = None) -> List[int]:
+        """Get the approved schedules that occupy a room during a time window.
+
+        Args:
+            room_id: ID of the room
+            exam_date: Date to check
+            start_time: Start of the time window
+            end_time: End of the time window
+            exclude_schedule_id: Schedule to ignore, usually the one being edited
+
+        Returns:
+            List[int]: IDs of the overlapping schedules
+        """
+        intervals = self._rooms.get((room_id, exam_date))
+        if intervals is None:
+            return []
+        return [
+            schedule_id for schedule_id in intervals.overlapping(start_time, end_time)
+            if schedule_id != exclude_schedule_id
+        ]
@@ -1,9 +1,13 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple, Dict, Any
+from datetime import date, time
 
 from models.room import Room
 from models.DTOs.room_dto import RoomCreate, RoomUpdate, RoomResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, SyncDiffResponse
 from repositories.abstract.room_repository_interface import IRoomRepository
 from services.abstract.room_service_interface import IRoomService
+from services.bulk_import import validate_rows, build_bulk_response
+from services.sync_diff import MAX_SYNC_ROWS, diff_snapshot, build_sync_response
 
 class RoomService(IRoomService):
     def __init__(self, room_repository: IRoomRepository):
@@ -13,6 +17,11 @@ class RoomService(IRoomService):
         rooms = await self.room_repository.get_all()
         return [RoomResponse.model_validate(room) for room in rooms]
 
+    async def get_rooms_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[RoomResponse], Optional[str]]:
+        rooms, next_cursor = await self.room_repository.get_page(limit, after, sort_by)
+        return [RoomResponse.model_validate(room) for room in rooms], next_cursor
+
     async def get_room_by_id(self, room_id: int) -> Optional[RoomResponse]:
         room = await self.room_repository.get_by_id(room_id)
         if room:
@@ -23,20 +32,93 @@ class RoomService(IRoomService):
         rooms = await self.room_repository.get_by_building(building_name)
         return [RoomResponse.model_validate(room) for room in rooms]
 
-    async def create_room(self, room_data: RoomCreate) -> RoomResponse:
-        # Create new room object
-        room = Room(
+    async def get_free_rooms(self, schedule_date: date, start_time: time, end_time: time,
+                             min_capacity: int = 0, min_computers: int = 0,
+                             building_name: Optional[str] = None) -> List[RoomResponse]:
+        """Get the rooms that match the constraints and are free during a time window.
+        
+        Args:
+            schedule_date (date): The date to check
+            start_time (time): Start of the time window
+            end_time (time): End of the time window
+            min_capacity (int): Minimum room capacity
+            min_computers (int): Minimum number of computers
+            building_name (Optional[str]): Restrict the search to one building
+            
+        Returns:
+            List[RoomResponse]: Free rooms ordered by capacity, smallest first
+        """
+        if start_time >= end_time:
+            raise ValueError("Start time must be before end time")
+            
+        rooms = await self.room_repository.get_free_rooms(
+            schedule_date, start_time, end_time, min_capacity, min_computers, building_name
+        )
+        return [RoomResponse.model_validate(room) for room in rooms]
+
+    def _build_room(self, room_data: RoomCreate) -> Room:
+        return Room(
             name=room_data.name,
             shortName=room_data.shortName,
             buildingName=room_data.buildingName,
             capacity=room_data.capacity,
             computers=room_data.computers
         )
+
+    async def create_room(self, room_data: RoomCreate) -> RoomResponse:
+        # Create new room object
+        room = self._build_room(room_data)
         
         # Save to database
         created_room = await self.room_repository.create(room)
         return RoomResponse.model_validate(created_room)
 
+    async def create_rooms_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        """Validate many rooms and insert the valid ones in one transaction.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Rooms in the RoomCreate format
+            
+        Returns:
+            BulkCreateResponse: The ID or the validation error of every row
+            
+        Raises:
+            ValueError: If there are more rows than one bulk request allows
+        """
+        valid, errors = validate_rows(rows, RoomCreate)
+        ids = await self.room_repository.create_many([self._build_room(data) for _, data in valid]) if valid else []
+        return build_bulk_response([(index, room_id) for (index, _), room_id in zip(valid, ids)], errors)
+
+    async def sync_rooms_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored rooms match a full snapshot of the rooms.
+        
+        Rooms are matched on shortName. Rooms missing from the snapshot are deactivated,
+        which keeps them out of free-room searches and automatic exam scheduling.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Every room, in the RoomCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated rooms
+            
+        Raises:
+            ValueError: If the snapshot has more rows than a sync request allows
+        """
+        valid, errors = validate_rows(rows, RoomCreate, MAX_SYNC_ROWS)
+        existing = await self.room_repository.get_all()
+        diff = diff_snapshot(
+            valid, existing,
+            key=lambda room: room.shortName,
+            fields=("name", "buildingName", "capacity", "computers")
+        )
+        diff.errors.extend(errors)
+        ids = await self.room_repository.apply_sync_changes(
+            [self._build_room(data) for _, data in diff.inserts],
+            [(room_id, changes) for _, room_id, changes in diff.updates],
+            diff.deactivate_ids
+        )
+        return build_sync_response(diff, ids)
+
     async def update_room(self, room_id: int, room_data: RoomUpdate) -> Optional[RoomResponse]:
         room = await self.room_repository.get_by_id(room_id)
         if not room:
@@ -1,9 +1,14 @@
-from typing import List, Optional, Tuple, Dict, Any, Set
+from typing import List, Optional, Tuple, Dict, Any, Set, AsyncIterator
 from datetime import date, time
 import logging
 
+from fastapi import BackgroundTasks
+
 from models.schedule import Schedule
-from models.DTOs.schedule_dto import ScheduleCreate, ScheduleUpdate, ScheduleResponse
+from models.DTOs.schedule_dto import (
+    ScheduleCreate, ScheduleUpdate, ScheduleResponse,
+    ScheduleBulkStatusUpdate, ScheduleBulkStatusResponse, ScheduleBulkSkipped
+)
 from models.DTOs.user_dto import UserResponse
 
 logger = logging.getLogger(__name__)
@@ -14,6 +19,7 @@ from repositories.abstract.room_repository_interface import IRoomRepository
 from repositories.abstract.group_repository_interface import IGroupRepository
 from services.abstract.email_service_interface import IEmailService
 from services.abstract.schedule_service_interface import IScheduleService
+from services.room_occupancy_index import RoomOccupancyIndex
 
 class ScheduleService(IScheduleService):
     # Define the permitted status values for exams - English only
@@ -26,18 +32,37 @@ class ScheduleService(IScheduleService):
     
     def __init__(self, schedule_repository: IScheduleRepository, subject_repository: ISubjectRepository,
                  user_repository: IUserRepository, room_repository: IRoomRepository,
-                 group_repository: IGroupRepository, email_service: Optional[IEmailService] = None):
+                 group_repository: IGroupRepository, email_service: Optional[IEmailService] = None,
+                 occupancy_index: Optional[RoomOccupancyIndex] = None):
         self.schedule_repository = schedule_repository
         self.subject_repository = subject_repository
         self.user_repository = user_repository
         self.room_repository = room_repository
         self.group_repository = group_repository
         self.email_service = email_service
+        self.occupancy_index = occupancy_index
+
+    def _update_occupancy(self, schedule: Schedule) -> None:
+        """Reflect a saved schedule in the room occupancy index, if one is configured."""
+        if self.occupancy_index:
+            self.occupancy_index.update_schedule(
+                schedule.id, schedule.status, schedule.get_room_ids(),
+                schedule.date, schedule.startTime, schedule.endTime
+            )
 
     async def get_all_schedules(self) -> List[ScheduleResponse]:
         schedules = await self.schedule_repository.get_all()
         return [ScheduleResponse.model_validate(schedule) for schedule in schedules]
 
+    async def stream_schedules(self) -> AsyncIterator[ScheduleResponse]:
+        async for schedule in self.schedule_repository.stream_all():
+            yield ScheduleResponse.model_validate(schedule)
+
+    async def get_schedules_page(self, limit: int, after: Optional[str] = None,
+                                 sort_by: str = "id") -> Tuple[List[ScheduleResponse], Optional[str]]:
+        schedules, next_cursor = await self.schedule_repository.get_page(limit, after, sort_by)
+        return [ScheduleResponse.model_validate(schedule) for schedule in schedules], next_cursor
+
     async def get_schedule_by_id(self, schedule_id: int) -> Optional[ScheduleResponse]:
         schedule = await self.schedule_repository.get_by_id(schedule_id)
         if schedule:
@@ -245,6 +270,8 @@ class ScheduleService(IScheduleService):
         logger.info("[DEBUG] Service - delete_all_schedules: Starting execution")
         try:
             deleted_count = await self.schedule_repository.delete_all_schedules()
+            if self.occupancy_index:
+                self.occupancy_index.invalidate()
             logger.info(f"[DEBUG] Service - Deleted {deleted_count} schedules")
             return deleted_count
         except Exception as e:
@@ -263,53 +290,47 @@ class ScheduleService(IScheduleService):
         logger.info("[DEBUG] Service - populate_schedules_from_subjects: Starting execution")
         try:
             stats = await self.schedule_repository.populate_from_subjects()
+            if self.occupancy_index:
+                self.occupancy_index.invalidate()
             logger.info(f"[DEBUG] Service - Populated schedules from subjects: "
                         f"Created {stats['created']} schedules, {stats['errors']} errors")
             return stats
         except Exception as e:
             logger.error(f"[DEBUG] Service - Error populating schedules: {str(e)}")
             raise
+
+    async def populate_missing_schedules(self) -> Dict[str, Any]:
+        """Create preliminary schedules only for the active subjects that have none
         
-    async def get_schedules_by_group_id(self, group_id: int) -> List[ScheduleResponse]:
-        # Since we don't have a direct relationship to groups in the Schedule model,
-        # we need to get all schedules and filter them by checking the group_id relationship
-        # through the related subjects
-        all_schedules = await self.schedule_repository.get_all()
-        result_schedules = []
+        Used by the incremental sync, which keeps the schedules of existing subjects.
         
-        for schedule in all_schedules:
-            subject = await self.subject_repository.get_by_id(schedule.subjectId)
-            if subject and subject.groupId == group_id:
-                result_schedules.append(schedule)
-                
-        return [ScheduleResponse.model_validate(schedule) for schedule in result_schedules]
-    
-    async def get_schedules_by_teacher_id(self, teacher_id: int) -> List[ScheduleResponse]:
-        # Get all schedules where the subject's teacher is the specified teacher_id
-        all_schedules = await self.schedule_repository.get_all()
-        result_schedules = []
+        Returns:
+            Dict[str, Any]: Statistics about the population process
+        """
+        stats = await self.schedule_repository.populate_missing_from_subjects()
+        if self.occupancy_index and stats["created"]:
+            self.occupancy_index.invalidate()
+        return stats
         
-        logger.info(f"Processing schedules for teacher_id={teacher_id}, found {len(all_schedules)} total schedules")
+    def _to_response_with_group(self, schedule: Schedule) -> ScheduleResponse:
+        """Build a response for a schedule loaded with its subject and group."""
+        schedule_dict = {c.name: getattr(schedule, c.name) for c in schedule.__table__.columns}
+        group = schedule.subject.group if schedule.subject else None
+        if group:
+            schedule_dict['groupId'] = group.id
+            schedule_dict['groupName'] = group.name
+        return ScheduleResponse.model_validate(schedule_dict)
         
-        for schedule in all_schedules:
-            subject = await self.subject_repository.get_by_id(schedule.subjectId)
-            if subject and subject.teacherId == teacher_id:
-                # Get the group information for this subject
-                group = await self.group_repository.get_by_id(subject.groupId) if subject.groupId else None
-                
-                # Create a dict from the schedule to be able to add additional fields
-                schedule_dict = {**schedule.__dict__}
-                if group:
-                    logger.info(f"Adding group data to schedule {schedule.id}: groupId={group.id}, groupName={group.name}")
-                    schedule_dict['groupId'] = group.id
-                    schedule_dict['groupName'] = group.name
-                else:
-                    logger.warning(f"No group found for schedule {schedule.id}, subject {schedule.subjectId} with groupId {subject.groupId if subject else None}")
-                
-                result_schedules.append(schedule_dict)
-                
-        # Convert the enhanced dictionaries to ScheduleResponse objects
-        return [ScheduleResponse.model_validate(schedule_data) for schedule_data in result_schedules]
+    async def get_schedules_by_group_id(self, group_id: int) -> List[ScheduleResponse]:
+        # Schedules are filtered through their subject's group in a single joined query
+        schedules = await self.schedule_repository.get_by_group_id(group_id)
+        return [self._to_response_with_group(schedule) for schedule in schedules]
+    
+    async def get_schedules_by_teacher_id(self, teacher_id: int) -> List[ScheduleResponse]:
+        # Subject and group come from the same joined query as the schedules
+        schedules = await self.schedule_repository.get_by_teacher_id(teacher_id)
+        logger.info(f"Found {len(schedules)} schedules for teacher_id={teacher_id}")
+        return [self._to_response_with_group(schedule) for schedule in schedules]
         
     async def validate_subject_id(self, subject_id: int) -> Tuple[bool, Optional[str]]:
         """Validates if the subject_id exists.
@@ -488,8 +509,44 @@ class ScheduleService(IScheduleService):
         
         # Save to database
         created_schedule = await self.schedule_repository.create(schedule)
+        self._update_occupancy(created_schedule)
         return ScheduleResponse.model_validate(created_schedule)
 
+    async def _find_room_conflicts(self, schedule_id: int, room_ids: List[int], date: date, start_time: time, end_time: time) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Compute room conflict messages and details from a single query.
+        
+        Args:
+            schedule_id: The ID of the current schedule (to exclude from conflict check)
+            room_ids: List of room IDs to check for conflicts
+            date: The date of the exam
+            start_time: Start time of the exam
+            end_time: End time of the exam
+            
+        Returns:
+            Tuple of (conflict_messages, conflict_details)
+        """
+        # Always asked from the database: the occupancy index of this process does not see
+        # approvals made by other workers, so it cannot prove that a room is free
+        room_conflicts = await self.schedule_repository.get_room_conflicts(
+            date, start_time, end_time, room_ids, exclude_schedule_id=schedule_id
+        )
+        
+        messages = []
+        details = []
+        for conflict in room_conflicts:
+            messages.append(
+                f"Room {conflict['roomName']} is already booked between {conflict['startTime']} - {conflict['endTime']}"
+            )
+            details.append({
+                "roomId": conflict["roomId"],
+                "roomName": conflict["roomName"],
+                "subjectId": conflict["subjectId"],
+                "subjectName": conflict["subjectName"] or f"Subject {conflict['subjectId']}",
+                "startTime": conflict["startTime"].isoformat(),
+                "endTime": conflict["endTime"].isoformat()
+            })
+        return messages, details
+
     async def check_for_room_conflicts(self, schedule_id: int, room_ids: List[int], date: date, start_time: time, end_time: time) -> Tuple[bool, List[str]]:
         """Check for conflicts with other scheduled exams in the same rooms.
         
@@ -503,29 +560,7 @@ class ScheduleService(IScheduleService):
         Returns:
             Tuple of (has_conflicts, conflict_messages)
         """
-        conflicts = []
-        
-        # Get all schedules for the same date that are approved
-        all_schedules = await self.schedule_repository.get_all()
-        same_day_schedules = [
-            s for s in all_schedules 
-            if s.date == date and s.status == 'approved' and s.id != schedule_id
-        ]
-        
-        for schedule in same_day_schedules:
-            # Check for time overlap
-            if (start_time < schedule.endTime and end_time > schedule.startTime):
-                # Get the schedule's room IDs
-                schedule_room_ids = schedule.get_room_ids()
-                
-                # Check for any intersection between room_ids and schedule_room_ids
-                conflicting_rooms = set(room_ids).intersection(set(schedule_room_ids))
-                
-                for room_id in conflicting_rooms:
-                    room = await self.room_repository.get_by_id(room_id)
-                    if room:
-                        conflicts.append(f"Room {room.name} is already booked between {schedule.startTime} - {schedule.endTime}")
-        
+        conflicts, _ = await self._find_room_conflicts(schedule_id, room_ids, date, start_time, end_time)
         return len(conflicts) > 0, conflicts
         
     async def check_for_assistant_conflicts(self, schedule_id: int, assistant_ids: List[int], date: date, start_time: time, end_time: time) -> Tuple[bool, List[str]]:
@@ -577,8 +612,8 @@ class ScheduleService(IScheduleService):
                 logger.error(f"Error parsing time values: {e}")
                 raise ValueError(f"Invalid time format. Expected HH:MM, got {start_time} and {end_time}")
         
-        # Check for room conflicts
-        has_room_conflicts, room_conflict_msgs = await self.check_for_room_conflicts(
+        # Check for room conflicts - messages and details come from the same query result
+        room_conflict_msgs, room_conflicts = await self._find_room_conflicts(
             schedule_id, room_ids, date, start_time_obj, end_time_obj
         )
         
@@ -587,40 +622,6 @@ class ScheduleService(IScheduleService):
             schedule_id, assistant_ids, date, start_time_obj, end_time_obj
         )
         
-        # Prepare detailed conflict information for frontend
-        room_conflicts = []
-        if has_room_conflicts:
-            # Get all schedules for the same date that are approved
-            all_schedules = await self.schedule_repository.get_all()
-            same_day_schedules = [
-                s for s in all_schedules 
-                if s.date == date and s.status == 'approved' and s.id != schedule_id
-            ]
-            
-            for schedule in same_day_schedules:
-                # Check for time overlap
-                if (start_time_obj < schedule.endTime and end_time_obj > schedule.startTime):
-                    # Check if any of the rooms conflict
-                    schedule_room_ids = schedule.get_room_ids()
-                    if schedule_room_ids and set(room_ids).intersection(set(schedule_room_ids)):
-                        conflicting_rooms = set(room_ids).intersection(set(schedule_room_ids))
-                        for room_id in conflicting_rooms:
-                            room = await self.room_repository.get_by_id(room_id)
-                            subject = None
-                            try:
-                                subject = await self.subject_repository.get_by_id(schedule.subjectId)
-                            except Exception:
-                                pass
-                            
-                            room_conflicts.append({
-                                "roomId": room.id,
-                                "roomName": room.name,
-                                "subjectId": schedule.subjectId,
-                                "subjectName": subject.name if subject else f"Subject {schedule.subjectId}",
-                                "startTime": schedule.startTime.isoformat(),
-                                "endTime": schedule.endTime.isoformat()
-                            })
-        
         # For now, we'll return empty arrays for assistant and teacher conflicts
         # but with the proper structure for the frontend to handle
         assistant_conflicts = []
@@ -677,6 +678,43 @@ class ScheduleService(IScheduleService):
             # The schedule update should still proceed even if email notification fails
             return False
     
+    def _compose_status_email(self, status: str, sg_user: Any, subject_name: str, exam_date: Any,
+                              start_time: Any, end_time: Any, rooms_text: str,
+                              reason: Optional[str] = None) -> Optional[Tuple[str, str]]:
+        """Build the email sent to a group leader when an exam is approved or rejected.
+        
+        Returns:
+            Tuple of (subject_line, message), or None if the user has no email or the
+            status does not trigger a notification
+        """
+        if not sg_user.email:
+            return None
+        
+        if status == 'approved':
+            subject_line = f"Propunere de examen aprobată: {subject_name}"
+            message = f"Stimate {sg_user.firstName or ''} {sg_user.lastName or ''},\n\n"
+            message += f"Propunerea dvs. pentru examenul la disciplina {subject_name} a fost aprobată.\n\n"
+            message += f"Detalii:\n"
+            message += f"- Dată: {exam_date}\n"
+            message += f"- Ora: {start_time} - {end_time}\n"
+            message += f"- Săli: {rooms_text}\n\n"
+            message += f"Cu stimă,\nSistemul de Management al Examenelor"
+            return subject_line, message
+        
+        if status == 'rejected':
+            subject_line = f"Propunere de examen respinsă: {subject_name}"
+            message = f"Stimate {sg_user.firstName or ''} {sg_user.lastName or ''},\n\n"
+            message += f"Propunerea dvs. pentru examenul la disciplina {subject_name} a fost respinsă.\n\n"
+            
+            if reason:
+                message += f"Motiv: {reason}\n\n"
+                
+            message += f"Vă rugăm să propuneți o nouă dată pentru examen.\n\n"
+            message += f"Cu stimă,\nSistemul de Management al Examenelor"
+            return subject_line, message
+        
+        return None
+    
     async def update_schedule(self, schedule_id: int, schedule_data: ScheduleUpdate) -> Optional[ScheduleResponse]:
         schedule = await self.schedule_repository.get_by_id(schedule_id)
         if not schedule:
@@ -790,63 +828,31 @@ class ScheduleService(IScheduleService):
                     group = await self.group_repository.get_by_id(subject.groupId)
                     if group:
                         try:
-                            # Find SG user for this group - use get_by_id and filter manually if get_by_role_and_group doesn't exist
-                            sg_users = []
-                            # Get all users and filter by role and group
-                            all_users = await self.user_repository.get_all()
-                            sg_users = [user for user in all_users if user.role == 'SG' and user.groupId == group.id]
+                            # Find the SG users of this group through the (role, groupId) index
+                            sg_users = await self.user_repository.get_by_role_and_group('SG', group.id)
                             
-                            # Common email setup values
-                            room_names = []
-                            for room_id in schedule.get_room_ids():
-                                room = await self.room_repository.get_by_id(room_id)
-                                if room:
-                                    room_names.append(room.name)
+                            # Common email setup values - all room names in one query, in booking order
+                            room_ids = schedule.get_room_ids()
+                            rooms_by_id = {room.id: room for room in await self.room_repository.get_by_ids(room_ids)}
+                            room_names = [rooms_by_id[room_id].name for room_id in room_ids if room_id in rooms_by_id]
                             
                             rooms_text = ", ".join(room_names) if room_names else "nicio sală alocată încă"
                             exam_date = schedule.date.strftime("%d/%m/%Y") if hasattr(schedule.date, "strftime") else schedule.date
                             
                             # Send appropriate email based on status
-                            if schedule_data.status == 'approved':
-                                # Send approval notification
-                                for sg_user in sg_users:
-                                    if sg_user.email:
-                                        subject_line = f"Propunere de examen aprobată: {subject.name}"
-                                        message = f"Stimate {sg_user.firstName or ''} {sg_user.lastName or ''},\n\n"
-                                        message += f"Propunerea dvs. pentru examenul la disciplina {subject.name} a fost aprobată.\n\n"
-                                        message += f"Detalii:\n"
-                                        message += f"- Dată: {exam_date}\n"
-                                        message += f"- Ora: {schedule.startTime} - {schedule.endTime}\n"
-                                        message += f"- Săli: {rooms_text}\n\n"
-                                        message += f"Cu stimă,\nSistemul de Management al Examenelor"
-                                        
-                                        await self.send_notification_email(
-                                            schedule_id, 
-                                            sg_user.email, 
-                                            subject_line, 
-                                            message
-                                        )
-                                        
-                            elif schedule_data.status == 'rejected':
-                                # Send rejection notification
-                                for sg_user in sg_users:
-                                    if sg_user.email:
-                                        subject_line = f"Propunere de examen respinsă: {subject.name}"
-                                        message = f"Stimate {sg_user.firstName or ''} {sg_user.lastName or ''},\n\n"
-                                        message += f"Propunerea dvs. pentru examenul la disciplina {subject.name} a fost respinsă.\n\n"
-                                        
-                                        if schedule_data.reason:
-                                            message += f"Motiv: {schedule_data.reason}\n\n"
-                                            
-                                        message += f"Vă rugăm să propuneți o nouă dată pentru examen.\n\n"
-                                        message += f"Cu stimă,\nSistemul de Management al Examenelor"
-                                        
-                                        await self.send_notification_email(
-                                            schedule_id, 
-                                            sg_user.email, 
-                                            subject_line, 
-                                            message
-                                        )
+                            for sg_user in sg_users:
+                                email = self._compose_status_email(
+                                    schedule_data.status, sg_user, subject.name, exam_date,
+                                    schedule.startTime, schedule.endTime, rooms_text, schedule_data.reason
+                                )
+                                if email:
+                                    subject_line, message = email
+                                    await self.send_notification_email(
+                                        schedule_id, 
+                                        sg_user.email, 
+                                        subject_line, 
+                                        message
+                                    )
                         except Exception as e:
                             logger.error(f"[ERROR] Failed to send email notification: {str(e)}")
                             # Don't raise the exception - just log it so the API call still succeeds
@@ -870,6 +876,7 @@ class ScheduleService(IScheduleService):
             
         # Save changes to the main schedule record
         updated_schedule = await self.schedule_repository.update(schedule)
+        self._update_occupancy(updated_schedule)
         
         # Convert the Schedule object to dict for validation
         # This helps us handle date formatting correctly
@@ -884,5 +891,225 @@ class ScheduleService(IScheduleService):
         
         return ScheduleResponse.model_validate(schedule_dict)
 
+    async def _check_bulk_approval(self, schedules: List[Schedule], allow_conflicts: bool) -> Tuple[List[Schedule], List[ScheduleBulkSkipped], Dict[int, List[Tuple[int, int]]]]:
+        """Detect room conflicts for a set of schedules that are approved together.
+        
+        Every schedule is checked against the approved exams outside the set through the
+        occupancy index and against the schedules of the set accepted before it.
+        Schedules that are already approved go first so they keep their rooms, the rest
+        follow in chronological order. The index of this process may miss approvals made
+        by other workers, so the accepted set is then checked again with one database
+        query before anything is written.
+        
+        Args:
+            schedules: Schedules to approve
+            allow_conflicts: Whether conflicting schedules are still approved
+            
+        Returns:
+            Tuple of (schedules_to_approve, schedules_without_date_or_time,
+            conflicts) where conflicts maps a schedule ID to (room_id, other_schedule_id) pairs
+        """
+        occupancy_index = self.occupancy_index or RoomOccupancyIndex()
+        await occupancy_index.ensure_loaded(self.schedule_repository)
+        
+        ordered = sorted(schedules, key=lambda schedule: (
+            (schedule.status or '').lower() != 'approved',
+            schedule.date or date.max,
+            schedule.startTime or time.min,
+            schedule.id
+        ))
+        unprocessed_ids = {schedule.id for schedule in schedules}
+        accepted_ids: Set[int] = set()
+        booked: Dict[Tuple[int, date], List[Tuple[time, time, int]]] = {}
+        conflict_free = []
+        skipped = []
+        conflicts: Dict[int, List[Tuple[int, int]]] = {}
+        
+        for schedule in ordered:
+            unprocessed_ids.discard(schedule.id)
+            if schedule.date is None or schedule.startTime is None or schedule.endTime is None:
+                skipped.append(ScheduleBulkSkipped(scheduleId=schedule.id, reason="Schedule has no date or time set"))
+                continue
+                
+            found = []
+            for room_id in schedule.get_room_ids():
+                # Schedules of the set are compared through `booked` once they are accepted
+                for other_id in occupancy_index.get_busy_schedule_ids(
+                        room_id, schedule.date, schedule.startTime, schedule.endTime, schedule.id):
+                    if other_id not in accepted_ids and other_id not in unprocessed_ids:
+                        found.append((room_id, other_id))
+                for other_start, other_end, other_id in booked.get((room_id, schedule.date), []):
+                    if other_start < schedule.endTime and schedule.startTime < other_end:
+                        found.append((room_id, other_id))
+                        
+            if found:
+                conflicts[schedule.id] = found
+                if not allow_conflicts:
+                    continue
+            conflict_free.append(schedule)
+            accepted_ids.add(schedule.id)
+            for room_id in schedule.get_room_ids():
+                booked.setdefault((room_id, schedule.date), []).append(
+                    (schedule.startTime, schedule.endTime, schedule.id)
+                )
+        
+        # The index only proves that a room is busy; confirm the free ones in the database
+        missed: Dict[int, List[Tuple[int, int]]] = {}
+        for schedule_id, room_id, other_id in await self.schedule_repository.get_room_conflicts_for_schedules(
+                list(accepted_ids)):
+            if (room_id, other_id) not in conflicts.get(schedule_id, []):
+                missed.setdefault(schedule_id, []).append((room_id, other_id))
+        if missed:
+            logger.warning(f"[CONFLICTS] Occupancy index missed conflicts for schedules {sorted(missed)}")
+            # The index is stale; reload it on the next lookup
+            occupancy_index.invalidate()
+            for schedule_id, pairs in missed.items():
+                conflicts.setdefault(schedule_id, []).extend(pairs)
+            if not allow_conflicts:
+                conflict_free = [schedule for schedule in conflict_free if schedule.id not in missed]
+                
+        return conflict_free, skipped, conflicts
+    
+    async def _build_status_notifications(self, schedules: List[Schedule], status: str, reason: Optional[str],
+                                          room_names: Dict[int, str]) -> List[Tuple[int, str, str, str]]:
+        """Build the group leader emails for a set of schedules with one lookup per table.
+        
+        Returns:
+            List of (schedule_id, recipient_email, subject_line, message)
+        """
+        sg_users_by_group: Dict[int, List[Any]] = {}
+        for user in await self.user_repository.get_by_role('SG'):
+            if user.groupId is not None:
+                sg_users_by_group.setdefault(user.groupId, []).append(user)
+        
+        notifications = []
+        for schedule in schedules:
+            subject = schedule.subject
+            if not subject or not subject.groupId:
+                continue
+            names = [room_names[room_id] for room_id in schedule.get_room_ids() if room_id in room_names]
+            rooms_text = ", ".join(names) if names else "nicio sală alocată încă"
+            exam_date = schedule.date.strftime("%d/%m/%Y") if hasattr(schedule.date, "strftime") else schedule.date
+            for sg_user in sg_users_by_group.get(subject.groupId, []):
+                email = self._compose_status_email(
+                    status, sg_user, subject.name, exam_date,
+                    schedule.startTime, schedule.endTime, rooms_text, reason
+                )
+                if email:
+                    notifications.append((schedule.id, sg_user.email, email[0], email[1]))
+        return notifications
+    
+    async def _send_notification_batch(self, notifications: List[Tuple[int, str, str, str]]) -> None:
+        """Send a batch of notification emails, logging a summary at the end."""
+        sent = 0
+        for schedule_id, recipient_email, subject_line, message in notifications:
+            if await self.send_notification_email(schedule_id, recipient_email, subject_line, message):
+                sent += 1
+        logger.info(f"[EMAIL] Sent {sent}/{len(notifications)} schedule status notifications")
+    
+    async def bulk_update_status(self, update_data: ScheduleBulkStatusUpdate,
+                                 background_tasks: Optional[BackgroundTasks] = None) -> ScheduleBulkStatusResponse:
+        """Change the status of many schedules at once.
+        
+        The schedules are loaded in one query, room conflicts are checked for the whole
+        set before anything is written, and all status changes are committed with a
+        single UPDATE. Emails are built with one lookup per table and sent as one batch,
+        after the response when background_tasks is given.
+        
+        Args:
+            update_data: Schedule IDs, target status and notification options
+            background_tasks: Optional FastAPI background tasks used to send the emails
+            
+        Returns:
+            ScheduleBulkStatusResponse: Updated IDs, skipped schedules and room conflicts
+            
+        Raises:
+            ValueError: If the status is not valid
+        """
+        is_valid, error_message = await self.validate_status(update_data.status)
+        if not is_valid:
+            raise ValueError(error_message)
+        status = update_data.status.lower()
+        
+        requested_ids = list(dict.fromkeys(update_data.scheduleIds))
+        schedules_by_id = {schedule.id: schedule for schedule in await self.schedule_repository.get_by_ids(requested_ids)}
+        skipped = [
+            ScheduleBulkSkipped(scheduleId=schedule_id, reason="Schedule not found")
+            for schedule_id in requested_ids if schedule_id not in schedules_by_id
+        ]
+        to_update = [schedules_by_id[schedule_id] for schedule_id in requested_ids if schedule_id in schedules_by_id]
+        
+        conflicts: Dict[int, List[Tuple[int, int]]] = {}
+        if status == 'approved':
+            to_update, missing_times, conflicts = await self._check_bulk_approval(to_update, update_data.allowConflicts)
+            skipped.extend(missing_times)
+        
+        room_names: Dict[int, str] = {}
+        if conflicts or update_data.sendEmail:
+            needed_room_ids = {room_id for schedule in to_update for room_id in schedule.get_room_ids()}
+            needed_room_ids.update(room_id for pairs in conflicts.values() for room_id, _ in pairs)
+            room_names = {room.id: room.name for room in await self.room_repository.get_by_ids(list(needed_room_ids))}
+        
+        room_conflicts = []
+        if conflicts:
+            other_ids = {other_id for pairs in conflicts.values() for _, other_id in pairs}
+            others = {schedule.id: schedule for schedule in await self.schedule_repository.get_by_ids(
+                [other_id for other_id in other_ids if other_id not in schedules_by_id]
+            )}
+            others.update(schedules_by_id)
+            for schedule_id, pairs in conflicts.items():
+                messages = []
+                for room_id, other_id in pairs:
+                    other = others.get(other_id)
+                    if other is None:
+                        continue
+                    room_name = room_names.get(room_id, f"Room {room_id}")
+                    messages.append(f"Room {room_name} is already booked between {other.startTime} - {other.endTime}")
+                    room_conflicts.append({
+                        "scheduleId": schedule_id,
+                        "conflictingScheduleId": other_id,
+                        "roomId": room_id,
+                        "roomName": room_name,
+                        "startTime": other.startTime.isoformat() if other.startTime else None,
+                        "endTime": other.endTime.isoformat() if other.endTime else None
+                    })
+                logger.warning(f"[CONFLICTS] Detected conflicts for schedule {schedule_id}: {messages}")
+                if not update_data.allowConflicts:
+                    skipped.append(ScheduleBulkSkipped(scheduleId=schedule_id, reason="; ".join(messages)))
+        
+        # Everything read from the schedules is captured before the commit expires them
+        notifications = []
+        if update_data.sendEmail:
+            notifications = await self._build_status_notifications(to_update, status, update_data.reason, room_names)
+        occupancy = [
+            (schedule.id, schedule.get_room_ids(), schedule.date, schedule.startTime, schedule.endTime)
+            for schedule in to_update
+        ]
+        updated_ids = [schedule.id for schedule in to_update]
+        
+        if updated_ids:
+            await self.schedule_repository.bulk_update_status(updated_ids, status)
+            logger.info(f"[DEBUG] Bulk updated {len(updated_ids)} schedules to status {status}")
+        
+        if self.occupancy_index:
+            for schedule_id, room_ids, exam_date, start_time, end_time in occupancy:
+                self.occupancy_index.update_schedule(schedule_id, status, room_ids, exam_date, start_time, end_time)
+        
+        if notifications:
+            if background_tasks is not None:
+                background_tasks.add_task(self._send_notification_batch, notifications)
+            else:
+                await self._send_notification_batch(notifications)
+        
+        return ScheduleBulkStatusResponse(
+            updatedIds=updated_ids,
+            skipped=skipped,
+            roomConflicts=room_conflicts,
+            notificationsQueued=len(notifications)
+        )
+
     async def delete_schedule(self, schedule_id: int) -> bool:
-        return await self.schedule_repository.delete(schedule_id)
+        deleted = await self.schedule_repository.delete(schedule_id)
+        if deleted and self.occupancy_index:
+            self.occupancy_index.remove_schedule(schedule_id)
+        return deleted
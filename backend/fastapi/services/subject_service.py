@@ -1,12 +1,15 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, AsyncIterator, Dict, Any
 import logging
 
 from models.subject import Subject
 from models.DTOs.subject_dto import SubjectCreate, SubjectUpdate, SubjectResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, BulkItemResult, SyncDiffResponse
 from repositories.abstract.subject_repository_interface import ISubjectRepository
 from repositories.abstract.group_repository_interface import IGroupRepository
 from repositories.abstract.user_repository_interface import IUserRepository
 from services.abstract.subject_service_interface import ISubjectService
+from services.bulk_import import validate_rows, build_bulk_response
+from services.sync_diff import MAX_SYNC_ROWS, diff_snapshot, build_sync_response
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,15 @@ class SubjectService(ISubjectService):
         subjects = await self.subject_repository.get_all()
         return [SubjectResponse.model_validate(subject) for subject in subjects]
 
+    async def stream_subjects(self) -> AsyncIterator[SubjectResponse]:
+        async for subject in self.subject_repository.stream_all():
+            yield SubjectResponse.model_validate(subject)
+
+    async def get_subjects_page(self, limit: int, after: Optional[str] = None,
+                                sort_by: str = "id") -> Tuple[List[SubjectResponse], Optional[str]]:
+        subjects, next_cursor = await self.subject_repository.get_page(limit, after, sort_by)
+        return [SubjectResponse.model_validate(subject) for subject in subjects], next_cursor
+
     async def get_subject_by_id(self, subject_id: int) -> Optional[SubjectResponse]:
         subject = await self.subject_repository.get_by_id(subject_id)
         if subject:
@@ -198,20 +210,126 @@ class SubjectService(ISubjectService):
             raise ValueError(error_message)
         
         # Create new subject object with direct assistantIds
-        subject = Subject(
+        subject = self._build_subject(subject_data)
+        
+        # Save to database
+        created_subject = await self.subject_repository.create(subject)
+        
+        # No need to update assistants separately - they're stored directly now
+        
+        return SubjectResponse.model_validate(created_subject)
+
+    async def _check_references(self, valid: List[Tuple[int, SubjectCreate]]) -> Tuple[List[Tuple[int, SubjectCreate]], List[BulkItemResult]]:
+        """Check the groups, teachers and assistants referenced by many subjects.
+        
+        Each kind of reference is loaded with one query for all rows instead of one
+        query per row.
+        
+        Args:
+            valid (List[Tuple[int, SubjectCreate]]): (index, subject) pairs to check
+            
+        Returns:
+            Tuple of the (index, subject) pairs that passed and the errors of the others
+        """
+        existing_groups = await self.group_repository.get_existing_ids(list({data.groupId for _, data in valid}))
+        user_ids = {data.teacherId for _, data in valid}
+        user_ids.update(assistant_id for _, data in valid for assistant_id in data.assistantIds or [])
+        roles = await self.user_repository.get_roles_by_ids(list(user_ids))
+        
+        accepted = []
+        errors = []
+        for index, subject_data in valid:
+            error_message = None
+            if subject_data.groupId not in existing_groups:
+                error_message = f"Group with ID {subject_data.groupId} does not exist"
+            elif subject_data.teacherId not in roles:
+                error_message = f"User with ID {subject_data.teacherId} does not exist"
+            elif roles[subject_data.teacherId] != 'CD':
+                error_message = f"User with ID {subject_data.teacherId} is not a teacher (role 'CD')"
+            else:
+                for assistant_id in subject_data.assistantIds or []:
+                    if assistant_id not in roles:
+                        error_message = f"Assistant user with ID {assistant_id} does not exist"
+                        break
+                    if roles[assistant_id] != "CD":
+                        error_message = f"Assistant with ID {assistant_id} must have role CD (professor), but has {roles[assistant_id]}"
+                        break
+            if error_message:
+                errors.append(BulkItemResult(index=index, error=error_message))
+            else:
+                accepted.append((index, subject_data))
+        return accepted, errors
+
+    def _build_subject(self, subject_data: SubjectCreate) -> Subject:
+        return Subject(
             name=subject_data.name,
             shortName=subject_data.shortName,
             groupId=subject_data.groupId,
             teacherId=subject_data.teacherId,
             assistantIds=subject_data.assistantIds or []
         )
+
+    async def create_subjects_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        """Validate many subjects and insert the valid ones in one transaction.
         
-        # Save to database
-        created_subject = await self.subject_repository.create(subject)
+        The groups, teachers and assistants referenced by all rows are checked with one
+        query each instead of one query per row.
         
-        # No need to update assistants separately - they're stored directly now
+        Args:
+            rows (List[Dict[str, Any]]): Subjects in the SubjectCreate format
+            
+        Returns:
+            BulkCreateResponse: The ID or the error of every row
+            
+        Raises:
+            ValueError: If there are more rows than one bulk request allows
+        """
+        valid, errors = validate_rows(rows, SubjectCreate)
+        accepted, reference_errors = await self._check_references(valid)
+        errors.extend(reference_errors)
         
-        return SubjectResponse.model_validate(created_subject)
+        subjects = [self._build_subject(subject_data) for _, subject_data in accepted]
+        ids = await self.subject_repository.create_many(subjects) if subjects else []
+        return build_bulk_response([(index, subject_id) for (index, _), subject_id in zip(accepted, ids)], errors)
+
+    async def sync_subjects_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored subjects of some groups match a snapshot of their subjects.
+        
+        The snapshot covers only the groups it mentions: subjects are matched on
+        (groupId, shortName), and subjects of those groups that are missing from the
+        snapshot are deactivated. Matched subjects keep their ID, so their schedules and
+        exam proposals survive the sync. A stored subject whose snapshot row was rejected
+        (for example because its teacher is unknown) is left as it is.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Subjects in the SubjectCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated subjects
+            
+        Raises:
+            ValueError: If the snapshot has more rows than a sync request allows
+        """
+        valid, errors = validate_rows(rows, SubjectCreate, MAX_SYNC_ROWS)
+        accepted, reference_errors = await self._check_references(valid)
+        errors.extend(reference_errors)
+        rejected_indexes = {error.index for error in reference_errors}
+        rejected_keys = {(data.groupId, data.shortName) for index, data in valid if index in rejected_indexes}
+        
+        existing = await self.subject_repository.get_by_group_ids(list({data.groupId for _, data in valid}))
+        diff = diff_snapshot(
+            accepted, existing,
+            key=lambda subject: (subject.groupId, subject.shortName),
+            fields=("name", "teacherId", "assistantIds"),
+            protected=lambda subject: (subject.groupId, subject.shortName) in rejected_keys
+        )
+        diff.errors.extend(errors)
+        ids = await self.subject_repository.apply_sync_changes(
+            [self._build_subject(data) for _, data in diff.inserts],
+            [(subject_id, changes) for _, subject_id, changes in diff.updates],
+            diff.deactivate_ids
+        )
+        return build_sync_response(diff, ids)
 
     async def update_subject(self, subject_id: int, subject_data: SubjectUpdate) -> Optional[SubjectResponse]:
         subject = await self.subject_repository.get_by_id(subject_id)
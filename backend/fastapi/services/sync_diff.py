@@ -0,0 +1,107 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from models.DTOs.bulk_dto import BulkItemResult, SyncItemResult, SyncDiffResponse
+
+# Largest snapshot accepted by one sync request; a snapshot is the whole data set of
+# an entity, so it is allowed to be bigger than a bulk insert
+MAX_SYNC_ROWS = 20000
+
+
+@dataclass
+class SnapshotDiff:
+    """Changes needed to make the stored rows of an entity match a snapshot."""
+    inserts: List[Tuple[int, Any]] = field(default_factory=list)  # (index, DTO) of new rows
+    updates: List[Tuple[int, int, Dict[str, Any]]] = field(default_factory=list)  # (index, id, changed columns)
+    unchanged: List[Tuple[int, int]] = field(default_factory=list)  # (index, id) of rows already up to date
+    deactivate_ids: List[int] = field(default_factory=list)  # Stored rows missing from the snapshot
+    errors: List[BulkItemResult] = field(default_factory=list)
+
+
+def diff_snapshot(valid: Sequence[Tuple[int, Any]], existing: Sequence[Any], key: Callable[[Any], Hashable],
+                  fields: Sequence[str], protected: Optional[Callable[[Any], bool]] = None) -> SnapshotDiff:
+    """Compare a validated snapshot with the stored rows, matching them on a natural key.
+
+    Snapshot rows without a stored match become inserts, matched rows whose fields differ
+    (or that were deactivated earlier) become updates, and active stored rows that no
+    snapshot row matched are deactivated. A key repeated inside the snapshot is reported
+    as an error for every occurrence after the first.
+
+    Args:
+        valid: (index, DTO) pairs of the snapshot rows that passed validation
+        existing: Stored rows of the entity, active or not
+        key: Returns the natural key of a DTO or a stored row
+        fields: Columns copied from the snapshot onto matched rows
+        protected: Returns True for stored rows that must never be deactivated
+
+    Returns:
+        SnapshotDiff: The inserts, updates, unchanged rows and deactivations
+    """
+    diff = SnapshotDiff()
+    stored_by_key: Dict[Hashable, Any] = {}
+    for row in existing:
+        row_key = key(row)
+        # Keep the active copy when an older sync left duplicates; the others get deactivated
+        if row_key not in stored_by_key or (row.isActive and not stored_by_key[row_key].isActive):
+            stored_by_key[row_key] = row
+
+    seen = set()
+    matched_ids = set()
+    for index, data in valid:
+        row_key = key(data)
+        if row_key in seen:
+            diff.errors.append(BulkItemResult(index=index, error=f"Duplicate key {row_key} in the snapshot"))
+            continue
+        seen.add(row_key)
+
+        row = stored_by_key.get(row_key)
+        if row is None:
+            diff.inserts.append((index, data))
+            continue
+
+        matched_ids.add(row.id)
+        changes = {
+            name: getattr(data, name)
+            for name in fields
+            if getattr(row, name) != getattr(data, name)
+        }
+        if row.isActive is False:
+            changes["isActive"] = True
+        if changes:
+            diff.updates.append((index, row.id, changes))
+        else:
+            diff.unchanged.append((index, row.id))
+
+    diff.deactivate_ids = [
+        row.id for row in existing
+        if row.id not in matched_ids and row.isActive is not False and not (protected and protected(row))
+    ]
+    return diff
+
+
+def build_sync_response(diff: SnapshotDiff, inserted_ids: Sequence[int]) -> SyncDiffResponse:
+    """Turn an applied diff into the response of a sync request.
+
+    Args:
+        diff: The diff that was applied
+        inserted_ids: IDs generated for diff.inserts, in the same order
+
+    Returns:
+        SyncDiffResponse: Counts and one result per snapshot row, ordered by index
+    """
+    results = [
+        SyncItemResult(index=index, id=row_id, action="inserted")
+        for (index, _), row_id in zip(diff.inserts, inserted_ids)
+    ]
+    results.extend(SyncItemResult(index=index, id=row_id, action="updated") for index, row_id, _ in diff.updates)
+    results.extend(SyncItemResult(index=index, id=row_id, action="unchanged") for index, row_id in diff.unchanged)
+    results.extend(SyncItemResult(index=error.index, error=error.error) for error in diff.errors)
+    results.sort(key=lambda result: result.index)
+    return SyncDiffResponse(
+        inserted=len(diff.inserts),
+        updated=len(diff.updates),
+        unchanged=len(diff.unchanged),
+        deactivated=len(diff.deactivate_ids),
+        failed=len(diff.errors),
+        results=results
+    )
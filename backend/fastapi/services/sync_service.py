@@ -107,17 +107,21 @@ class SyncService(ISyncService):
             
         return deleted_counts
     
-    async def fetch_data_from_flask(self) -> Dict[str, Any]:
+    async def fetch_data_from_flask(self, incremental: bool = False) -> Dict[str, Any]:
         """
         Call the Flask backend to fetch and sync data from USV API.
         
+        Args:
+            incremental (bool): Ask Flask to send snapshots to the /sync endpoints instead of bulk inserts
+        
         Returns:
             Dict[str, Any]: Synchronization result with counts of created entities
         """
-        logger.info("Calling Flask backend to fetch and sync data from USV API...")
+        mode = "incremental" if incremental else "full"
+        logger.info(f"Calling Flask backend to fetch and sync data from USV API ({mode} mode)...")
         try:
             async with httpx.AsyncClient() as client:
-                response = await client.post("http://flask:5000/fetch-and-sync-data", timeout=300)
+                response = await client.post("http://flask:5000/fetch-and-sync-data", json={"mode": mode}, timeout=300)
                 response.raise_for_status()
             
             # Parse response from Flask
@@ -323,13 +327,21 @@ class SyncService(ISyncService):
             
         return result
     
-    async def sync_all_data(self) -> Dict[str, Any]:
+    async def sync_all_data(self, incremental: bool = False) -> Dict[str, Any]:
         """
         Orchestrates the entire synchronization process:
-        1. Delete all existing data
+        1. Delete all existing data (full mode only)
         2. Fetch new data from Flask backend
         3. Create test users
         
+        In incremental mode nothing is deleted: Flask sends each entity as a snapshot that
+        FastAPI diffs against the stored rows, rows missing from the USV data are only
+        deactivated, and schedules are created just for subjects that have none, so
+        existing exam proposals survive the sync.
+        
+        Args:
+            incremental (bool): Apply only the differences instead of deleting and reloading
+        
         Returns:
             Dict[str, Any]: Detailed results of the synchronization process
         """
@@ -348,12 +360,15 @@ class SyncService(ISyncService):
         }
         
         try:
+            result["mode"] = "incremental" if incremental else "full"
+            
             # Step 1: Delete all existing data IN ORDER (rooms, groups, users)
-            deleted_counts = await self.delete_all_data()
-            result["deleted"] = deleted_counts
+            if not incremental:
+                deleted_counts = await self.delete_all_data()
+                result["deleted"] = deleted_counts
             
             # Step 2: Call the Flask service to fetch and sync new data
-            flask_result = await self.fetch_data_from_flask()
+            flask_result = await self.fetch_data_from_flask(incremental)
             
             # Extract summary counts from the response
             result["synced"] = {
@@ -402,12 +417,16 @@ class SyncService(ISyncService):
             try:
                 logger.info("Step 4: Populating schedules from subjects")
                 
-                # First delete any existing schedules
-                deleted_count = await self.schedule_service.delete_all_schedules()
-                logger.info(f"Deleted {deleted_count} existing schedules before populating")
-                
-                # Then populate with fresh data from subjects
-                schedule_stats = await self.schedule_service.populate_schedules_from_subjects()
+                if incremental:
+                    # Keep the existing schedules and add the ones of new subjects
+                    schedule_stats = await self.schedule_service.populate_missing_schedules()
+                else:
+                    # First delete any existing schedules
+                    deleted_count = await self.schedule_service.delete_all_schedules()
+                    logger.info(f"Deleted {deleted_count} existing schedules before populating")
+                    
+                    # Then populate with fresh data from subjects
+                    schedule_stats = await self.schedule_service.populate_schedules_from_subjects()
                 
                 # Update result with schedule stats
                 result["schedules"]["created"] = schedule_stats.get("created", 0)
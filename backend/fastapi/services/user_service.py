@@ -1,11 +1,15 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple, AsyncIterator, Dict, Any
 from passlib.context import CryptContext
 
 from models.user import User
 from models.DTOs.user_dto import UserCreate, UserUpdate, UserResponse
+from models.DTOs.bulk_dto import BulkCreateResponse, BulkItemResult, SyncDiffResponse
 from repositories.abstract.user_repository_interface import IUserRepository
 from repositories.abstract.group_repository_interface import IGroupRepository
 from services.abstract.user_service_interface import IUserService
+from services.bulk_import import validate_rows, build_bulk_response
+from services.sync_diff import MAX_SYNC_ROWS, diff_snapshot, build_sync_response
+from config.settings import get_settings
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -19,6 +23,15 @@ class UserService(IUserService):
         users = await self.user_repository.get_all()
         return [UserResponse.model_validate(user) for user in users]
 
+    async def stream_users(self) -> AsyncIterator[UserResponse]:
+        async for user in self.user_repository.stream_all():
+            yield UserResponse.model_validate(user)
+
+    async def get_users_page(self, limit: int, after: Optional[str] = None,
+                             sort_by: str = "id") -> Tuple[List[UserResponse], Optional[str]]:
+        users, next_cursor = await self.user_repository.get_page(limit, after, sort_by)
+        return [UserResponse.model_validate(user) for user in users], next_cursor
+
     async def get_user_by_id(self, user_id: int) -> Optional[UserResponse]:
         user = await self.user_repository.get_by_id(user_id)
         if user:
@@ -43,28 +56,34 @@ class UserService(IUserService):
             is_valid: True if validation passes, False otherwise
             error_message: Description of the error if validation fails, None otherwise
         """
+        existing_groups = set()
+        if role == 'SG' and group_id is not None and await self.group_repository.exists_by_id(group_id):
+            existing_groups.add(group_id)
+        error_message = self._group_id_error(group_id, role, existing_groups)
+        return error_message is None, error_message
+
+    @staticmethod
+    def _group_id_error(group_id: Optional[int], role: str, existing_groups: Set[int]) -> Optional[str]:
+        """Check a group ID against the role rules, given the IDs of the groups that exist.
+        
+        Returns:
+            Optional[str]: Description of the error, or None if the group ID is valid
+        """
         # For SG users, groupId is required and must exist
         if role == 'SG':
             if group_id is None:
-                return False, "Group ID is required for students (SG)"
-            
-            # Check if group exists
-            if not await self.group_repository.exists_by_id(group_id):
-                return False, f"Group with ID {group_id} does not exist"
+                return "Group ID is required for students (SG)"
+            if group_id not in existing_groups:
+                return f"Group with ID {group_id} does not exist"
                 
         # For non-SG users, groupId should be None
         elif group_id is not None:
-            return False, f"Group ID should not be set for non-student roles (current role: {role})"
+            return f"Group ID should not be set for non-student roles (current role: {role})"
             
         # All checks passed
-        return True, None
+        return None
 
-    async def create_user(self, user_data: UserCreate) -> UserResponse:
-        # Validate group ID based on role
-        is_valid, error_message = await self.validate_group_id(user_data.groupId, user_data.role)
-        if not is_valid:
-            raise ValueError(error_message)
-        
+    def _build_user(self, user_data: UserCreate) -> User:
         # Create new user object with all fields from user_data
         # For non-SG roles, we explicitly set groupId to None
         user = User(
@@ -83,11 +102,110 @@ class UserService(IUserService):
         # Hash the password if provided
         if user_data.passwordHash:
             user.passwordHash = pwd_context.hash(user_data.passwordHash)
+        return user
+
+    async def create_user(self, user_data: UserCreate) -> UserResponse:
+        # Validate group ID based on role
+        is_valid, error_message = await self.validate_group_id(user_data.groupId, user_data.role)
+        if not is_valid:
+            raise ValueError(error_message)
+        
+        user = self._build_user(user_data)
         
         # Save to database
         created_user = await self.user_repository.create(user)
         return UserResponse.model_validate(created_user)
 
+    async def create_users_bulk(self, rows: List[Dict[str, Any]]) -> BulkCreateResponse:
+        """Validate many users and insert the valid ones in one transaction.
+        
+        Rows are rejected individually when they fail validation, when their email is
+        already registered or repeated earlier in the request, or when their group ID does
+        not fit their role.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Users in the UserCreate format
+            
+        Returns:
+            BulkCreateResponse: The ID or the error of every row
+            
+        Raises:
+            ValueError: If there are more rows than one bulk request allows
+        """
+        valid, errors = validate_rows(rows, UserCreate)
+        taken_emails = await self.user_repository.get_existing_emails([data.email for _, data in valid])
+        # One query for the groups of all the student rows instead of one per row
+        existing_groups = await self.group_repository.get_existing_ids(
+            list({data.groupId for _, data in valid if data.role == 'SG' and data.groupId is not None})
+        )
+        
+        accepted = []
+        for index, user_data in valid:
+            if user_data.email in taken_emails:
+                errors.append(BulkItemResult(index=index, error=f"User with email {user_data.email} already exists"))
+                continue
+            error_message = self._group_id_error(user_data.groupId, user_data.role, existing_groups)
+            if error_message:
+                errors.append(BulkItemResult(index=index, error=error_message))
+                continue
+            taken_emails.add(user_data.email)
+            accepted.append((index, user_data))
+        
+        ids = await self.user_repository.create_many([self._build_user(data) for _, data in accepted]) if accepted else []
+        return build_bulk_response([(index, user_id) for (index, _), user_id in zip(accepted, ids)], errors)
+
+    async def sync_users_snapshot(self, rows: List[Dict[str, Any]]) -> SyncDiffResponse:
+        """Make the stored teaching staff match a full snapshot of the staff.
+        
+        Only users with role CD take part: they are matched on their email (case
+        insensitive), and the ones missing from the snapshot are deactivated, except the
+        accounts listed in SYNC_PROTECTED_EMAILS. Login-related fields such as googleId
+        and passwordHash are never overwritten.
+        
+        Args:
+            rows (List[Dict[str, Any]]): Every teaching staff member, in the UserCreate format
+            
+        Returns:
+            SyncDiffResponse: What happened to every row and the number of deactivated users
+            
+        Raises:
+            ValueError: If the snapshot has more rows than a sync request allows
+        """
+        valid, errors = validate_rows(rows, UserCreate, MAX_SYNC_ROWS)
+        staff = []
+        for index, user_data in valid:
+            if user_data.role != 'CD':
+                errors.append(BulkItemResult(index=index, error=f"Only teaching staff (role CD) can be synced, got {user_data.role}"))
+            else:
+                staff.append((index, user_data))
+        
+        protected_emails = set(get_settings().SYNC_PROTECTED_EMAILS)
+        existing = await self.user_repository.get_by_role("CD")
+        diff = diff_snapshot(
+            staff, existing,
+            key=lambda user: (user.email or "").lower(),
+            fields=("firstName", "lastName", "department", "phone"),
+            protected=lambda user: (user.email or "").lower() in protected_emails
+        )
+        diff.errors.extend(errors)
+        
+        # A new staff email may already belong to a user with another role
+        taken_emails = await self.user_repository.get_existing_emails([data.email for _, data in diff.inserts])
+        inserts = []
+        for index, user_data in diff.inserts:
+            if user_data.email in taken_emails:
+                diff.errors.append(BulkItemResult(index=index, error=f"User with email {user_data.email} already exists"))
+            else:
+                inserts.append((index, user_data))
+        diff.inserts = inserts
+        
+        ids = await self.user_repository.apply_sync_changes(
+            [self._build_user(data) for _, data in diff.inserts],
+            [(user_id, changes) for _, user_id, changes in diff.updates],
+            diff.deactivate_ids
+        )
+        return build_sync_response(diff, ids)
+
     async def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[UserResponse]:
         user = await self.user_repository.get_by_id(user_id)
         if not user:
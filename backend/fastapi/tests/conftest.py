@@ -0,0 +1,9 @@
+import os
+import sys
+
+# Make the application packages (config, models, repositories, services...) importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "postgres: needs a PostgreSQL server given by DATABASE_URL")
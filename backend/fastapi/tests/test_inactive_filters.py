@@ -0,0 +1,96 @@
+"""Subjects and groups deactivated by a sync must not show up in listings or in the solver input."""
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from repositories.exam_repository import ExamRepository
+from repositories.group_repository import GroupRepository
+from repositories.subject_repository import SubjectRepository
+
+SUBJECT_ACTIVE = 'subjects."isActive" IS true'
+GROUP_ACTIVE = 'groups."isActive" IS true'
+
+
+class _EmptyResult:
+    def scalars(self):
+        return self
+
+    def unique(self):
+        return self
+
+    def all(self):
+        return []
+
+    def first(self):
+        return None
+
+
+class RecordingSession:
+    """Stands in for an AsyncSession and keeps the SQL of every executed statement."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement, *args, **kwargs):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return _EmptyResult()
+
+
+def _run(repository_class, method, *args, **kwargs):
+    session = RecordingSession()
+    asyncio.run(getattr(repository_class(session), method)(*args, **kwargs))
+    return session.statements
+
+
+def test_subject_listings_skip_deactivated_subjects():
+    calls = [
+        ("get_all",), ("get_by_group_id", 1), ("get_by_teacher_id", 1),
+        ("get_by_assistant_id", 1), ("get_page", 10),
+    ]
+    for method, *args in calls:
+        statements = _run(SubjectRepository, method, *args)
+        assert statements and all(SUBJECT_ACTIVE in sql for sql in statements), method
+
+
+def test_subject_sync_still_sees_deactivated_subjects():
+    statements = _run(SubjectRepository, "get_all", include_inactive=True)
+    assert SUBJECT_ACTIVE not in statements[0]
+    statements = _run(SubjectRepository, "get_by_group_ids", [1, 2])
+    assert SUBJECT_ACTIVE not in statements[0]
+
+
+def test_group_listing_skips_deactivated_groups():
+    assert GROUP_ACTIVE in _run(GroupRepository, "get_all")[0]
+    assert GROUP_ACTIVE not in _run(GroupRepository, "get_all", include_inactive=True)[0]
+
+
+def test_exam_listings_skip_deactivated_subjects_and_groups():
+    calls = [
+        ("get_all_exams_with_details",), ("get_exams_by_teacher_id", 1),
+        ("get_exams_by_group_id", 1), ("get_exams_by_study_program", "C"),
+        ("get_exams_page", 10), ("get_subject_ids_by_group_id", 1),
+        ("get_teacher_exams_by_status", 1, ["approved", "pending"], 10),
+    ]
+    for method, *args in calls:
+        statements = _run(ExamRepository, method, *args)
+        sql = statements[0]
+        assert SUBJECT_ACTIVE in sql and GROUP_ACTIVE in sql, method
+
+
+def test_teacher_dashboard_counts_skip_deactivated_subjects():
+    statements = _run(ExamRepository, "get_teacher_dashboard_summary", 1)
+    counts_sql, next_exam_sql = statements[0], statements[-1]
+    # Both the status counts and the total subjects subquery are filtered
+    assert counts_sql.count(SUBJECT_ACTIVE) == 2
+    assert SUBJECT_ACTIVE in next_exam_sql and GROUP_ACTIVE in next_exam_sql
+
+
+def test_timetable_solver_input_skips_deactivated_subjects_and_groups():
+    sql = _run(ExamRepository, "get_exams_for_timetable", ["pending", "approved"])[0]
+    assert SUBJECT_ACTIVE in sql and GROUP_ACTIVE in sql
+
+
+def test_single_exam_lookup_keeps_deactivated_subjects():
+    # Updating an exam of a deactivated subject must still return the exam
+    sql = _run(ExamRepository, "_get_exam_with_details", 1)[0]
+    assert SUBJECT_ACTIVE not in sql
@@ -0,0 +1,46 @@
+"""Reads go to the replica only in read-only requests, and only until the first write."""
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy import select, update
+
+import config.database as database
+from config.database import RoutingSession
+from config.database_provider import DatabaseSessionMiddleware, get_request_session
+from models.subject import Subject
+
+
+def _session_info_for(method):
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen.update(get_request_session().info)
+
+    asyncio.run(DatabaseSessionMiddleware(app)({"type": "http", "method": method}, None, None))
+    return seen
+
+
+def test_mutating_requests_are_pinned_to_the_primary():
+    for method in ("POST", "PUT", "PATCH", "DELETE"):
+        assert _session_info_for(method).get("wrote") is True, method
+
+
+def test_read_only_requests_may_use_the_replica():
+    for method in ("GET", "HEAD", "OPTIONS"):
+        assert not _session_info_for(method).get("wrote"), method
+
+
+def test_routing_session_picks_the_bind(monkeypatch):
+    primary, replica = object(), object()
+    monkeypatch.setattr(database, "engine", SimpleNamespace(sync_engine=primary))
+    monkeypatch.setattr(database, "replica_engine", SimpleNamespace(sync_engine=replica))
+
+    session = RoutingSession()
+    assert session.get_bind(clause=select(Subject)) is replica
+    assert session.get_bind(clause=update(Subject).values(name="x")) is primary
+    # Reads after a write stay on the primary
+    assert session.get_bind(clause=select(Subject)) is primary
+
+    pinned = RoutingSession()
+    pinned.info["wrote"] = True
+    assert pinned.get_bind(clause=select(Subject)) is primary
@@ -0,0 +1,73 @@
+"""Room conflicts are confirmed in the database, not only in the in-process occupancy index."""
+import asyncio
+from datetime import date, time
+from unittest.mock import AsyncMock, MagicMock
+
+from services.room_occupancy_index import RoomOccupancyIndex
+from services.schedule_service import ScheduleService
+
+EXAM_DATE = date(2030, 1, 15)
+
+
+def _service(schedule_repository, occupancy_index):
+    return ScheduleService(
+        schedule_repository, MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+        occupancy_index=occupancy_index
+    )
+
+
+def test_conflict_missing_from_the_index_is_still_reported():
+    schedule_repository = MagicMock()
+    # The index of this worker has not seen the approval made by another worker
+    schedule_repository.get_by_status = AsyncMock(return_value=[])
+    schedule_repository.get_room_conflicts = AsyncMock(return_value=[{
+        "scheduleId": 7, "subjectId": 3, "subjectName": "Algebra", "roomId": 1, "roomName": "C201",
+        "startTime": time(9), "endTime": time(11)
+    }])
+    service = _service(schedule_repository, RoomOccupancyIndex())
+
+    has_conflicts, messages = asyncio.run(
+        service.check_for_room_conflicts(5, [1], EXAM_DATE, time(10), time(12))
+    )
+
+    assert has_conflicts
+    assert "C201" in messages[0]
+    schedule_repository.get_room_conflicts.assert_awaited_once()
+
+
+def _schedule(schedule_id, start, end, room_ids, status="pending"):
+    schedule = MagicMock(id=schedule_id, date=EXAM_DATE, startTime=start, endTime=end, status=status)
+    schedule.get_room_ids.return_value = room_ids
+    return schedule
+
+
+def test_bulk_approval_confirms_the_accepted_set_in_the_database():
+    schedule_repository = MagicMock()
+    schedule_repository.get_by_status = AsyncMock(return_value=[])
+    # Schedule 2 clashes with exam 9, approved by another worker after the index was loaded
+    schedule_repository.get_room_conflicts_for_schedules = AsyncMock(return_value=[(2, 1, 9)])
+    service = _service(schedule_repository, RoomOccupancyIndex())
+    first = _schedule(1, time(8), time(10), [1])
+    second = _schedule(2, time(12), time(14), [1])
+
+    accepted, skipped, conflicts = asyncio.run(service._check_bulk_approval([first, second], False))
+
+    assert [schedule.id for schedule in accepted] == [1]
+    assert conflicts == {2: [(1, 9)]}
+    checked_ids = schedule_repository.get_room_conflicts_for_schedules.await_args.args[0]
+    assert sorted(checked_ids) == [1, 2]
+    assert not service.occupancy_index.is_loaded
+
+
+def test_bulk_approval_keeps_conflicts_when_they_are_allowed():
+    schedule_repository = MagicMock()
+    schedule_repository.get_by_status = AsyncMock(return_value=[])
+    schedule_repository.get_room_conflicts_for_schedules = AsyncMock(return_value=[(2, 1, 9)])
+    service = _service(schedule_repository, RoomOccupancyIndex())
+
+    accepted, _, conflicts = asyncio.run(service._check_bulk_approval(
+        [_schedule(1, time(8), time(10), [1]), _schedule(2, time(12), time(14), [1])], True
+    ))
+
+    assert [schedule.id for schedule in accepted] == [1, 2]
+    assert conflicts == {2: [(1, 9)]}
@@ -0,0 +1,245 @@
+"""Concurrent units of work each get their own session, shared inside the unit and closed at its end.
+
+The tests marked postgres run against the database given by DATABASE_URL, in a throwaway
+schema, and are skipped without it.
+"""
+import asyncio
+import os
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+import config.database_provider as database_provider
+from config.database_provider import get_request_session, session_scope
+from models.base import Base
+import models.config  # noqa: F401  (registers every table on Base.metadata)
+import models.excel_template  # noqa: F401
+import models.group  # noqa: F401
+import models.notification  # noqa: F401
+import models.room  # noqa: F401
+import models.schedule  # noqa: F401
+import models.subject  # noqa: F401
+import models.user  # noqa: F401
+from models.room import Room
+from models.user import User
+from repositories.room_repository import RoomRepository
+from repositories.user_repository import UserRepository
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+needs_database = pytest.mark.skipif(not DATABASE_URL, reason="DATABASE_URL is not set")
+
+SCOPES = 20
+
+
+def _track(session, closed, rolled_back):
+    """Replace the session's close/rollback with recorders; SessionLocal() does not connect."""
+    async def close():
+        closed.append(session)
+
+    async def rollback():
+        rolled_back.append(session)
+
+    session.close = close
+    session.rollback = AsyncMock(side_effect=rollback)
+    return session
+
+
+def test_concurrent_scopes_get_distinct_sessions_and_close_them():
+    closed, rolled_back = [], []
+
+    async def unit_of_work():
+        async with session_scope():
+            first = _track(get_request_session(), closed, rolled_back)
+            # Let the other scopes run between the two lookups
+            await asyncio.sleep(0)
+            second = get_request_session()
+            await asyncio.sleep(0)
+            assert get_request_session() is first
+            return first, second
+
+    async def main():
+        return await asyncio.gather(*(unit_of_work() for _ in range(SCOPES)))
+
+    results = asyncio.run(main())
+
+    sessions = [first for first, _ in results]
+    assert all(first is second for first, second in results)
+    assert len({id(session) for session in sessions}) == SCOPES
+    assert sorted(map(id, closed)) == sorted(map(id, sessions))
+    assert not rolled_back
+
+
+def test_failed_scope_rolls_back_and_closes():
+    closed, rolled_back = [], []
+
+    async def failing_unit_of_work():
+        async with session_scope():
+            _track(get_request_session(), closed, rolled_back)
+            raise RuntimeError("boom")
+
+    async def main():
+        return await asyncio.gather(*(failing_unit_of_work() for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(rolled_back) == 3 and len(closed) == 3
+    assert {id(session) for session in rolled_back} == {id(session) for session in closed}
+
+
+def test_scope_without_queries_never_creates_a_session(monkeypatch):
+    created = []
+    monkeypatch.setattr(database_provider, "SessionLocal", lambda: created.append(1))
+
+    async def main():
+        async with session_scope():
+            await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert not created
+
+
+def test_session_lookup_outside_a_scope_fails():
+    with pytest.raises(RuntimeError):
+        get_request_session()
+
+
+async def _with_database(work, pool_size=5, pools=None):
+    """Run work() with session_scope() bound to a fresh schema of the DATABASE_URL server.
+
+    The schema is dropped afterwards, whatever the scopes committed. The engine's pool is
+    appended to pools, if given, so tests can inspect it.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    schema = f"session_scope_{uuid.uuid4().hex[:8]}"
+    engine = create_async_engine(
+        DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
+        pool_size=pool_size, max_overflow=0,
+        connect_args={"server_settings": {"search_path": schema}}
+    )
+    session_local = database_provider.SessionLocal
+    try:
+        async with engine.begin() as connection:
+            await connection.execute(text(f"CREATE SCHEMA {schema}"))
+            await connection.run_sync(Base.metadata.create_all)
+        database_provider.SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=True)
+        if pools is not None:
+            pools.append(engine.pool)
+        return await work()
+    finally:
+        database_provider.SessionLocal = session_local
+        async with engine.begin() as connection:
+            await connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        await engine.dispose()
+
+
+def _room(name):
+    return Room(name=name, shortName=name, buildingName="C", capacity=30, computers=0)
+
+
+@pytest.mark.postgres
+@needs_database
+def test_repository_writes_persist_after_the_scope_closes():
+    async def work():
+        async with session_scope():
+            rooms = RoomRepository(get_request_session())
+            # Every commit expires the instances of the session, so keep the IDs right away
+            kept_id = (await rooms.create(_room("C201"))).id
+            removed_id = (await rooms.create(_room("C202"))).id
+            user_id = (await UserRepository(get_request_session()).create(
+                User(firstName="Ana", lastName="Pop", email="ana.pop@usv.ro", role="CD")
+            )).id
+
+        # Same calls as PUT /rooms/{id}, DELETE /rooms/{id} and PUT /users/{id}
+        async with session_scope():
+            rooms = RoomRepository(get_request_session())
+            room = await rooms.get_by_id(kept_id)
+            room.capacity = 120
+            await rooms.update(room)
+            assert await rooms.delete(removed_id)
+            users = UserRepository(get_request_session())
+            user = await users.get_by_id(user_id)
+            user.phone = "0740000000"
+            await users.update(user)
+
+        async with session_scope():
+            rooms = RoomRepository(get_request_session())
+            assert (await rooms.get_by_id(kept_id)).capacity == 120
+            assert await rooms.get_by_id(removed_id) is None
+            assert (await UserRepository(get_request_session()).get_by_id(user_id)).phone == "0740000000"
+
+    asyncio.run(_with_database(work))
+
+
+@pytest.mark.postgres
+@needs_database
+def test_concurrent_scopes_use_their_own_connections_and_transactions():
+    from sqlalchemy import text
+
+    in_transaction = 0
+    all_in = asyncio.Event()
+
+    async def unit_of_work(index):
+        nonlocal in_transaction
+        async with session_scope():
+            session = get_request_session()
+            backend_pid = (await session.execute(text("SELECT pg_backend_pid()"))).scalar()
+            # Hold every connection until all the scopes have one, so none can be reused
+            in_transaction += 1
+            if in_transaction == SCOPES:
+                all_in.set()
+            await asyncio.wait_for(all_in.wait(), timeout=30)
+
+            if index % 2:
+                session.add(_room(f"failed-{index}"))
+                await session.flush()
+                raise RuntimeError("request failed")
+            await RoomRepository(session).create(_room(f"kept-{index}"))
+            return backend_pid
+
+    async def work():
+        results = await asyncio.gather(*(unit_of_work(index) for index in range(SCOPES)), return_exceptions=True)
+        async with session_scope():
+            names = {room.name for room in await RoomRepository(get_request_session()).get_all()}
+        return results, names
+
+    results, names = asyncio.run(_with_database(work, pool_size=SCOPES))
+
+    backend_pids = [result for result in results if not isinstance(result, Exception)]
+    assert len(backend_pids) == SCOPES // 2
+    assert all(isinstance(result, RuntimeError) for result in results[1::2])
+    # Every scope held its own server connection at the same time
+    assert len(set(backend_pids)) == len(backend_pids)
+    # Committed scopes kept their rows, failed ones were rolled back
+    assert names == {f"kept-{index}" for index in range(0, SCOPES, 2)}
+
+
+@pytest.mark.postgres
+@needs_database
+def test_more_scopes_than_connections_queue_on_the_pool():
+    from sqlalchemy import text
+
+    pools = []
+
+    async def unit_of_work(index):
+        async with session_scope():
+            session = get_request_session()
+            await session.execute(text("SELECT pg_sleep(0.01)"))
+            await RoomRepository(session).create(_room(f"room-{index}"))
+
+    async def work():
+        await asyncio.gather(*(unit_of_work(index) for index in range(SCOPES * 5)))
+        async with session_scope():
+            count = len(await RoomRepository(get_request_session()).get_all())
+        return count, pools[0].checkedout()
+
+    count, checked_out = asyncio.run(_with_database(work, pool_size=5, pools=pools))
+
+    assert count == SCOPES * 5
+    # Every scope gave its connection back
+    assert checked_out == 0
@@ -0,0 +1,67 @@
+"""The teacher dashboard takes its stats from the aggregate queries and caps the exam lists."""
+import asyncio
+from datetime import date, time, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+from services.exam_service import ExamService
+
+TOMORROW = date.today() + timedelta(days=1)
+
+
+def _exam(exam_id, subject_id, status, exam_date=None, start=None):
+    return {
+        "id": exam_id, "subjectId": subject_id, "subjectName": f"Subject {subject_id}",
+        "subjectShortName": f"S{subject_id}", "teacherId": 4, "teacherName": "Ana Pop",
+        "teacherEmail": "ana@usv.ro", "teacherPhone": None, "status": status,
+        "date": exam_date, "startTime": start, "endTime": None,
+        "groupId": 1, "groupName": "3141", "specializationShortName": "C", "studyYear": 3
+    }
+
+
+def _service(exams_by_status):
+    repository = MagicMock()
+    repository.get_exams_by_teacher_id = AsyncMock(return_value=[])
+    repository.get_teacher_exams_by_status = AsyncMock(return_value=exams_by_status)
+    repository.get_teacher_dashboard_summary = AsyncMock(return_value={
+        "statusCounts": {"approved": 250, "pending": 1},
+        "totalSubjects": 40,
+        "nextExam": _exam(2, 10, "approved", TOMORROW, time(9))
+    })
+    return ExamService(repository, MagicMock()), repository
+
+
+def test_dashboard_with_exams_takes_the_stats_from_the_aggregate():
+    service, repository = _service({
+        "approved": [_exam(2, 10, "approved", TOMORROW, time(9)), _exam(1, 10, "approved", TOMORROW, time(12))],
+        "pending": [_exam(3, 11, "pending")],
+        "proposed": [],
+        "rejected": [],
+    })
+
+    dashboard = asyncio.run(service.get_teacher_dashboard(4, exams_limit=2))
+
+    repository.get_teacher_dashboard_summary.assert_awaited_once_with(4)
+    repository.get_teacher_exams_by_status.assert_awaited_once_with(
+        4, ["approved", "pending", "proposed", "rejected"], 2
+    )
+    repository.get_exams_by_teacher_id.assert_not_awaited()
+    # The stats count every exam, not just the ones in the capped lists
+    assert dashboard["stats"] == {
+        "totalSubjects": 40, "scheduledExams": 250, "pendingExams": 1,
+        "pendingProposals": 0, "rejectedExams": 0
+    }
+    assert dashboard["nextExam"].id == 2
+    assert [exam.id for exam in dashboard["scheduledExams"]] == [2, 1]
+    assert [exam.id for exam in dashboard["pendingExams"]] == [3]
+    assert dashboard["pendingProposals"] == [] and dashboard["rejectedExams"] == []
+
+
+def test_dashboard_summary_only_skips_the_exam_lists():
+    service, repository = _service({})
+
+    dashboard = asyncio.run(service.get_teacher_dashboard(4, include_exams=False))
+
+    repository.get_teacher_exams_by_status.assert_not_awaited()
+    repository.get_exams_by_teacher_id.assert_not_awaited()
+    assert dashboard["stats"]["scheduledExams"] == 250
+    assert "scheduledExams" not in dashboard
@@ -9,6 +9,7 @@ from quart import Quart, render_template_string
 # Remove Flasgger import which is causing context issues
 # from flasgger import Swagger
 from routes.api import api_bp
+from services.http_clients import start_http_clients, close_http_clients
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -76,6 +77,16 @@ def create_app(test_config=None):
     # Register blueprints
     app.register_blueprint(api_bp)
     
+    # Keep one pool of HTTP connections to the USV API and to FastAPI for the
+    # lifetime of the app instead of reconnecting on every call
+    @app.before_serving
+    async def open_http_clients():
+        await start_http_clients()
+    
+    @app.after_serving
+    async def shutdown_http_clients():
+        await close_http_clients()
+    
     # Ensure the instance folder exists
     try:
         os.makedirs(app.instance_path)
@@ -37,9 +37,35 @@ ROOMS_ENDPOINT = "https://orar.usv.ro/orar/vizualizare/data/sali.php?json"
 FACULTY_STAFF_ENDPOINT = "https://orar.usv.ro/orar/vizualizare/data/cadre.php?json"
 GROUP_SUBJECTS_ENDPOINT = "https://orar.usv.ro/orar/vizualizare/data/orarSPG.php?ID={group_id}&mod=grupa&json"
 
+# USV subject fetching: requests in flight at once, requests per second to one host,
+# retries of a failed request and the base delay (seconds) of the exponential backoff
+USV_FETCH_CONCURRENCY = int(os.environ.get("USV_FETCH_CONCURRENCY", 8))
+USV_RATE_LIMIT_PER_HOST = float(os.environ.get("USV_RATE_LIMIT_PER_HOST", 10))
+USV_FETCH_RETRIES = int(os.environ.get("USV_FETCH_RETRIES", 3))
+USV_RETRY_BACKOFF = float(os.environ.get("USV_RETRY_BACKOFF", 0.5))
+# Seconds allowed for one subject request
+USV_SUBJECTS_TIMEOUT = float(os.environ.get("USV_SUBJECTS_TIMEOUT", 60))
+
 # FastAPI service URL
 FASTAPI_BASE_URL = os.environ.get("FASTAPI_BASE_URL", "http://localhost:8000")
 
+# Rows sent per request to the FastAPI bulk endpoints
+STORE_BATCH_SIZE = int(os.environ.get("STORE_BATCH_SIZE", 500))
+# Seconds allowed for one bulk request
+STORE_BATCH_TIMEOUT = float(os.environ.get("STORE_BATCH_TIMEOUT", 120))
+
+# Shared HTTP clients, kept open for the lifetime of the app
+# Connections to the USV API (httpx); HTTP/2 is used when the h2 package is installed
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_MAX_CONNECTIONS", 20))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("HTTP_MAX_KEEPALIVE_CONNECTIONS", 10))
+HTTP_KEEPALIVE_EXPIRY = float(os.environ.get("HTTP_KEEPALIVE_EXPIRY", 30))
+HTTP_ENABLE_HTTP2 = os.environ.get("HTTP_ENABLE_HTTP2", "true").lower() in ("1", "true", "yes")
+# Connections to FastAPI (aiohttp)
+STORE_MAX_CONNECTIONS = int(os.environ.get("STORE_MAX_CONNECTIONS", 10))
+
+# Minimum difflib similarity (0-1) for matching a teacher name that has no exact match
+TEACHER_MATCH_CUTOFF = float(os.environ.get("TEACHER_MATCH_CUTOFF", 0.88))
+
 # Define target faculties to include in synchronization
 TARGET_FACULTIES = [
     "Facultatea de Inginerie Electrică şi Ştiinţa Calculatoarelor",  # FIESC
@@ -10,7 +10,7 @@ from services.api_service import (
     fetch_groups, 
     fetch_rooms,
     fetch_faculty_staff,
-    fetch_group_subjects
+    fetch_subjects_for_groups
 )
 from services.transform_service import (
     transform_groups, 
@@ -22,8 +22,10 @@ from services.store_service import (
     store_groups_in_db, 
     store_rooms_in_db,
     store_faculty_staff_in_db,
-    store_subjects_in_db
+    store_subjects_in_db,
+    get_all_users_with_role
 )
+from services.http_clients import get_store_session
 
 # Create a logger for this module
 logger = logging.getLogger(__name__)
@@ -53,8 +55,19 @@ async def fetch_and_sync_data():
     4. Fetch faculty staff
     5. Transform data to match our API format
     6. Send to FastAPI for storage
+    
+    The mode is read from the JSON body or the query string. "full" (the default) sends
+    the records to the bulk insert endpoints of a freshly emptied database; "incremental"
+    sends each entity as a snapshot to its /sync endpoint, which writes only the changes.
     """
     try:
+        body = await request.get_json(silent=True) or {}
+        mode = body.get("mode") or request.args.get("mode", "full")
+        if mode not in ("full", "incremental"):
+            return jsonify({"success": False, "error": f"Unknown sync mode '{mode}'"}), 400
+        incremental = mode == "incremental"
+        logger.info(f"Starting {mode} synchronization")
+        
         # Part 1: Process Groups 
         # -----------------------
         # Step 1: Fetch faculties and find FIESC
@@ -86,7 +99,7 @@ async def fetch_and_sync_data():
                 transformed_groups = await transform_groups(fiesc_groups)
                 
                 # Step 4: Send groups to FastAPI for storage
-                group_results = await store_groups_in_db(transformed_groups)
+                group_results = await store_groups_in_db(transformed_groups, incremental)
         
         # Part 2: Process Rooms
         # ---------------------
@@ -98,7 +111,7 @@ async def fetch_and_sync_data():
         transformed_rooms = await transform_rooms(all_rooms)
         
         # Step 3: Send rooms to FastAPI for storage
-        room_results = await store_rooms_in_db(transformed_rooms)
+        room_results = await store_rooms_in_db(transformed_rooms, incremental)
         
         # Part 3: Process Faculty Staff (Users)
         # ------------------------------------
@@ -110,7 +123,7 @@ async def fetch_and_sync_data():
         transformed_staff = await transform_faculty_staff(all_staff)
         
         # Step 3: Send faculty staff to FastAPI for storage
-        staff_results = await store_faculty_staff_in_db(transformed_staff)
+        staff_results = await store_faculty_staff_in_db(transformed_staff, incremental)
         
         # Part 4: Process Subjects
         # ---------------------
@@ -120,7 +133,15 @@ async def fetch_and_sync_data():
         all_subject_results = []
         total_subjects_processed = 0
         
-        # For each FIESC group that we successfully synced, fetch its subjects
+        # Load the teaching staff once; every subject's teacher and assistants are then
+        # resolved locally instead of with one search request per name
+        teacher_index = await get_all_users_with_role(get_store_session(), "CD")
+        
+        # For each FIESC group that we successfully synced, collect its USV group IDs
+        groups_to_fetch = []
+        transformed_by_name = {}
+        for group in transformed_groups:
+            transformed_by_name.setdefault(group.get("name"), group)
         for group_result in group_results:
             if group_result.get("status") != "success" or not group_result.get("id"):
                 continue
@@ -129,41 +150,31 @@ async def fetch_and_sync_data():
             group_name = group_result.get("group")
             
             # Find the original group in our transformed groups to get USV group IDs
-            original_group = None
-            for group in transformed_groups:
-                if group.get("name") == group_name:
-                    original_group = group
-                    break
-                    
+            original_group = transformed_by_name.get(group_name)
             if not original_group or not original_group.get("groupIds"):
                 logger.warning(f"Could not find original group data for '{group_name}', skipping subject fetch")
                 continue
             
-            # Collect all subject data from all USV group IDs for this database group
-            all_group_subject_data = []
-            
-            # Fetch subjects for each groupId from the USV API
-            for usv_group_id in original_group.get("groupIds", []):
-                logger.info(f"Fetching subjects for group {group_name} (USV ID: {usv_group_id})")
-                
-                # Fetch subject data from USV API
-                subject_data = await fetch_group_subjects(usv_group_id)
-                
-                if not subject_data or not subject_data[0]:
-                    logger.warning(f"No subject data found for group {group_name} (USV ID: {usv_group_id})")
-                    continue
-                
-                # Combine all activities from all USV group IDs for this database group
-                if all_group_subject_data:
-                    # If we already have data, append the new activities to the existing list
-                    all_group_subject_data[0].extend(subject_data[0])
-                    # Preserve the second element (ID mapping) as is
-                else:
-                    # First subject data for this group - use as is
-                    all_group_subject_data = subject_data
+            groups_to_fetch.append(((group_db_id, group_name), original_group.get("groupIds", [])))
+        
+        # Fetch the subjects of all groups concurrently; each group is transformed and
+        # stored as soon as all of its USV group IDs have been downloaded
+        logger.info(f"Fetching subjects for {len(groups_to_fetch)} groups")
+        async for (group_db_id, group_name), all_group_subject_data in fetch_subjects_for_groups(groups_to_fetch):
+            # Skip the group if any of its USV group IDs failed; syncing the rest would
+            # deactivate the subjects of the missing ones
+            if all_group_subject_data is None:
+                logger.warning(f"Not syncing the subjects of group {group_name}: fetching them failed")
+                all_subject_results.append({
+                    "group": group_name,
+                    "status": "error",
+                    "message": "Not synced because its subjects could not be fetched from the USV API"
+                })
+                continue
             
             # Skip if we didn't find any subject data for this group
             if not all_group_subject_data:
+                logger.warning(f"No subject data found for group {group_name}")
                 continue
                 
             # Now transform all collected subject data at once for this group
@@ -174,13 +185,14 @@ async def fetch_and_sync_data():
             
             # Send subjects to FastAPI for storage
             if transformed_subjects:
-                subject_results = await store_subjects_in_db(transformed_subjects)
+                subject_results = await store_subjects_in_db(transformed_subjects, incremental, teacher_index)
                 all_subject_results.extend(subject_results)
         
         logger.info(f"Completed subject synchronization: processed {total_subjects_processed} total subjects")
         
         return jsonify({
             "success": True,
+            "mode": mode,
             "message": f"Successfully processed {len(transformed_groups)} groups, {len(transformed_rooms)} rooms, {len(transformed_staff)} faculty staff, and {total_subjects_processed} subjects",
             "groups": {
                 "count": len(transformed_groups),
@@ -1,4 +1,6 @@
 """Services for fetching data from external APIs using async patterns."""
+import asyncio
+import random
 import httpx
 from config.settings import (
     FACULTY_ENDPOINT, 
@@ -6,65 +8,188 @@ from config.settings import (
     ROOMS_ENDPOINT,
     FACULTY_STAFF_ENDPOINT,
     GROUP_SUBJECTS_ENDPOINT,
+    USV_FETCH_CONCURRENCY,
+    USV_RATE_LIMIT_PER_HOST,
+    USV_FETCH_RETRIES,
+    USV_RETRY_BACKOFF,
+    USV_SUBJECTS_TIMEOUT,
     logger
 )
+from services.http_clients import get_usv_client
 
 async def fetch_faculties():
     """Fetch faculty data from USV API using async HTTP requests"""
     logger.info("Fetching faculties from USV API")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(FACULTY_ENDPOINT, timeout=30)
-        response.raise_for_status()  # Raise exception for 4XX/5XX responses
-        return response.json()
+    response = await get_usv_client().get(FACULTY_ENDPOINT, timeout=30)
+    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+    return response.json()
 
 async def fetch_groups():
     """Fetch group data from USV API using async HTTP requests"""
     logger.info("Fetching groups from USV API")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(GROUPS_ENDPOINT, timeout=30)
-        response.raise_for_status()  # Raise exception for 4XX/5XX responses
-        return response.json()
+    response = await get_usv_client().get(GROUPS_ENDPOINT, timeout=30)
+    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+    return response.json()
 
 async def fetch_rooms():
     """Fetch room data from USV API using async HTTP requests"""
     logger.info("Fetching rooms from USV API")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(ROOMS_ENDPOINT, timeout=30)
-        response.raise_for_status()  # Raise exception for 4XX/5XX responses
-        return response.json()
+    response = await get_usv_client().get(ROOMS_ENDPOINT, timeout=30)
+    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+    return response.json()
 
 async def fetch_faculty_staff():
     """Fetch faculty staff data from USV API using async HTTP requests"""
     logger.info("Fetching faculty staff from USV API")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(FACULTY_STAFF_ENDPOINT, timeout=30)
-        response.raise_for_status()  # Raise exception for 4XX/5XX responses
-        return response.json()
+    response = await get_usv_client().get(FACULTY_STAFF_ENDPOINT, timeout=30)
+    response.raise_for_status()  # Raise exception for 4XX/5XX responses
+    return response.json()
 
-async def fetch_group_subjects(group_id):
+class HostRateLimiter:
+    """Spaces out requests so that each host gets at most `rate` requests per second"""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url):
+        """Sleep until a request to the host of `url` is allowed"""
+        if not self.interval:
+            return
+        host = httpx.URL(url).host
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+def _retry_delay(attempt, response=None):
+    """Exponential backoff with jitter, or the server's Retry-After when it sends one"""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+    return USV_RETRY_BACKOFF * (2 ** attempt) + random.uniform(0, USV_RETRY_BACKOFF)
+
+async def get_json_with_retry(client, url, timeout, limiter=None):
+    """GET a JSON document, retrying transport errors, 429 and 5xx responses
+    
+    Args:
+        client (httpx.AsyncClient): The shared HTTP client
+        url (str): URL to fetch
+        timeout (float): Seconds allowed for one attempt
+        limiter (HostRateLimiter, optional): Per-host rate limiter
+        
+    Returns:
+        The decoded JSON body
+        
+    Raises:
+        httpx.HTTPError: If the last attempt fails
+    """
+    for attempt in range(USV_FETCH_RETRIES + 1):
+        if limiter is not None:
+            await limiter.wait(url)
+        response = None
+        try:
+            response = await client.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            retryable = response is None or response.status_code == 429 or response.status_code >= 500
+            if not retryable or attempt == USV_FETCH_RETRIES:
+                raise
+            delay = _retry_delay(attempt, response)
+            logger.warning(f"Request to {url} failed ({str(e)}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt + 1}/{USV_FETCH_RETRIES})")
+            await asyncio.sleep(delay)
+
+async def fetch_group_subjects(group_id, client=None, limiter=None):
     """Fetch subject data for a specific group from USV API
     
     Args:
         group_id (str): The ID of the group to fetch subjects for
+        client (httpx.AsyncClient, optional): Client to use, defaults to the shared USV client
+        limiter (HostRateLimiter, optional): Per-host rate limiter
         
     Returns:
         list: The list of subjects for the group
+        
+    Raises:
+        httpx.HTTPError: If the request still fails after all retries
     """
     logger.info(f"Fetching subjects for group ID {group_id} from USV API")
     endpoint = GROUP_SUBJECTS_ENDPOINT.format(group_id=group_id)
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(endpoint, timeout=60)  # Longer timeout for subject data
-            response.raise_for_status()
-            data = response.json()
-            
-            # The API returns a list where the first element is the array of subjects
-            # and the second element is a dictionary mapping activity IDs to group names
-            if data and isinstance(data, list) and len(data) > 0:
-                return data
-            return [[], {}]  # Return empty data structure if no data
-            
-        except Exception as e:
-            logger.error(f"Error fetching subjects for group {group_id}: {str(e)}")
-            return [[], {}]  # Return empty data structure on error
+    try:
+        data = await get_json_with_retry(client or get_usv_client(), endpoint, USV_SUBJECTS_TIMEOUT, limiter)
+    except Exception as e:
+        logger.error(f"Error fetching subjects for group {group_id}: {str(e)}")
+        raise
+    
+    # The API returns a list where the first element is the array of subjects
+    # and the second element is a dictionary mapping activity IDs to group names
+    if data and isinstance(data, list) and len(data) > 0:
+        return data
+    return [[], {}]  # Return empty data structure if no data
+
+async def fetch_subjects_for_groups(groups):
+    """Fetch the subjects of many groups concurrently, yielding each group as soon as it is complete
+    
+    All requests go through the shared USV client. At most USV_FETCH_CONCURRENCY
+    requests are in flight, each host gets at most USV_RATE_LIMIT_PER_HOST requests per
+    second, and failed requests are retried with exponential backoff. Because groups are yielded in
+    completion order, the caller can transform and store a group while the others are
+    still downloading.
+    
+    Args:
+        groups (list): (key, usv_group_ids) pairs; key is handed back unchanged
+        
+    Yields:
+        tuple: (key, subject_data) where subject_data combines the activities of all the
+            USV group IDs of the group, is empty if none returned data, or is None if any
+            of them could not be fetched
+    """
+    semaphore = asyncio.Semaphore(USV_FETCH_CONCURRENCY)
+    limiter = HostRateLimiter(USV_RATE_LIMIT_PER_HOST)
+    client = get_usv_client()
+    
+    async def fetch_one(usv_group_id):
+        async with semaphore:
+            return await fetch_group_subjects(usv_group_id, client, limiter)
+    
+    async def fetch_group(key, usv_group_ids):
+        responses = await asyncio.gather(
+            *(fetch_one(usv_group_id) for usv_group_id in usv_group_ids), return_exceptions=True
+        )
+        
+        # A partial snapshot would deactivate the subjects of the failed USV group IDs
+        failed = [usv_group_id for usv_group_id, response in zip(usv_group_ids, responses)
+                  if isinstance(response, Exception)]
+        if failed:
+            logger.error(f"Could not fetch the subjects of USV group IDs {failed} for group {key}")
+            return key, None
+        
+        # Combine all activities from all USV group IDs of this database group,
+        # keeping the ID mapping of the first response that had data
+        combined = []
+        for usv_group_id, subject_data in zip(usv_group_ids, responses):
+            if not subject_data or not subject_data[0]:
+                logger.warning(f"No subject data found for USV group ID {usv_group_id}")
+                continue
+            if combined:
+                combined[0].extend(subject_data[0])
+            else:
+                combined = subject_data
+        return key, combined
+    
+    tasks = [asyncio.ensure_future(fetch_group(key, usv_group_ids)) for key, usv_group_ids in groups]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Stop the remaining downloads if the caller gives up early
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,73 @@
+"""Application-lifetime HTTP clients shared by the fetch and store services."""
+import importlib.util
+import aiohttp
+import httpx
+from config.settings import (
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    HTTP_KEEPALIVE_EXPIRY,
+    HTTP_ENABLE_HTTP2,
+    STORE_MAX_CONNECTIONS,
+    logger
+)
+
+# Clients created by start_http_clients (or on first use) and closed by close_http_clients
+_clients = {}
+
+def _http2_available():
+    """HTTP/2 in httpx needs the optional h2 package"""
+    return HTTP_ENABLE_HTTP2 and importlib.util.find_spec("h2") is not None
+
+def get_usv_client():
+    """Get the shared httpx client used for the USV API
+    
+    Connections are kept alive between calls, so repeated requests to the USV API
+    reuse their TCP and TLS sessions instead of opening new ones.
+    
+    Returns:
+        httpx.AsyncClient: The shared client
+    """
+    client = _clients.get("usv")
+    if client is None or client.is_closed:
+        http2 = _http2_available()
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+        _clients["usv"] = client
+        logger.info(f"Opened shared USV HTTP client (HTTP/2: {http2}, max connections: {HTTP_MAX_CONNECTIONS})")
+    return client
+
+def get_store_session():
+    """Get the shared aiohttp session used for the FastAPI endpoints
+    
+    Returns:
+        aiohttp.ClientSession: The shared session
+    """
+    session = _clients.get("store")
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=STORE_MAX_CONNECTIONS, keepalive_timeout=HTTP_KEEPALIVE_EXPIRY)
+        )
+        _clients["store"] = session
+        logger.info(f"Opened shared FastAPI HTTP session (max connections: {STORE_MAX_CONNECTIONS})")
+    return session
+
+async def start_http_clients():
+    """Open the shared clients; called once when the app starts serving"""
+    get_usv_client()
+    get_store_session()
+
+async def close_http_clients():
+    """Close the shared clients; called once when the app stops serving"""
+    client = _clients.pop("usv", None)
+    if client is not None:
+        await client.aclose()
+    session = _clients.pop("store", None)
+    if session is not None:
+        await session.close()
+    logger.info("Closed shared HTTP clients")
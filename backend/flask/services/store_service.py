@@ -1,412 +1,167 @@
 """Services for storing data in the FastAPI database."""
-import asyncio
 import aiohttp
-import requests  # Keep for compatibility with non-async functions
-import concurrent.futures
 from typing import List, Dict, Any
-from config.settings import logger, FASTAPI_BASE_URL, skipped_faculty_logger
+from services.http_clients import get_store_session
+from services.teacher_index import TeacherNameIndex
+from config.settings import logger, FASTAPI_BASE_URL, STORE_BATCH_SIZE, STORE_BATCH_TIMEOUT, skipped_faculty_logger
 
-async def process_group(session, group, index):
-    """Process a single group with error handling"""
-    try:
-        # Log the group data being sent (only for first few)
-        if index < 3:
-            logger.info(f"Sending group data: {group}")
-            
-        # Make the API request
-        async with session.post(
-            f"{FASTAPI_BASE_URL}/groups", 
-            json=group,
-            timeout=15
-        ) as response:
-            response.raise_for_status()
-            response_data = await response.json()
-            
-            # Process successful response
-            group_id = response_data.get("id")
-            
-            # Log success (only for first few)
-            if index < 3:
-                logger.info(f"Successfully created group: '{group['name']}' with ID {group_id}")
-                
-            return {
-                "group": group["name"],
-                "status": "success",
-                "id": group_id
-            }, True  # Success flag
-            
-    except Exception as e:
-        error_msg = str(e)
+async def post_in_batches(session, path, items, result_key, describe, batch_size=None):
+    """Send items to a FastAPI bulk endpoint in chunks of STORE_BATCH_SIZE
+    
+    Each chunk is validated and inserted by FastAPI in one transaction, so a sync
+    makes one request per chunk instead of one per record.
+    
+    Args:
+        session (aiohttp.ClientSession): The HTTP client session
+        path (str): Bulk endpoint path, e.g. "/groups/bulk"
+        items (list): Records to store
+        result_key (str): Key naming the record in each result ("group", "room", ...)
+        describe (Callable): Returns the display name of a record
+        batch_size (int, optional): Records per request, defaults to STORE_BATCH_SIZE
         
-        # Log the error with request details
-        logger.error(f"Error creating group '{group['name']}': {error_msg}")
-        if hasattr(e, 'response') and e.response is not None:
-            logger.error(f"Response status: {e.response.status}, Content: {await e.response.text()}")
-            
-        return {
-            "group": group["name"],
-            "status": "error",
-            "message": error_msg
-        }, False  # Error flag
-
-async def store_groups_async(groups):
-    """Send groups to FastAPI endpoint for storage using async"""
+    Returns:
+        tuple: (results, success_count, error_count), one result per record in input order
+    """
     results = []
     success_count = 0
     error_count = 0
+    timeout = aiohttp.ClientTimeout(total=STORE_BATCH_TIMEOUT)
+    batch_size = batch_size or STORE_BATCH_SIZE
+    
+    for start in range(0, len(items), batch_size):
+        batch = items[start:start + batch_size]
+        try:
+            async with session.post(
+                f"{FASTAPI_BASE_URL}{path}",
+                json=batch,
+                timeout=timeout
+            ) as response:
+                if response.status >= 400:
+                    raise Exception(f"HTTP {response.status}: {(await response.text())[:200]}")
+                response_data = await response.json()
+            outcomes = {outcome["index"]: outcome for outcome in response_data.get("results", [])}
+        except Exception as e:
+            logger.error(f"Error storing {result_key} batch {start}-{start + len(batch) - 1} via {path}: {str(e)}")
+            outcomes = {index: {"error": str(e)} for index in range(len(batch))}
+        
+        for index, item in enumerate(batch):
+            outcome = outcomes.get(index, {"error": "Missing from bulk response"})
+            if outcome.get("id") is not None:
+                results.append({result_key: describe(item), "status": "success", "id": outcome["id"]})
+                success_count += 1
+            else:
+                logger.error(f"Error creating {result_key} '{describe(item)}': {outcome.get('error')}")
+                results.append({result_key: describe(item), "status": "error", "message": outcome.get("error")})
+                error_count += 1
+        
+        logger.info(f"Stored {min(start + batch_size, len(items))}/{len(items)} {result_key} records via {path}")
     
-    logger.info(f"Starting to store {len(groups)} groups in database using concurrent requests")
-    
-    # Process in batches to avoid overwhelming the server
-    batch_size = 10
-    
-    async with aiohttp.ClientSession() as session:
-        for i in range(0, len(groups), batch_size):
-            batch = groups[i:i+batch_size]
-            batch_tasks = [process_group(session, group, i+j) for j, group in enumerate(batch)]
-            batch_results = await asyncio.gather(*batch_tasks)
-            
-            # Process results
-            for result, success in batch_results:
-                results.append(result)
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
+    return results, success_count, error_count
+
+async def post_records(session, entity, items, result_key, describe, incremental=False):
+    """Send records to the bulk endpoint of an entity, or to its sync endpoint
     
-    # Log summary of results
-    logger.info(f"Group synchronization completed: {success_count} succeeded, {error_count} failed")
+    In incremental mode the records are a snapshot that FastAPI diffs against the
+    stored rows, so they are sent in a single request: splitting them would make
+    every chunk deactivate the rows of the others.
     
-    return results
+    Args:
+        session (aiohttp.ClientSession): The HTTP client session
+        entity (str): Path segment of the entity, e.g. "groups"
+        items (list): Records to store
+        result_key (str): Key naming the record in each result
+        describe (Callable): Returns the display name of a record
+        incremental (bool): Use /<entity>/sync instead of /<entity>/bulk
+        
+    Returns:
+        tuple: (results, success_count, error_count)
+    """
+    if incremental:
+        return await post_in_batches(session, f"/{entity}/sync", items, result_key, describe, batch_size=max(len(items), 1))
+    return await post_in_batches(session, f"/{entity}/bulk", items, result_key, describe)
 
-async def store_groups_in_db(groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Store groups in the FastAPI database via API calls.
+async def store_groups_in_db(groups: List[Dict[str, Any]], incremental: bool = False) -> List[Dict[str, Any]]:
+    """Store groups in the FastAPI database via the bulk endpoint.
     
     Args:
         groups (List[Dict[str, Any]]): List of group objects to store
+        incremental (bool): Send the groups as a snapshot to the sync endpoint
         
     Returns:
         List[Dict[str, Any]]: Results of API calls
     """
-    results = []
-    success_count = 0
-    error_count = 0
-    
-    # Use aiohttp for making HTTP calls
-    async with aiohttp.ClientSession() as session:
-        # Process groups sequentially to avoid concurrent database transactions
-        for i, group in enumerate(groups):
-            # Add a small delay between requests to avoid overwhelming the API
-            if i > 0:
-                await asyncio.sleep(0.1)
-                
-            # Process the group
-            try:
-                result, success = await process_group(session, group, i)
-                results.append(result)
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-                    
-                # Log progress every 10 groups
-                if i % 10 == 0 and i > 0:
-                    logger.info(f"Processed {i}/{len(groups)} groups so far")
-                    
-            except Exception as e:
-                logger.error(f"Unexpected error processing group {group.get('name', 'unknown')}: {str(e)}")
-                results.append({
-                    "group": group.get('name', 'unknown'),
-                    "status": "error",
-                    "message": f"Unexpected error: {str(e)}"
-                })
-                error_count += 1
+    results, success_count, error_count = await post_records(
+        get_store_session(), "groups", groups, "group", lambda group: group.get("name", "unknown"), incremental
+    )
     
     logger.info(f"Groups API results: {success_count} succeeded, {error_count} failed")
     return results
 
-async def process_room(session, room, index):
-    """Process a single room with error handling"""
-    try:
-        # Log the room data being sent
-        if index < 3:
-            logger.info(f"Sending room data: {room}")
-            
-        # Make the API request
-        async with session.post(
-            f"{FASTAPI_BASE_URL}/rooms", 
-            json=room,
-            timeout=15
-        ) as response:
-            response.raise_for_status()
-            response_data = await response.json()
-            
-            # Process successful response
-            room_id = response_data.get("id")
-            
-            # Log success
-            if index < 3:
-                logger.info(f"Successfully created room: '{room['name']}' with ID {room_id}")
-                
-            return {
-                "room": room["name"],
-                "status": "success",
-                "id": room_id
-            }, True  # Success flag
-    except Exception as e:
-        error_msg = str(e)
-        
-        # Log the error with request details
-        logger.error(f"Error creating room '{room['name']}': {error_msg}")
-        if hasattr(e, 'response') and e.response is not None:
-            logger.error(f"Response status: {e.response.status}, Content: {await e.response.text()}")
-            
-        return {
-            "room": room["name"],
-            "status": "error",
-            "message": error_msg
-        }, False  # Error flag
-
-async def store_rooms_async(rooms):
-    """Send rooms to FastAPI endpoint for storage using async"""
-    results = []
-    success_count = 0
-    error_count = 0
-    
-    logger.info(f"Starting to store {len(rooms)} rooms in database using concurrent requests")
-    
-    # Process in batches to avoid overwhelming the server
-    batch_size = 10
-    
-    async with aiohttp.ClientSession() as session:
-        for i in range(0, len(rooms), batch_size):
-            batch = rooms[i:i+batch_size]
-            batch_tasks = [process_room(session, room, i+j) for j, room in enumerate(batch)]
-            batch_results = await asyncio.gather(*batch_tasks)
-            
-            # Process results
-            for result, success in batch_results:
-                results.append(result)
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-    
-    # Log summary of results
-    logger.info(f"Room synchronization completed: {success_count} succeeded, {error_count} failed")
-    
-    return results
-
-async def store_rooms_in_db(rooms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Store rooms in the FastAPI database via API calls.
+async def store_rooms_in_db(rooms: List[Dict[str, Any]], incremental: bool = False) -> List[Dict[str, Any]]:
+    """Store rooms in the FastAPI database via the bulk endpoint.
     
     Args:
         rooms (List[Dict[str, Any]]): List of room objects to store
+        incremental (bool): Send the rooms as a snapshot to the sync endpoint
         
     Returns:
         List[Dict[str, Any]]: Results of API calls
     """
-    results = []
-    success_count = 0
-    error_count = 0
-    
-    # Use aiohttp for making HTTP calls
-    async with aiohttp.ClientSession() as session:
-        # Process rooms sequentially to avoid concurrent database transactions
-        for i, room in enumerate(rooms):
-            # Add a small delay between requests to avoid overwhelming the API
-            if i > 0:
-                await asyncio.sleep(0.1)
-                
-            # Process the room
-            try:
-                result, success = await process_room(session, room, i)
-                results.append(result)
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-                    
-                # Log progress every 10 rooms
-                if i % 10 == 0 and i > 0:
-                    logger.info(f"Processed {i}/{len(rooms)} rooms so far")
-                    
-            except Exception as e:
-                logger.error(f"Unexpected error processing room {room.get('name', 'unknown')}: {str(e)}")
-                results.append({
-                    "room": room.get('name', 'unknown'),
-                    "status": "error",
-                    "message": f"Unexpected error: {str(e)}"
-                })
-                error_count += 1
+    results, success_count, error_count = await post_records(
+        get_store_session(), "rooms", rooms, "room", lambda room: room.get("name", "unknown"), incremental
+    )
     
     logger.info(f"Rooms API results: {success_count} succeeded, {error_count} failed")
     return results
 
-async def process_user(session, user, index):
-    """Process a single user with error handling"""
-    try:
-        # Log the user data being sent
-        if index < 3:
-            logger.info(f"Sending user data: {user}")
-            
-        # Make the API request
-        async with session.post(
-            f"{FASTAPI_BASE_URL}/users", 
-            json=user,
-            timeout=15
-        ) as response:
-            response.raise_for_status()
-            response_data = await response.json()
-            
-            # Process successful response
-            user_id = response_data.get("id")
-            
-            # Log success
-            if index < 3:
-                logger.info(f"Successfully created user: '{user['firstName']} {user['lastName']}' with ID {user_id}")
-                
-            return {
-                "user": f"{user['firstName']} {user['lastName']}",
-                "status": "success",
-                "id": user_id
-            }, True  # Success flag
-    except Exception as e:
-        error_msg = str(e)
-        
-        # Log the error with request details
-        logger.error(f"Error creating user '{user['firstName']} {user['lastName']}': {error_msg}")
-        if hasattr(e, 'response') and e.response is not None:
-            logger.error(f"Response status: {e.response.status}, Content: {await e.response.text()}")
-            
-        return {
-            "user": f"{user['firstName']} {user['lastName']}",
-            "status": "error",
-            "message": error_msg
-        }, False  # Error flag
-
-async def store_faculty_staff_async(staff):
-    """Send faculty staff to FastAPI endpoint for storage using async"""
-    results = []
-    success_count = 0
-    error_count = 0
-    
-    logger.info(f"Starting to store {len(staff)} faculty staff in database using concurrent requests")
-    
-    # Process in batches to avoid overwhelming the server
-    batch_size = 10
-    
-    async with aiohttp.ClientSession() as session:
-        for i in range(0, len(staff), batch_size):
-            batch = staff[i:i+batch_size]
-            batch_tasks = [process_user(session, user, i+j) for j, user in enumerate(batch)]
-            batch_results = await asyncio.gather(*batch_tasks)
-            
-            # Process results
-            for result, success in batch_results:
-                results.append(result)
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-    
-    # Log summary of results
-    logger.info(f"Faculty staff synchronization completed: {success_count} succeeded, {error_count} failed")
-    
-    return results
-
-async def store_faculty_staff_in_db(staff: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Store faculty staff in the FastAPI database via API calls.
+async def store_faculty_staff_in_db(staff: List[Dict[str, Any]], incremental: bool = False) -> List[Dict[str, Any]]:
+    """Store faculty staff in the FastAPI database via the bulk endpoint.
     
     Args:
         staff (List[Dict[str, Any]]): List of user objects to store
+        incremental (bool): Send the staff as a snapshot to the sync endpoint
         
     Returns:
         List[Dict[str, Any]]: Results of API calls
     """
-    results = []
-    success_count = 0
-    error_count = 0
-    
-    # Use aiohttp for making HTTP calls
-    async with aiohttp.ClientSession() as session:
-        # Process staff sequentially to avoid concurrent database transactions
-        for i, user in enumerate(staff):
-            # Add a small delay between requests to avoid overwhelming the API
-            if i > 0:
-                await asyncio.sleep(0.1)
-                
-            # Process the user
-            try:
-                result, success = await process_user(session, user, i)
-                results.append(result)
-                if success:
-                    success_count += 1
-                else:
-                    error_count += 1
-                    
-                # Log progress every 10 users
-                if i % 10 == 0 and i > 0:
-                    logger.info(f"Processed {i}/{len(staff)} faculty staff so far")
-                    
-            except Exception as e:
-                user_name = f"{user.get('firstName', '')} {user.get('lastName', '')}"
-                logger.error(f"Unexpected error processing user {user_name}: {str(e)}")
-                results.append({
-                    "user": user_name,
-                    "status": "error",
-                    "message": f"Unexpected error: {str(e)}"
-                })
-                error_count += 1
+    results, success_count, error_count = await post_records(
+        get_store_session(), "users", staff, "user",
+        lambda user: f"{user.get('firstName', '')} {user.get('lastName', '')}", incremental
+    )
     
     logger.info(f"Faculty staff API results: {success_count} succeeded, {error_count} failed")
     return results
 
 # User search and subject storage functions
 async def get_all_users_with_role(session, role="CD"):
-    """Get all users with a specific role from the database
+    """Load every active user with a role into a TeacherNameIndex
     
-    This is more efficient than making individual queries for each teacher
+    One request replaces the per-name searches, so subjects can be resolved to
+    teachers and assistants without further HTTP calls.
     
     Args:
         session (aiohttp.ClientSession): The HTTP client session
         role (str, optional): The role to filter by. Defaults to "CD" (teacher)
         
     Returns:
-        dict: Dictionary mapping normalized names to user IDs
+        TeacherNameIndex or None: The index, or None if the users could not be loaded
     """
     try:
-        users_cache = {}
-        
-        # Make API request to get all users
         async with session.get(
             f"{FASTAPI_BASE_URL}/users", 
-            timeout=15
+            timeout=aiohttp.ClientTimeout(total=STORE_BATCH_TIMEOUT)
         ) as response:
-            if response.status == 200:
-                users = await response.json()
-                
-                # Filter users by role and build the cache
-                for user in users:
-                    if user.get("role") == role:
-                        # Create different variations of the name for matching
-                        full_name = f"{user.get('firstName', '')} {user.get('lastName', '')}".lower()
-                        last_first = f"{user.get('lastName', '')} {user.get('firstName', '')}".lower()
-                        last_name = user.get('lastName', '').lower()
-                        
-                        # Store all variations in the cache
-                        users_cache[full_name] = user.get("id")
-                        users_cache[last_first] = user.get("id")
-                        users_cache[last_name] = user.get("id")
-                
-                logger.info(f"Loaded {len(users)} users, {len([u for u in users if u.get('role') == role])} with role {role}")
-                return users_cache
-            else:
-                logger.error(f"Error getting users: {response.status}")
-                return {}
+            response.raise_for_status()
+            users = await response.json()
+        
+        # Deactivated staff are no longer in the USV data and should not be assigned
+        staff = [user for user in users if user.get("role") == role and user.get("isActive") is not False]
+        index = TeacherNameIndex(staff)
+        logger.info(f"Loaded {len(users)} users, indexed {len(index)} with role {role}")
+        return index
     except Exception as e:
         logger.error(f"Error getting users with role {role}: {str(e)}")
-        return {}
+        return None
 
 async def find_user_by_name_and_role(session, last_name, first_name, role):
     """Find a user by name and role in the database using a direct search
@@ -474,18 +229,37 @@ async def find_user_by_name_and_role(session, last_name, first_name, role):
         logger.error(f"Error searching for user {last_name}, {first_name}, {role}: {str(e)}")
         return None
 
-async def process_subject(session, subject, index, processed_teachers=None, processed_assistants=None):
-    """Process a single subject with error handling
+async def find_teacher_id(session, last_name, first_name, teacher_index=None):
+    """Resolve a teacher or assistant name to a user ID
+    
+    Uses the local name index when one is loaded, so no request is made; otherwise
+    falls back to searching FastAPI.
+    
+    Args:
+        session (aiohttp.ClientSession): The HTTP client session
+        last_name (str): Last name to search for
+        first_name (str): First name to search for
+        teacher_index (TeacherNameIndex, optional): Index of the CD users
+        
+    Returns:
+        int or None: User ID if found, None otherwise
+    """
+    if teacher_index is not None:
+        return teacher_index.resolve(last_name, first_name)
+    return await find_user_by_name_and_role(session, last_name, first_name, "CD")
+
+async def prepare_subject(session, subject, processed_teachers=None, processed_assistants=None, teacher_index=None):
+    """Resolve the teacher and assistants of a subject into the payload FastAPI expects
     
     Args:
         session (aiohttp.ClientSession): The HTTP client session
         subject (dict): The subject data to process
-        index (int): The index of this subject in the list (for logging purposes)
         processed_teachers (dict): Dictionary of already processed teachers (lastName_firstName -> id)
         processed_assistants (dict): Dictionary of already processed assistants (lastName_firstName -> id)
+        teacher_index (TeacherNameIndex, optional): Index of the CD users used instead of per-name searches
         
     Returns:
-        tuple: (result_dict, success_flag)
+        tuple: (subject_to_save, None) when the subject can be stored, (None, error_result) otherwise
     """
     try:
         # Make a copy of the subject to avoid modifying the original
@@ -510,13 +284,8 @@ async def process_subject(session, subject, index, processed_teachers=None, proc
                 teacher_id = processed_teachers[teacher_key]
                 logger.info(f"Using cached teacherId {teacher_id} for subject {subject['name']}")
             else:
-                # Find teacher in the database with direct search
-                teacher_id = await find_user_by_name_and_role(
-                    session, 
-                    teacher_info["lastName"], 
-                    teacher_info["firstName"], 
-                    "CD"
-                )
+                # Find teacher in the local name index
+                teacher_id = await find_teacher_id(session, last_name, first_name, teacher_index)
                 
                 # Save to processed dictionary for future use
                 if teacher_id:
@@ -530,19 +299,19 @@ async def process_subject(session, subject, index, processed_teachers=None, proc
                 # If no teacher found, this is an error - teacher must exist
                 error_msg = f"ERROR: Teacher {teacher_info['lastName']} {teacher_info['firstName']} not found in database."
                 logger.error(error_msg + " This indicates a potential data issue.")
-                return {
+                return None, {
                     "subject": subject.get("name", "Unknown"),
                     "status": "error",
                     "message": error_msg
-                }, False
+                }
         else:
             # If no teacher info provided, skip this subject
             logger.warning(f"No teacher info for subject {subject['name']}, cannot create without a valid teacherId")
-            return {
+            return None, {
                 "subject": subject.get("name", "Unknown"),
                 "status": "error",
                 "message": "No teacher information available"
-            }, False
+            }
         
         # Process assistants if needed
         if "assistantInfo" in subject:
@@ -561,13 +330,8 @@ async def process_subject(session, subject, index, processed_teachers=None, proc
                     assistant_id = processed_assistants[assistant_key]
                     logger.info(f"Using cached assistantId {assistant_id} for subject {subject['name']}")
                 else:
-                    # Find assistant with direct search
-                    assistant_id = await find_user_by_name_and_role(
-                        session, 
-                        assistant_info["lastName"], 
-                        assistant_info["firstName"], 
-                        "CD"
-                    )
+                    # Find assistant in the local name index
+                    assistant_id = await find_teacher_id(session, last_name, first_name, teacher_index)
                     
                     # Save to processed dictionary
                     if assistant_id:
@@ -587,134 +351,101 @@ async def process_subject(session, subject, index, processed_teachers=None, proc
         if "assistantInfo" in subject_to_save:
             del subject_to_save["assistantInfo"]
         
-        # Log the subject data being sent (only for first few)
-        if index < 3:
-            logger.info(f"Sending subject data: {subject_to_save}")
-            
-        # Make the API request
-        async with session.post(
-            f"{FASTAPI_BASE_URL}/subjects", 
-            json=subject_to_save,
-            timeout=15
-        ) as response:
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            response_data = await response.json()
-            
-            # Process successful response
-            subject_id = response_data.get("id")
-            
-            # Log success (only for first few)
-            if index < 3:
-                logger.info(f"Successfully created subject: '{subject_to_save['name']}' with ID {subject_id}")
-                
-            return {
-                "subject": subject_to_save["name"],
-                "status": "success",
-                "id": subject_id
-            }, True  # Success flag
+        return subject_to_save, None
             
     except Exception as e:
         error_msg = str(e)
         subject_name = subject.get("name", "Unknown")
-        
-        # Log the error with request details
-        logger.error(f"Error creating subject '{subject_name}': {error_msg}")
-        if hasattr(e, 'response') and e.response is not None:
-            logger.error(f"Response status: {e.response.status}, Content: {await e.response.text()[:200]}")
-            
-        return {
+        logger.error(f"Error preparing subject '{subject_name}': {error_msg}")
+        return None, {
             "subject": subject_name,
             "status": "error",
             "message": error_msg
-        }, False  # Error flag
+        }
 
-async def store_subjects_async(subjects):
-    """Send subjects to FastAPI endpoint for storage using async
+async def store_subjects_async(subjects, incremental=False, teacher_index=None):
+    """Resolve teachers for all subjects and send them to the FastAPI bulk endpoint
     
     Args:
         subjects (list): List of subject objects to store
+        incremental (bool): Send the subjects as a snapshot of their groups to the sync endpoint;
+            groups with a rejected subject are left out so their stored subjects are not deactivated
+        teacher_index (TeacherNameIndex, optional): Index of the CD users; loaded here if omitted
         
     Returns:
         tuple: (results, success_count, error_count)
     """
-    results = []
-    success_count = 0
-    error_count = 0
-    
     # Dictionaries to cache processed teachers and assistants
     processed_teachers = {}
     processed_assistants = {}
     
-    # Use aiohttp for asynchronous HTTP requests with increased timeout
-    timeout = aiohttp.ClientTimeout(total=90)  # Increase timeout to 90 seconds
-    conn = aiohttp.TCPConnector(limit=5)  # Strict limit on connections
-    
-    async with aiohttp.ClientSession(timeout=timeout, connector=conn) as session:
-        logger.info(f"Starting to process {len(subjects)} subjects")
-        
-        # Find all unique course names ("curs")
-        unique_courses = set()
-        for subject in subjects:
-            if subject.get("type", "").lower() == "curs":
-                unique_courses.add(subject.get("name", ""))
-        logger.info(f"Found {len(unique_courses)} unique courses to process")
-        
-        # Process subjects COMPLETELY SEQUENTIALLY to avoid overwhelming the database
-        # This is much safer but slower than parallel processing
-        results_list = []
-        
-        for i, subject in enumerate(subjects):
-            try:
-                # Add delay between subjects to prevent any connection pool issues
-                if i > 0:
-                    # 1 second delay between each subject
-                    await asyncio.sleep(0.1)
-                
-                result = await process_subject(session, subject, i, processed_teachers, processed_assistants)
-                results_list.append(result)
-                
-                # Log progress
-                if (i + 1) % 3 == 0 or i == len(subjects) - 1:
-                    logger.info(f"Processed {i+1}/{len(subjects)} subjects")
-            except Exception as e:
-                logger.error(f"Unexpected error processing subject {subject.get('name', 'unknown')}: {str(e)}")
-                results_list.append(Exception(f"Error processing {subject.get('name', 'unknown')}: {str(e)}"))
-
-        # Process results
-        for result in results_list:
-            if isinstance(result, Exception):
-                # Handle unexpected exceptions
-                error_count += 1
-                logger.error(f"Unexpected error processing subject: {str(result)}")
-                results.append({
-                    "subject": "Unknown",
-                    "status": "error",
-                    "message": f"Unexpected error: {str(result)}"
-                })
-            else:
-                # result is a tuple (result_dict, success_flag)
-                results.append(result[0])
-                if result[1]:  # success flag
-                    success_count += 1
-                else:
-                    error_count += 1
-        
-        # Log summary information
-        logger.info(f"Processed {len(processed_teachers)} unique teachers")
-        logger.info(f"Processed {len(processed_assistants)} unique assistants")
-        teacher_sample = list(processed_teachers.items())[:3]
-        logger.info(f"Sample of processed teachers: {teacher_sample}")
-                
-        # Final stats
-        logger.info(f"Subject API results: {success_count} succeeded, {error_count} failed")
+    session = get_store_session()
+    logger.info(f"Starting to process {len(subjects)} subjects")
+    if teacher_index is None:
+        teacher_index = await get_all_users_with_role(session, "CD")
+    
+    # Resolve every subject first; the ones that can be stored are sent in batches
+    prepared = []
+    rejected = []
+    rejected_flags = []
+    for subject in subjects:
+        subject_to_save, error_result = await prepare_subject(
+            session, subject, processed_teachers, processed_assistants, teacher_index
+        )
+        rejected_flags.append(subject_to_save is None)
+        if subject_to_save is None:
+            rejected.append(error_result)
+        else:
+            if len(prepared) < 3:
+                logger.info(f"Sending subject data: {subject_to_save}")
+            prepared.append(subject_to_save)
+    
+    skipped = []
+    if incremental and rejected:
+        # A sync deactivates the stored subjects of a group that are missing from the
+        # snapshot, so a group with rejected subjects is not synced at all this time
+        rejected_groups = {subject.get("groupId") for subject, error in zip(subjects, rejected_flags) if error}
+        # Without a groupId there is no telling which snapshot is incomplete, so skip them all
+        unknown_group = None in rejected_groups
+        skipped = [subject for subject in prepared if unknown_group or subject.get("groupId") in rejected_groups]
+        prepared = [subject for subject in prepared if not (unknown_group or subject.get("groupId") in rejected_groups)]
+        logger.warning(f"Not syncing {len(skipped)} subjects of groups {sorted(map(str, rejected_groups))} "
+                       f"because {len(rejected)} of their subjects were rejected")
+    
+    results, success_count, error_count = [], 0, 0
+    if prepared or not incremental:
+        results, success_count, error_count = await post_records(
+            session, "subjects", prepared, "subject", lambda subject: subject.get("name", "Unknown"), incremental
+        )
+    results.extend(rejected)
+    results.extend(
+        {
+            "subject": subject.get("name", "Unknown"),
+            "status": "error",
+            "message": "Not synced because other subjects of its group were rejected"
+        }
+        for subject in skipped
+    )
+    error_count += len(rejected) + len(skipped)
+    
+    # Log summary information
+    logger.info(f"Processed {len(processed_teachers)} unique teachers")
+    logger.info(f"Processed {len(processed_assistants)} unique assistants")
+    teacher_sample = list(processed_teachers.items())[:3]
+    logger.info(f"Sample of processed teachers: {teacher_sample}")
+            
+    # Final stats
+    logger.info(f"Subject API results: {success_count} succeeded, {error_count} failed")
     
     return results, success_count, error_count
 
-async def store_subjects_in_db(subjects: List[Dict[str, Any]]):
+async def store_subjects_in_db(subjects: List[Dict[str, Any]], incremental: bool = False, teacher_index=None):
     """Store subjects in the FastAPI database via API calls.
     
     Args:
         subjects (List[Dict[str, Any]]): List of subject objects to store
+        incremental (bool): Send the subjects as a snapshot of their groups to the sync endpoint
+        teacher_index (TeacherNameIndex, optional): Index of the CD users, shared across calls
         
     Returns:
         List[Dict[str, Any]]: Results of API calls
@@ -723,7 +454,7 @@ async def store_subjects_in_db(subjects: List[Dict[str, Any]]):
         logger.info(f"Starting to store {len(subjects)} subjects in the database")
         
         # Use the async function to store subjects
-        results, success_count, error_count = await store_subjects_async(subjects)
+        results, success_count, error_count = await store_subjects_async(subjects, incremental, teacher_index)
         
         # Log results summary
         logger.info(f"Subject storage complete: {success_count} succeeded, {error_count} failed")
@@ -0,0 +1,130 @@
+"""In-memory index used to resolve teacher names from the USV timetable to user IDs."""
+import difflib
+import re
+import unicodedata
+from config.settings import logger, skipped_faculty_logger, TEACHER_MATCH_CUTOFF
+
+# Academic titles that sometimes prefix names in the USV data
+NAME_TITLES = {"prof", "conf", "lect", "asist", "sl", "univ", "dr", "drd", "ing", "ec", "mat", "fiz"}
+
+def normalize_name(value):
+    """Fold a name to lowercase ASCII words without diacritics, punctuation or titles
+
+    "Ştefănescu-Popa, dr. Ana" and "stefanescu popa ana" normalize to the same words.
+
+    Args:
+        value (str): The name to normalize
+
+    Returns:
+        list: The words of the name
+    """
+    folded = unicodedata.normalize("NFKD", value or "")
+    folded = "".join(char for char in folded if not unicodedata.combining(char)).lower()
+    words = re.sub(r"[^a-z0-9]+", " ", folded).split()
+    return [word for word in words if word not in NAME_TITLES]
+
+def _name_key(words):
+    """Key that ignores word order, so first/last name permutations match"""
+    return " ".join(sorted(words))
+
+def _first_names_compatible(wanted, known):
+    """Whether two first names can belong to the same person
+
+    Every word of the wanted first name must start one of the known words, so "I.",
+    "Ion" and "" are compatible with "Ion Vasile" but "Maria" is not. A user without
+    a first name conflicts with nothing.
+    """
+    if not wanted or not known:
+        return True
+    return all(any(word.startswith(part) for word in known) for part in wanted)
+
+class TeacherNameIndex:
+    """Resolves a (last name, first name) pair to a user ID without any HTTP call
+
+    Names are matched, in order:
+    1. exactly, ignoring diacritics, case, punctuation and the order of the words
+    2. when all the words of the name belong to exactly one user (missing middle names)
+    3. fuzzily with difflib on the whole name, for spelling variants, above TEACHER_MATCH_CUTOFF
+    4. on the last name alone, when exactly one user with it has a compatible first name
+       (the same, an initial of it, or none at all)
+    """
+
+    def __init__(self, users):
+        """Build the index
+
+        Args:
+            users (list): User dicts with id, firstName and lastName
+        """
+        self._by_key = {}
+        self._words = []
+        self._by_last_name = {}
+        self._first_names = {}
+        self._resolved = {}
+        for user in users:
+            user_id = user.get("id")
+            first_words = normalize_name(user.get("firstName"))
+            last_words = normalize_name(user.get("lastName"))
+            words = first_words + last_words
+            if user_id is None or not words:
+                continue
+            key = _name_key(words)
+            if key in self._by_key and self._by_key[key] != user_id:
+                logger.warning(f"Teacher name '{key}' is shared by users {self._by_key[key]} and {user_id}, using the first")
+            self._by_key.setdefault(key, user_id)
+            self._words.append((set(words), user_id))
+            self._by_last_name.setdefault(_name_key(last_words), set()).add(user_id)
+            self._first_names[user_id] = first_words
+        self._keys = list(self._by_key)
+
+    def __len__(self):
+        return len(self._words)
+
+    def _match(self, last_name, first_name):
+        first_words = normalize_name(first_name)
+        words = first_words + normalize_name(last_name)
+        if not words:
+            return None
+        key = _name_key(words)
+
+        user_id = self._by_key.get(key)
+        if user_id is not None:
+            return user_id
+
+        wanted = set(words)
+        candidates = {user_id for user_words, user_id in self._words if wanted <= user_words}
+        if len(candidates) == 1:
+            return candidates.pop()
+
+        close = difflib.get_close_matches(key, self._keys, n=1, cutoff=TEACHER_MATCH_CUTOFF)
+        if close:
+            user_id = self._by_key[close[0]]
+            skipped_faculty_logger.warning(f"Matched {last_name} {first_name} to '{close[0]}' by similarity (ID: {user_id})")
+            return user_id
+
+        same_last_name = {
+            user_id for user_id in self._by_last_name.get(_name_key(normalize_name(last_name)), set())
+            if _first_names_compatible(first_words, self._first_names[user_id])
+        }
+        if len(same_last_name) == 1:
+            user_id = same_last_name.pop()
+            skipped_faculty_logger.warning(f"Matched {last_name} {first_name} by last name only (ID: {user_id})")
+            return user_id
+        return None
+
+    def resolve(self, last_name, first_name):
+        """Find the user ID of a teacher
+
+        Args:
+            last_name (str): Last name as written in the USV data
+            first_name (str): First name as written in the USV data
+
+        Returns:
+            int or None: The user ID, or None if no user matches
+        """
+        cache_key = (last_name or "", first_name or "")
+        if cache_key not in self._resolved:
+            user_id = self._match(last_name, first_name)
+            if user_id is None:
+                skipped_faculty_logger.warning(f"No user found for {last_name} {first_name}")
+            self._resolved[cache_key] = user_id
+        return self._resolved[cache_key]
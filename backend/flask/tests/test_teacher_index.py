@@ -0,0 +1,46 @@
+"""Teacher names from the USV timetable resolve to the right user, or to none at all."""
+from services.teacher_index import TeacherNameIndex
+
+
+def _index(*names):
+    return TeacherNameIndex([
+        {"id": user_id, "firstName": first_name, "lastName": last_name}
+        for user_id, (first_name, last_name) in enumerate(names, start=1)
+    ])
+
+
+def test_exact_match_ignores_diacritics_titles_and_word_order():
+    index = _index(("Ana", "Ştefănescu-Popa"), ("Ion", "Popescu"))
+
+    assert index.resolve("Stefanescu Popa", "dr. Ana") == 1
+    assert index.resolve("Ion", "Popescu") == 2
+
+
+def test_missing_middle_name_matches_the_only_user_with_all_the_words():
+    index = _index(("Ion Vasile", "Popescu"), ("Maria", "Popescu"))
+
+    assert index.resolve("Popescu", "Ion") == 1
+
+
+def test_fuzzy_match_on_the_whole_name_wins_over_the_last_name():
+    index = _index(("Ana", "Popa"), ("Dan", "Pop"))
+
+    assert index.resolve("Popa", "Dan") == 2
+
+
+def test_last_name_alone_needs_a_compatible_first_name():
+    index = _index(("Ion", "Popescu"), ("Ana", "Ionescu"), ("Maria", "Ionescu"))
+
+    assert index.resolve("Popescu", "Maria") is None
+    assert index.resolve("Popescu", "I.") == 1
+    assert index.resolve("Popescu", "") == 1
+    assert index.resolve("Ionescu", "M") == 3
+    # Two users share the last name and nothing tells them apart
+    assert index.resolve("Ionescu", "") is None
+
+
+def test_unknown_teacher_resolves_to_none():
+    index = _index(("Ion", "Popescu"))
+
+    assert index.resolve("Vasilescu", "George") is None
+    assert index.resolve("", "") is None
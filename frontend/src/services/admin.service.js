@@ -30,10 +30,12 @@ class AdminService {
    * Synchronize data from USV API
    * This calls the /api/sync/data endpoint in the FastAPI backend
    * which then triggers the Flask sync service and creates test users
+   * @param {string} [mode='full'] - 'full' to delete and reload everything, 'incremental'
+   *   to apply only the differences and keep existing schedules
    * @returns {Promise} API Response
    */
-  syncData() {
-    return apiClient.post('/sync/data')
+  syncData(mode = 'full') {
+    return apiClient.post('/sync/data', null, { params: { mode } })
   }
   
   /**
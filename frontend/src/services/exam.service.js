@@ -88,7 +88,17 @@ class ExamService {
   updateExam(examId, examData) {
     return apiClient.put(`/exams/${examId}`, examData)
   }
-  
+
+  /**
+   * Automatically schedule every pending exam of the current exam period (secretariat)
+   * @param {Object} [options] - Slot layout and constraints (dayStartTime, dayEndTime,
+   *   examDurationHours, groupSize, maxRoomsPerExam, maxExamsPerGroupPerDay, excludeWeekends, dryRun)
+   * @returns {Promise} API Response with the assignments and the exams that could not be placed
+   */
+  autoSchedule(options = {}) {
+    return apiClient.post('/exams/auto-schedule', options)
+  }
+
   /**
    * Generate Excel file with exam information grouped by program, year, and group
    * with teacher email and contact details
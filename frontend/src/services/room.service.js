@@ -28,6 +28,22 @@ class RoomService {
     return apiClient.get(`/rooms/building/${buildingName}`)
   }
 
+  /**
+   * Find rooms with no approved exam in a time window
+   * @param {Object} params - Search parameters
+   * @param {string} params.date - Exam date (YYYY-MM-DD)
+   * @param {string} params.startTime - Start time (HH:MM)
+   * @param {string} params.endTime - End time (HH:MM)
+   * @param {number} [params.minCapacity] - Minimum room capacity
+   * @param {number} [params.minComputers] - Minimum number of computers
+   * @param {string} [params.buildingName] - Restrict the search to one building
+   * @returns {Promise<Array>} Promise that resolves to the free rooms, smallest first
+   */
+  async getFreeRooms(params) {
+    const response = await apiClient.get('/rooms/free', { params })
+    return response.data
+  }
+
   /**
    * Generate Excel file with room information
    * @returns {Promise} API Response with Excel file as blob
@@ -91,7 +91,18 @@ class ScheduleService {
     
     return this.updateSchedule(scheduleId, updateData)
   }
-  
+
+  /**
+   * Change the status of many schedules in one request
+   * @param {Array<number>} scheduleIds - IDs of the schedules to update
+   * @param {string} status - Target status ('approved', 'rejected', ...)
+   * @param {Object} [options] - Optional reason, sendEmail and allowConflicts flags
+   * @returns {Promise} API Response with updated IDs, skipped schedules and room conflicts
+   */
+  bulkUpdateStatus(scheduleIds, status, options = {}) {
+    return apiClient.post('/schedules/bulk-status', { scheduleIds, status, ...options })
+  }
+
   /**
    * Check for conflicts with existing schedules
    * @param {Object} conflictData - Data to check conflicts